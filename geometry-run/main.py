@@ -1,180 +1,370 @@
+# Importado primeiro: marca o início da medição da abertura
+from scripts.inicializacao import (inicializacao, inicializar_pygame,
+                                   aquecer_em_segundo_plano)
 import pygame
 import sys
-from scripts.cenas import Menu, SelecaoFase, Partida, GameOver
+import time
+import argparse
+import os
+from collections import deque
+from scripts.fases import CORES_FASES, NUMEROS_FASES, NIVEIS_COR
+from scripts.cenas import Menu, SelecaoFase, Partida, GameOver, GerenciadorCenas
+from scripts.renderizacao import RenderizadorRetangulos
+from scripts.obstaculo import atlas_obstaculos
+from scripts.perfilador import perfilador, PainelPerfilador
+from scripts.pontuacoes import RegistroPontuacoes, PASTA_DADOS
+from scripts.replay import GravadorEntrada
+from scripts.entrada import ColetorEntrada
+from scripts.latencia import MedidorLatencia, coletar_eventos
+from scripts.ritmo import RitmoQuadros, ESTRATEGIAS, LIMIAR_PADRAO
+
+inicializacao.marcar('importações')
 
 class GeometryRun:
-    def __init__(self):
-        pygame.init()
+    def __init__(self, retangulos_sujos=False, motor_obstaculos='lista',
+                 taxa_simulacao=60, fps=60, pasta_replays=None, perfilar=False,
+                 pre_aquecer=False, pasta_dados=PASTA_DADOS, tempo_abertura=False,
+                 latencia=False, entrada_tardia=False, ritmo='tick',
+                 limiar_ritmo=LIMIAR_PADRAO):
+        # Só vídeo e fontes: o jogo não usa áudio
+        inicializar_pygame()
+        inicializacao.marcar('pygame')
         
         # Configurações da tela
         self.LARGURA = 800
         self.ALTURA = 600
         self.tela = pygame.display.set_mode((self.LARGURA, self.ALTURA))
         pygame.display.set_caption("Geometry Run - Escolha sua Fase")
+        inicializacao.marcar('janela')
+        
+        # Eventos de mouse e teclado acumulados até o próximo passo de simulação
+        self.coletor = ColetorEntrada()
+        
+        # Paletas das fases (da tabela de fases)
+        self.CORES_FASES = CORES_FASES
+        
+        # Cenas do jogo: construídas uma vez e reaproveitadas nas transições
+        self.cenas = GerenciadorCenas({
+            'menu': lambda chave: Menu(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES[0]),
+            'selecao_fase': lambda chave: SelecaoFase(self.tela, self.LARGURA, self.ALTURA,
+                                                      self.CORES_FASES),
+            'partida': self.criar_partida,
+            'game_over': self.criar_game_over
+        })
+        
+        # Espera entre quadros (tick, ocupado ou híbrido; fps 0 = sem limite)
+        self.ritmo = RitmoQuadros(fps, ritmo, limiar_ritmo)
+        
+        # Simulação em passo fixo, independente da taxa de desenho
+        self.TAXA_SIMULACAO = taxa_simulacao
+        self.passo_simulacao = 1.0 / taxa_simulacao
+        self.ATRASO_MAXIMO = 0.25  # segundos simulados, no máximo, por quadro
+        
+        # Loop com amostragem tardia: espera primeiro e lê a entrada pouco antes
+        # de simular, desenhar e apresentar (em vez de esperar depois do flip)
+        self.entrada_tardia = entrada_tardia
+        self.MARGEM_TARDIA = 0.002  # s acordados antes do necessário (imprecisão do sleep)
+        self.custos_quadro = deque(maxlen=30)  # Duração (s) dos últimos quadros
         
-        # Cores para diferentes fases (cada fase tem sua própria paleta)
-        self.CORES_FASES = [
-            {  # FASE 1 - Velocidade Normal (1.0x)
-                'fundo': (15, 20, 35),      # Azul escuro
-                'jogador': (0, 200, 255),
-                'obstaculo': (255, 100, 100),
-                'texto': (240, 240, 240),
-                'ui_bg': (30, 40, 60),
-                'botao': (40, 120, 180),
-                'botao_hover': (60, 160, 220)
-            },
-            {  # FASE 2 - Velocidade Rápida (1.5x)
-                'fundo': (35, 15, 20),      # Vermelho escuro
-                'jogador': (100, 255, 200),
-                'obstaculo': (255, 200, 100),
-                'texto': (240, 240, 240),
-                'ui_bg': (50, 30, 40),
-                'botao': (180, 80, 100),
-                'botao_hover': (200, 100, 120)
-            },
-            {  # FASE 3 - Velocidade Extrema (2.0x)
-                'fundo': (15, 35, 20),      # Verde escuro
-                'jogador': (255, 150, 50),
-                'obstaculo': (150, 100, 255),
-                'texto': (240, 240, 240),
-                'ui_bg': (30, 50, 40),
-                'botao': (80, 160, 100),
-                'botao_hover': (100, 180, 120)
-            }
-        ]
-        
-        # Estados do jogo
-        self.estados = {
-            'menu': Menu(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES[0]),
-            'selecao_fase': None,
-            'partida': None,
-            'game_over': None
-        }
-        
-        self.estado_atual = 'menu'
-        self.relogio = pygame.time.Clock()
-        self.FPS = 60
-        
-        # Dados persistentes
-        self.high_score = 0
+        # Medição da latência entre o evento de entrada e a apresentação
+        self.medidor_latencia = MedidorLatencia() if latencia else None
+        self.eventos = []  # Eventos já lidos da fila e ainda não processados
+        self.iniciar_loop()
+        
+        # Apresentação da tela (opcionalmente só dos retângulos alterados)
+        self.renderizador = RenderizadorRetangulos(self.tela, ativo=retangulos_sujos)
+        
+        # Motor de obstáculos usado nas partidas ('lista' ou 'numpy')
+        self.motor_obstaculos = motor_obstaculos
+        
+        # Pasta onde cada partida é gravada como replay ao terminar (None = não grava)
+        self.pasta_replays = pasta_replays
+        
+        # Perfilador de quadros: F3 mostra o painel, F4 exporta o buffer
+        self.perfilar = perfilar  # Coletar mesmo com o painel escondido
+        self.painel_perfilador = None
+        perfilador.ativar(perfilar)
+        
+        # Dados persistentes (melhores pontuações de cada fase, gravadas em segundo plano)
+        self.pontuacoes = RegistroPontuacoes(os.path.join(pasta_dados, 'pontuacoes.log'))
         self.fase_selecionada = 1  # Fase padrão (1 = 1.0x)
         
-    def executar(self):
-        """Loop principal do jogo"""
-        rodando = True
-        
-        while rodando:
-            # Processar eventos
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    rodando = False
-                elif evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_ESCAPE:
-                        # ESC volta para o menu de qualquer estado
-                        if self.estado_atual == 'partida':
-                            self.estado_atual = 'selecao_fase'
-                            self.estados['selecao_fase'] = SelecaoFase(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES)
-                        elif self.estado_atual == 'game_over':
-                            self.estado_atual = 'selecao_fase'
-                            self.estados['selecao_fase'] = SelecaoFase(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES)
-                        elif self.estado_atual == 'selecao_fase':
-                            self.estado_atual = 'menu'
-                            self.estados['menu'] = Menu(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES[0])
+        # Construir todas as cenas já na abertura (sem travadas na primeira transição)
+        if pre_aquecer:
+            self.cenas.pre_aquecer([('menu', None), ('selecao_fase', None)] +
+                                   [(nome, fase) for nome in ('partida', 'game_over')
+                                    for fase in NUMEROS_FASES])
+        
+        # Cenas são construídas na primeira entrada (só o menu antes do primeiro quadro)
+        self.estado_atual = None
+        self.cena_atual = None
+        self.mudar_estado('menu')
+        inicializacao.marcar('menu')
+        
+        # Fontes e quadros do jogador são preparados depois do primeiro quadro
+        self.tempo_abertura = tempo_abertura  # Mostrar os tempos da abertura ao sair
+        self.aquecimento = None
+        
+    def criar_partida(self, fase):
+        """Cria a partida de uma fase (usada pelo gerenciador de cenas)"""
+        return Partida(self.tela, self.LARGURA, self.ALTURA, 
+                       self.CORES_FASES, fase,
+                       self.motor_obstaculos, self.TAXA_SIMULACAO)
+    
+    def criar_game_over(self, fase):
+        """Cria a tela de game over de uma fase (usada pelo gerenciador de cenas)"""
+        return GameOver(self.tela, self.LARGURA, self.ALTURA,
+                        self.CORES_FASES[fase - 1], {'fase': fase},
+                        self.TAXA_SIMULACAO)
+    
+    def mudar_estado(self, estado, dados=None):
+        """Entra na cena do estado (reaproveitada pelo gerenciador de cenas)"""
+        if estado == 'partida':
+            # Gravar a entrada da partida se configurado
+            gravador = GravadorEntrada() if self.pasta_replays else None
+            cena = self.cenas.entrar('partida', {'gravador': gravador}, self.fase_selecionada)
+        elif estado == 'game_over':
+            cena = self.cenas.entrar('game_over', dados, self.fase_selecionada)
+        else:
+            cena = self.cenas.entrar(estado, dados)
+        
+        self.estado_atual = estado
+        self.cena_atual = cena
+        # A cena pode ser a mesma instância de antes: desenhar o próximo quadro inteiro
+        self.renderizador.invalidar()
+    
+    def salvar_replay(self, partida):
+        """Grava o replay da partida encerrada na pasta de replays"""
+        if partida is None or partida.gravador is None:
+            return
+        os.makedirs(self.pasta_replays, exist_ok=True)
+        caminho = os.path.join(self.pasta_replays,
+                               f"fase{partida.fase}_{partida.semente}.grr")
+        partida.gravador.replay(partida).salvar(caminho)
+        print(f"Replay salvo em {caminho}")
+    
+    def atualizar_simulacao(self):
+        """Avança o estado atual em um passo fixo de simulação"""
+        resultado = self.cena_atual.atualizar(self.coletor.capturar())
+        if self.medidor_latencia is not None:
+            self.medidor_latencia.consumir()
+        
+        # Processar resultado da atualização
+        if resultado is not None:
+            novo_estado, dados = resultado
+            
+            # Verificar se há dados de fase selecionada
+            if dados is not None and 'fase' in dados:
+                self.fase_selecionada = dados['fase']
+            
+            # Registrar a pontuação no recorde da fase se for game over
+            if novo_estado == 'game_over':
+                dados['high_score'] = self.pontuacoes.registrar(dados.get('fase', 1),
+                                                                dados.get('pontuacao', 0))
             
-            # Limpar tela
-            if self.estado_atual == 'partida' and self.estados['partida'] is not None:
-                # Usar cores da fase selecionada
-                fase_index = self.fase_selecionada - 1
-                self.tela.fill(self.CORES_FASES[fase_index]['fundo'])
-            elif self.estado_atual == 'selecao_fase' and self.estados['selecao_fase'] is not None:
-                # Fundo neutro para tela de seleção
-                self.tela.fill((20, 25, 40))
-            elif self.estado_atual == 'game_over' and self.estados['game_over'] is not None:
-                # Fundo da fase que estava jogando
-                fase_index = self.fase_selecionada - 1
-                self.tela.fill(self.CORES_FASES[fase_index]['fundo'])
-            else:
-                self.tela.fill(self.CORES_FASES[0]['fundo'])
+            if novo_estado == 'game_over':
+                self.salvar_replay(self.cena_atual)
             
-            try:
-                # Inicializar estado se necessário
-                if self.estado_atual == 'selecao_fase' and self.estados['selecao_fase'] is None:
-                    self.estados['selecao_fase'] = SelecaoFase(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES)
-                
-                if self.estado_atual == 'partida' and self.estados['partida'] is None:
-                    self.estados['partida'] = Partida(self.tela, self.LARGURA, self.ALTURA, 
-                                                     self.CORES_FASES, self.fase_selecionada)
-                
-                # Atualizar estado atual
-                if self.estado_atual in self.estados and self.estados[self.estado_atual] is not None:
-                    resultado = self.estados[self.estado_atual].atualizar()
-                    
-                    # Processar resultado da atualização
-                    if resultado is not None:
-                        novo_estado, dados = resultado
-                        
-                        # Verificar se há dados de fase selecionada
-                        if dados is not None and 'fase' in dados:
-                            self.fase_selecionada = dados['fase']
-                        
-                        # Atualizar high score se for game over
-                        if novo_estado == 'game_over':
-                            pontuacao = dados.get('pontuacao', 0)
-                            fase = dados.get('fase', 1)
-                            # Separar high score por fase
-                            if fase == 1:
-                                if pontuacao > self.high_score:
-                                    self.high_score = pontuacao
-                            elif fase == 2:
-                                # Para fase 2, high score é diferente
-                                if pontuacao > self.high_score:
-                                    self.high_score = pontuacao
-                            elif fase == 3:
-                                # Para fase 3, high score é diferente
-                                if pontuacao > self.high_score:
-                                    self.high_score = pontuacao
-                            dados['high_score'] = self.high_score
-                        
-                        # Mudar para novo estado
-                        self.estado_atual = novo_estado
-                        
-                        # Recriar a cena necessária
-                        if novo_estado == 'selecao_fase':
-                            self.estados['selecao_fase'] = SelecaoFase(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES)
-                            self.estados['partida'] = None
-                            self.estados['game_over'] = None
-                        elif novo_estado == 'partida':
-                            self.estados['partida'] = Partida(self.tela, self.LARGURA, self.ALTURA, 
-                                                             self.CORES_FASES, self.fase_selecionada)
-                            self.estados['game_over'] = None
-                        elif novo_estado == 'game_over':
-                            self.estados['game_over'] = GameOver(self.tela, self.LARGURA, self.ALTURA, 
-                                                                self.CORES_FASES[self.fase_selecionada-1], dados)
-                            self.estados['partida'] = None
-                        elif novo_estado == 'menu':
-                            self.estados['menu'] = Menu(self.tela, self.LARGURA, self.ALTURA, self.CORES_FASES[0])
-                            self.estados['partida'] = None
-                            self.estados['game_over'] = None
-                            self.estados['selecao_fase'] = None
-                    
-                    # Desenhar estado atual
-                    self.estados[self.estado_atual].desenhar()
-                
-            except Exception as e:
-                print(f"Erro no jogo: {e}")
-                import traceback
-                traceback.print_exc()
-                rodando = False
+            # Mudar para novo estado
+            self.mudar_estado(novo_estado, dados)
+    
+    def alternar_painel_perfilador(self):
+        """Mostra ou esconde o painel do perfilador (F3)"""
+        if self.painel_perfilador is None:
+            self.painel_perfilador = PainelPerfilador(perfilador, self.LARGURA, self.ALTURA)
+            perfilador.ativar(True)
+            self.renderizador.definir_sobreposicao(self.painel_perfilador.desenhar)
+        else:
+            self.painel_perfilador = None
+            perfilador.ativar(self.perfilar)
+            self.renderizador.definir_sobreposicao(None)
+    
+    def exportar_perfil(self):
+        """Grava o buffer do perfilador em CSV e JSON (F4)"""
+        if not perfilador.quantidade:
+            print("Perfilador sem amostras (F3 ou --perfilar para coletar)")
+            return
+        caminho_csv, caminho_json = perfilador.exportar()
+        print(f"Perfil exportado para {caminho_csv} e {caminho_json}")
+    
+    def imprimir_transicoes(self):
+        """Mostra as latências de transição entre cenas"""
+        estatisticas = self.cenas.estatisticas()
+        print(f"Cenas construídas: {estatisticas['construcoes']}")
+        for nome, dados in estatisticas['por_cena'].items():
+            print(f"  {nome}: {dados['transicoes']} transições, entrar "
+                  f"{dados['entrar_media_ms']:.2f} ms (máx {dados['entrar_maxima_ms']:.2f}), "
+                  f"primeiro quadro {dados['quadro_media_ms']:.2f} ms "
+                  f"(máx {dados['quadro_maxima_ms']:.2f})")
+    
+    def iniciar_loop(self):
+        """Zera o relógio do loop principal (chamado antes do primeiro quadro)"""
+        self.rodando = True
+        self.acumulador = 0.0
+        self.instante_anterior = time.perf_counter()
+        self.prazo_quadro = self.instante_anterior + self.ritmo.periodo
+        self.ritmo.reiniciar_estatisticas()
+    
+    def avancar_relogio(self):
+        """Acumula o tempo real decorrido (limitado após travamentos longos)"""
+        agora = time.perf_counter()
+        self.acumulador += min(agora - self.instante_anterior, self.ATRASO_MAXIMO)
+        self.instante_anterior = agora
+    
+    def consultar_eventos(self):
+        """Tira os eventos da fila sem processá-los (marcando a chegada)"""
+        coletar_eventos(self.eventos, self.medidor_latencia)
+    
+    def processar_eventos(self):
+        """Processa os eventos lidos da fila desde o último quadro"""
+        self.consultar_eventos()
+        for evento in self.eventos:
+            self.coletor.processar(evento)
+            if evento.type == pygame.QUIT:
+                self.rodando = False
+            elif evento.type == pygame.KEYDOWN:
+                if evento.key == pygame.K_ESCAPE:
+                    # ESC volta para o menu de qualquer estado
+                    if self.estado_atual in ('partida', 'game_over'):
+                        self.mudar_estado('selecao_fase')
+                    elif self.estado_atual == 'selecao_fase':
+                        self.mudar_estado('menu')
+                elif evento.key == pygame.K_F3:
+                    self.alternar_painel_perfilador()
+                elif evento.key == pygame.K_F4:
+                    self.exportar_perfil()
+        self.eventos.clear()
+        perfilador.marcar('eventos')
+    
+    def simular_e_apresentar(self):
+        """Avança a simulação em passos fixos e apresenta o quadro"""
+        try:
+            while self.acumulador >= self.passo_simulacao:
+                self.atualizar_simulacao()
+                self.acumulador -= self.passo_simulacao
+            perfilador.marcar('atualizar')
             
-            # Atualizar tela
-            pygame.display.flip()
+            # Desenhar e apresentar estado atual, interpolando entre os dois
+            # últimos passos (o fundo em cache substitui a limpeza da tela)
+            alfa = self.acumulador / self.passo_simulacao
+            self.renderizador.desenhar(self.cena_atual, alfa)
+            if self.medidor_latencia is not None:
+                self.medidor_latencia.apresentar()
+            perfilador.marcar('apresentar')
+            self.cenas.concluir_transicao()
             
-            # Controlar FPS
-            self.relogio.tick(self.FPS)
+            if self.aquecimento is None:
+                inicializacao.marcar('primeiro quadro')
+                self.aquecimento = aquecer_em_segundo_plano(self.CORES_FASES,
+                                                            inicializacao)
+            
+        except Exception as e:
+            print(f"Erro no jogo: {e}")
+            import traceback
+            traceback.print_exc()
+            self.rodando = False
+    
+    def quadro_classico(self):
+        """Um quadro do loop clássico: entrada, simulação, apresentação e espera"""
+        perfilador.iniciar_quadro()
+        self.avancar_relogio()
+        self.processar_eventos()
+        self.simular_e_apresentar()
+        
+        # Controlar FPS (medindo a latência, a fila é consultada durante a espera)
+        self.ritmo.esperar(self.consultar_eventos if self.medidor_latencia else None)
+        perfilador.marcar('espera')
+        perfilador.fechar_quadro()
+    
+    def quadro_tardio(self):
+        """Um quadro com amostragem tardia: espera, entrada, simulação e apresentação
+        
+        Acorda só o tempo de trabalho estimado (pior dos últimos quadros) antes do
+        prazo, então a entrada lida chega à tela quase sem espera.
+        """
+        perfilador.iniciar_quadro()
+        custo = max(self.custos_quadro, default=0.0) + self.MARGEM_TARDIA
+        self.ritmo.esperar_ate(self.prazo_quadro - custo,
+                               self.consultar_eventos if self.medidor_latencia else None)
+        self.ritmo.registrar()
+        perfilador.marcar('espera')
+        
+        inicio = time.perf_counter()
+        self.avancar_relogio()
+        self.processar_eventos()
+        self.simular_e_apresentar()
+        fim = time.perf_counter()
+        self.custos_quadro.append(fim - inicio)
+        perfilador.fechar_quadro()
+        
+        # Próximo prazo; depois de um quadro atrasado, recomeça a partir de agora
+        self.prazo_quadro += self.ritmo.periodo
+        if self.prazo_quadro < fim:
+            self.prazo_quadro = fim + self.ritmo.periodo
+    
+    def executar(self):
+        """Loop principal do jogo (simulação em passo fixo, desenho interpolado)"""
+        self.iniciar_loop()
+        quadro = self.quadro_tardio if self.entrada_tardia else self.quadro_classico
+        while self.rodando:
+            quadro()
         
+        if self.perfilar:
+            self.imprimir_transicoes()
+            self.ritmo.imprimir()
+        if self.tempo_abertura:
+            inicializacao.imprimir()
+        if self.medidor_latencia is not None:
+            self.medidor_latencia.imprimir('amostragem tardia' if self.entrada_tardia
+                                           else 'clássico')
+        self.cenas.fechar()
+        self.pontuacoes.fechar()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
-    jogo = GeometryRun()
+    parser = argparse.ArgumentParser(description="Geometry Run")
+    parser.add_argument('--retangulos-sujos', action='store_true',
+                        help="apresenta só as áreas alteradas da tela")
+    parser.add_argument('--motor-numpy', action='store_true',
+                        help="usa o motor de obstáculos vetorizado (NumPy)")
+    parser.add_argument('--taxa-simulacao', type=int, default=60,
+                        help="passos de simulação por segundo (padrão: 60)")
+    parser.add_argument('--fps', type=int, default=60,
+                        help="quadros desenhados por segundo (padrão: 60; 0 = sem limite)")
+    parser.add_argument('--ritmo', choices=ESTRATEGIAS, default='tick',
+                        help="espera entre quadros: tick (dorme), ocupado (gira a CPU) "
+                             "ou hibrido (dorme e gira perto do prazo)")
+    parser.add_argument('--limiar-ritmo', type=float, default=1000 * LIMIAR_PADRAO,
+                        metavar='MS', help="ms antes do prazo em que o ritmo híbrido gira")
+    parser.add_argument('--niveis-cor', type=int, default=NIVEIS_COR,
+                        help="níveis do gradiente dos obstáculos (mais níveis = gradiente "
+                             f"mais suave e atlas maior; padrão: {NIVEIS_COR})")
+    parser.add_argument('--limite-atlas', type=int, default=None,
+                        help="corpos de obstáculos guardados no atlas (padrão: 256)")
+    parser.add_argument('--gravar-replays', metavar='PASTA', default=None,
+                        help="grava cada partida como replay nesta pasta")
+    parser.add_argument('--perfilar', action='store_true',
+                        help="coleta os tempos de quadro desde o início (F4 exporta)")
+    parser.add_argument('--pre-aquecer', action='store_true',
+                        help="constrói todas as cenas na abertura")
+    parser.add_argument('--dados', default=PASTA_DADOS, metavar='PASTA',
+                        help="pasta onde ficam os recordes de cada fase")
+    parser.add_argument('--tempo-abertura', action='store_true',
+                        help="mostra ao sair o tempo de cada etapa da abertura")
+    parser.add_argument('--latencia', action='store_true',
+                        help="mede a latência entre a entrada e a tela (mostrada ao sair)")
+    parser.add_argument('--entrada-tardia', action='store_true',
+                        help="espera antes de ler a entrada, não depois de apresentar")
+    args = parser.parse_args()
+    atlas_obstaculos.configurar(args.niveis_cor, args.limite_atlas)
+    
+    jogo = GeometryRun(retangulos_sujos=args.retangulos_sujos,
+                       motor_obstaculos='numpy' if args.motor_numpy else 'lista',
+                       taxa_simulacao=args.taxa_simulacao, fps=args.fps,
+                       pasta_replays=args.gravar_replays, perfilar=args.perfilar,
+                       pre_aquecer=args.pre_aquecer, pasta_dados=args.dados,
+                       tempo_abertura=args.tempo_abertura, latencia=args.latencia,
+                       entrada_tardia=args.entrada_tardia, ritmo=args.ritmo,
+                       limiar_ritmo=args.limiar_ritmo / 1000)
     jogo.executar()
\ No newline at end of file
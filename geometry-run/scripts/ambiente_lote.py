@@ -0,0 +1,316 @@
+"""Ambiente em lote: N partidas independentes avançadas juntas com NumPy
+
+Cada partida segue as regras de Partida, Jogador e GerenciadorObstaculos, mas
+todo o estado fica em arrays (uma linha por partida) e cada passo é um punhado
+de operações vetorizadas. Os obstáculos são guardados por par, pois os dois
+obstáculos de um par nascem juntos e andam sempre lado a lado.
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.ambiente_lote --ambientes 4096 --passos 2000
+"""
+import argparse
+import time
+import numpy as np
+from scripts.fases import FASES, NUMEROS_FASES
+from scripts.obstaculo_vetorizado import arredondar_rect
+from scripts.replay import CIMA, BAIXO, ESQUERDA, DIREITA, TURBO
+
+TAXA_REFERENCIA = 60
+
+# Regras por fase, indexadas pelo número da fase (a posição 0 não é usada)
+VELOCIDADE_BASE_FASE = np.array([0.0] + [fase.velocidade_base for fase in FASES])
+PONTOS_PARA_PROGRESSO_FASE = np.array([0] + [fase.pontos_para_progresso for fase in FASES])
+
+# Constantes de Jogador
+TAMANHO_JOGADOR = 40
+VELOCIDADE_JOGADOR = 5
+X_INICIAL_JOGADOR = 100
+DURACAO_INVENCIBILIDADE = 90
+
+# Constantes de GerenciadorObstaculos (a Partida nunca muda a fase_atual do
+# gerenciador, então vãos e larguras seguem sempre as faixas da fase 1)
+INTERVALO_SPAWN_INICIAL = 90
+INTERVALO_SPAWN_MINIMO = 60
+FAIXA_ALTURA_VAO = FASES[0].faixa_vao
+FAIXA_LARGURA = FASES[0].faixa_largura
+MARGEM_VAO = 100
+
+# Tamanho de cada observação (ver observar())
+TAMANHO_OBSERVACAO = 10
+
+# Constantes do gerador baseado em contador (splitmix64)
+_PHI = np.uint64(0x9E3779B97F4A7C15)
+_MISTURA_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MISTURA_2 = np.uint64(0x94D049BB133111EB)
+
+
+def _misturar(z):
+    """Função de mistura do splitmix64 (aritmética módulo 2**64)"""
+    z = (z ^ (z >> np.uint64(30))) * _MISTURA_1
+    z = (z ^ (z >> np.uint64(27))) * _MISTURA_2
+    return z ^ (z >> np.uint64(31))
+
+
+class AmbienteLote:
+    """N partidas avançadas em conjunto por step(acoes)
+
+    As ações são máscaras de bits por partida (CIMA, BAIXO, ESQUERDA, DIREITA e
+    TURBO, as mesmas de scripts.replay). Cada partida tem sua semente: o número
+    sorteado em cada sorteio é um hash de (semente, contador), então partidas
+    diferentes não dependem umas das outras nem da ordem em que são avançadas.
+    """
+
+    def __init__(self, n, fase=1, sementes=None, largura=800, altura=600,
+                 taxa_simulacao=TAXA_REFERENCIA, max_pares=8, recompensa_morte=-1.0,
+                 reinicio_automatico=True):
+        self.n = n
+        self.largura = largura
+        self.altura = altura
+        self.taxa_simulacao = taxa_simulacao
+        self.escala_tempo = TAXA_REFERENCIA / taxa_simulacao
+        self.max_pares = max_pares  # Pares simultâneos por partida (bem acima do possível)
+        self.recompensa_morte = recompensa_morte
+        self.reinicio_automatico = reinicio_automatico
+
+        # Fase de cada partida (um valor para todas ou um por partida)
+        self.fase = np.broadcast_to(np.asarray(fase, dtype=np.int64), (n,)).copy()
+        self.pontos_para_progresso = PONTOS_PARA_PROGRESSO_FASE[self.fase]
+
+        if sementes is None:
+            sementes = np.arange(n)
+        self.sementes = np.asarray(sementes, dtype=np.uint64).copy()
+        self.contador_rng = np.zeros(n, dtype=np.uint64)
+
+        # Jogador
+        self.px = np.zeros(n)
+        self.py = np.zeros(n)
+        self.invencivel = np.zeros(n, dtype=bool)
+        self.tempo_invencivel = np.zeros(n)
+
+        # Partida
+        self.pontuacao = np.zeros(n, dtype=np.int64)
+        self.tempo_jogo = np.zeros(n, dtype=np.int64)
+        self.nivel = np.zeros(n, dtype=np.int64)
+        self.progresso_atual = np.zeros(n, dtype=np.int64)
+        self.velocidade_obstaculos = np.zeros(n)
+        self.feito = np.zeros(n, dtype=bool)
+
+        # Gerenciador de obstáculos
+        self.tempo_ultimo_spawn = np.zeros(n)
+        self.intervalo_spawn = np.zeros(n)
+        self.pares_criados = np.zeros(n, dtype=np.int64)
+
+        # Pares de obstáculos (buffer circular de max_pares por partida)
+        forma = (n, max_pares)
+        self.par_ativo = np.zeros(forma, dtype=bool)
+        self.par_x = np.zeros(forma)
+        self.par_velocidade = np.zeros(forma)
+        self.par_topo = np.zeros(forma, dtype=np.int32)  # Fim do obstáculo superior
+        self.par_base = np.zeros(forma, dtype=np.int32)  # Início do obstáculo inferior
+        self.par_largura_superior = np.zeros(forma, dtype=np.int32)
+        self.par_largura_inferior = np.zeros(forma, dtype=np.int32)
+
+        # Resultado da última partida encerrada em cada linha
+        self.pontuacao_final = np.zeros(n, dtype=np.int64)
+        self.nivel_final = np.zeros(n, dtype=np.int64)
+        self.partidas_encerradas = 0
+
+        self._linhas = np.arange(n)
+        self.reiniciar()
+
+    def reiniciar(self, indices=None, sementes=None):
+        """Recomeça as partidas indicadas (todas se None); retorna as observações"""
+        if indices is None:
+            indices = self._linhas
+        if sementes is not None:
+            self.sementes[indices] = sementes
+            self.contador_rng[indices] = 0
+
+        self.px[indices] = X_INICIAL_JOGADOR
+        self.py[indices] = self.altura // 2
+        self.invencivel[indices] = False
+        self.tempo_invencivel[indices] = 0
+
+        self.pontuacao[indices] = 0
+        self.tempo_jogo[indices] = 0
+        self.nivel[indices] = 1
+        self.progresso_atual[indices] = 0
+        self.velocidade_obstaculos[indices] = 4.0 * VELOCIDADE_BASE_FASE[self.fase[indices]]
+        self.feito[indices] = False
+
+        self.tempo_ultimo_spawn[indices] = 0
+        self.intervalo_spawn[indices] = INTERVALO_SPAWN_INICIAL
+        self.pares_criados[indices] = 0
+        self.par_ativo[indices] = False
+        return self.observar()
+
+    def sortear(self, linhas, minimo, maximo):
+        """Inteiro uniforme em [minimo, maximo] para cada linha (como randint)"""
+        contador = self.contador_rng[linhas]
+        self.contador_rng[linhas] = contador + np.uint64(1)
+        h = _misturar(self.sementes[linhas] * _PHI + contador)
+        amplitude = np.asarray(maximo - minimo + 1, dtype=np.uint64)
+        return minimo + (h % amplitude).astype(np.int64)
+
+    def criar_pares(self, linhas):
+        """Cria um par de obstáculos na borda direita das partidas indicadas"""
+        # Mesma ordem de sorteios de scripts.fluxo_obstaculos.sortear_trecho
+        altura_vao = self.sortear(linhas, *FAIXA_ALTURA_VAO)
+        posicao_vao = self.sortear(linhas, MARGEM_VAO, self.altura - altura_vao - MARGEM_VAO)
+        largura_superior = self.sortear(linhas, *FAIXA_LARGURA)
+        largura_inferior = self.sortear(linhas, *FAIXA_LARGURA)
+
+        slot = self.pares_criados[linhas] % self.max_pares
+        self.pares_criados[linhas] += 1
+        self.par_ativo[linhas, slot] = True
+        self.par_x[linhas, slot] = self.largura
+        self.par_velocidade[linhas, slot] = self.velocidade_obstaculos[linhas]
+        self.par_topo[linhas, slot] = posicao_vao
+        self.par_base[linhas, slot] = posicao_vao + altura_vao
+        self.par_largura_superior[linhas, slot] = largura_superior
+        self.par_largura_inferior[linhas, slot] = largura_inferior
+
+    def step(self, acoes):
+        """Avança todas as partidas um passo; retorna (observações, recompensas, feitos)"""
+        acoes = np.asarray(acoes)
+        vivos = ~self.feito
+        escala = self.escala_tempo
+
+        # Tempo e turbo
+        self.tempo_jogo += vivos
+        multiplicador = np.where(acoes & TURBO, 1.5, 1.0)
+
+        # Progresso: sobe de nível, acelera os próximos obstáculos e dá invencibilidade
+        sobe = vivos & (self.pontuacao >= self.progresso_atual + self.pontos_para_progresso)
+        if sobe.any():
+            self.progresso_atual[sobe] = self.pontuacao[sobe]
+            self.nivel[sobe] += 1
+            self.velocidade_obstaculos[sobe] += 0.2
+            self.invencivel[sobe] = True
+            self.tempo_invencivel[sobe] = 0
+
+        # Jogador: invencibilidade e movimento
+        contando = vivos & self.invencivel
+        self.tempo_invencivel[contando] += escala
+        expirou = contando & (self.tempo_invencivel >= DURACAO_INVENCIBILIDADE)
+        self.invencivel[expirou] = False
+        self.tempo_invencivel[expirou] = 0
+
+        velocidade = VELOCIDADE_JOGADOR * escala
+        movimento_x = (((acoes & DIREITA) > 0).astype(np.float64) -
+                       ((acoes & ESQUERDA) > 0)) * velocidade
+        movimento_y = (((acoes & BAIXO) > 0).astype(np.float64) -
+                       ((acoes & CIMA) > 0)) * velocidade
+        diagonal = (movimento_x != 0) & (movimento_y != 0)
+        fator = np.where(diagonal, 0.7071, 1.0) * vivos
+        self.px = np.clip(self.px + movimento_x * fator, 0, self.largura - TAMANHO_JOGADOR)
+        self.py = np.clip(self.py + movimento_y * fator, 0, self.altura - TAMANHO_JOGADOR)
+
+        # Obstáculos: movimento, descarte e criação
+        deslocamento = (multiplicador * escala * vivos)[:, None]
+        self.par_x -= self.par_velocidade * deslocamento
+        largura_par = np.maximum(self.par_largura_superior, self.par_largura_inferior)
+        self.par_ativo &= self.par_x + largura_par >= 0
+
+        self.tempo_ultimo_spawn += escala * vivos
+        nascem = vivos & (self.tempo_ultimo_spawn >= self.intervalo_spawn)
+        if nascem.any():
+            self.criar_pares(self._linhas[nascem])
+            self.tempo_ultimo_spawn[nascem] = 0
+
+        # Ajustar dificuldade (com a pontuação anterior ao passo, como na Partida)
+        ajusta = vivos & (self.pontuacao > 0) & (self.pontuacao % 100 == 0)
+        self.intervalo_spawn[ajusta] = np.maximum(INTERVALO_SPAWN_MINIMO,
+                                                  self.intervalo_spawn[ajusta] - 3 * escala)
+
+        # Pontuação (1 ponto por segundo)
+        ganhou = vivos & (self.tempo_jogo % self.taxa_simulacao == 0)
+        self.pontuacao += ganhou
+
+        # Colisões (retângulos arredondados como em pygame.Rect)
+        jx = arredondar_rect(self.px)[:, None]
+        jy = arredondar_rect(self.py)[:, None]
+        ox = arredondar_rect(self.par_x)
+        na_faixa = self.par_ativo & (ox < jx + TAMANHO_JOGADOR)
+        colide_superior = (ox + self.par_largura_superior > jx) & (jy < self.par_topo)
+        colide_inferior = ((ox + self.par_largura_inferior > jx) &
+                           (jy + TAMANHO_JOGADOR > self.par_base))
+        colidiu = (na_faixa & (colide_superior | colide_inferior)).any(axis=1)
+        morreu = vivos & colidiu & ~self.invencivel
+
+        recompensas = ganhou.astype(np.float64)
+        recompensas[morreu] += self.recompensa_morte
+        self.feito |= morreu
+        feitos = morreu
+
+        if morreu.any():
+            self.pontuacao_final[morreu] = self.pontuacao[morreu]
+            self.nivel_final[morreu] = self.nivel[morreu]
+            self.partidas_encerradas += int(morreu.sum())
+            if self.reinicio_automatico:
+                # A observação devolvida já é a do início da nova partida
+                self.reiniciar(self._linhas[morreu])
+
+        return self.observar(), recompensas, feitos
+
+    def observar(self):
+        """Observações (N x TAMANHO_OBSERVACAO, float32) normalizadas pela tela
+
+        Colunas: x e y do jogador, invencível, fração da invencibilidade
+        decorrida e, para os dois próximos pares à frente do jogador, a
+        distância em x, o fim do obstáculo superior e o início do inferior.
+        """
+        obs = np.zeros((self.n, TAMANHO_OBSERVACAO), dtype=np.float32)
+        obs[:, 0] = self.px / self.largura
+        obs[:, 1] = self.py / self.altura
+        obs[:, 2] = self.invencivel
+        obs[:, 3] = self.tempo_invencivel / DURACAO_INVENCIBILIDADE
+
+        # Pares que ainda não passaram pelo jogador, do mais próximo ao mais distante
+        largura_par = np.maximum(self.par_largura_superior, self.par_largura_inferior)
+        a_frente = self.par_ativo & (self.par_x + largura_par >= self.px[:, None])
+        chave = np.where(a_frente, self.par_x, np.inf)
+        ordem = np.argsort(chave, axis=1)[:, :2]
+        for i in range(2):
+            slot = ordem[:, i]
+            existe = a_frente[self._linhas, slot]
+            distancia = (self.par_x[self._linhas, slot] - self.px) / self.largura
+            obs[:, 4 + 3 * i] = np.where(existe, distancia, 1.0)
+            topo = self.par_topo[self._linhas, slot] / self.altura
+            base = self.par_base[self._linhas, slot] / self.altura
+            obs[:, 5 + 3 * i] = np.where(existe, topo, 0.0)
+            obs[:, 6 + 3 * i] = np.where(existe, base, 1.0)
+        return obs
+
+
+def acoes_vao(obs, altura=600, zona_morta=6):
+    """Política vetorizada que mira o centro do vão do próximo par (como BotVao)"""
+    centro_jogador = obs[:, 1] * altura + TAMANHO_JOGADOR / 2
+    alvo = (obs[:, 5] + obs[:, 6]) / 2 * altura
+    diferenca = alvo - centro_jogador
+    return np.where(diferenca > zona_morta, BAIXO, np.where(diferenca < -zona_morta, CIMA, 0))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vazão do ambiente em lote")
+    parser.add_argument('--ambientes', type=int, default=4096)
+    parser.add_argument('--passos', type=int, default=2000)
+    parser.add_argument('--fase', type=int, default=1, choices=NUMEROS_FASES)
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    ambiente = AmbienteLote(args.ambientes, args.fase,
+                            np.arange(args.ambientes) + args.semente * args.ambientes)
+    obs = ambiente.observar()
+    inicio = time.perf_counter()
+    for _ in range(args.passos):
+        obs, _, _ = ambiente.step(acoes_vao(obs))
+    duracao = time.perf_counter() - inicio
+
+    passos = args.ambientes * args.passos
+    print(f"{passos} passos de partida em {duracao:.2f}s: {passos / duracao:,.0f} passos/s")
+    print(f"partidas encerradas: {ambiente.partidas_encerradas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+"""Benchmark do tempo de quadro de cada cena em cenários roteirizados
+
+Roda cada cenário fora da tela (driver de vídeo dummy) medindo, por quadro, o
+tempo de atualizar e o de desenhar. Mostra média, p50/p95/p99 e pior quadro e
+pode salvar tudo em JSON para comparar com uma base salva antes.
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.bench_cenas --saida base.json
+    python -m scripts.bench_cenas --base base.json --tolerancia 10
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import pygame
+from scripts.headless import CORES_PADRAO
+from scripts.perfilador import percentil
+from scripts.entrada import EstadoEntrada, EstadoTeclas, ENTRADA_VAZIA, SEM_TECLAS
+
+LARGURA = 800
+ALTURA = 600
+VERSAO_FORMATO = 1
+
+# Estatísticas comparadas com a base
+METRICAS = ('media', 'p50', 'p95', 'p99', 'pior')
+
+
+def varredura(alvos, quadros_por_trecho=30):
+    """Caminho do cursor passando pelos alvos em linha reta, em loop"""
+    def posicao(quadro):
+        trecho, resto = divmod(quadro, quadros_por_trecho)
+        inicio = alvos[trecho % len(alvos)]
+        fim = alvos[(trecho + 1) % len(alvos)]
+        t = resto / quadros_por_trecho
+        return (int(inicio[0] + (fim[0] - inicio[0]) * t),
+                int(inicio[1] + (fim[1] - inicio[1]) * t))
+    return posicao
+
+
+class Cenario:
+    """Cena criada sob demanda e o roteiro que a conduz quadro a quadro"""
+
+    def __init__(self, nome, criar, roteiro=None):
+        self.nome = nome
+        self.criar = criar
+        self.roteiro = roteiro  # cena -> função quadro -> EstadoEntrada
+
+    def executar(self, tela, quadros, aquecimento):
+        """Roda o cenário e retorna os tempos (ms) de atualizar e desenhar"""
+        tempos_atualizar = []
+        tempos_desenhar = []
+        cena = self.criar(tela)
+        passo_roteiro = self.roteiro(cena) if self.roteiro else None
+        relogio = time.perf_counter
+        for quadro in range(aquecimento + quadros):
+            entrada = passo_roteiro(quadro) if passo_roteiro else ENTRADA_VAZIA
+
+            inicio = relogio()
+            cena.atualizar(entrada)
+            meio = relogio()
+            cena.desenhar_fundo()
+            cena.desenhar()
+            fim = relogio()
+
+            if quadro >= aquecimento:
+                tempos_atualizar.append((meio - inicio) * 1000)
+                tempos_desenhar.append((fim - meio) * 1000)
+        if hasattr(cena, 'fechar'):
+            cena.fechar()
+        return tempos_atualizar, tempos_desenhar
+
+
+def criar_menu(tela):
+    from scripts.cenas import Menu
+    return Menu(tela, LARGURA, ALTURA, CORES_PADRAO[0])
+
+
+def criar_selecao_fase(tela):
+    from scripts.cenas import SelecaoFase
+    return SelecaoFase(tela, LARGURA, ALTURA, CORES_PADRAO)
+
+
+def criar_partida_fase3(tela):
+    from scripts.cenas import Partida
+    return Partida(tela, LARGURA, ALTURA, CORES_PADRAO, fase=3, semente=0)
+
+
+def criar_game_over(tela):
+    from scripts.cenas import GameOver
+    dados = {'pontuacao': 42, 'high_score': 99, 'fase': 3}
+    return GameOver(tela, LARGURA, ALTURA, CORES_PADRAO[2], dados)
+
+
+def roteiro_selecao_fase(cena):
+    """Cursor indo e voltando sobre os botões (troca de destaque e de textos)"""
+    alvos = [botao.rect.center for botao in cena.botoes_fase + [cena.botao_voltar]]
+    alvos.append((20, 20))  # Fora de qualquer botão
+    caminho = varredura(alvos)
+
+    def passo(quadro):
+        return EstadoEntrada(SEM_TECLAS, caminho(quadro), (), ())
+    return passo
+
+
+# Turbo e movimento vertical: o jogador percorre a tela inteira
+ENTRADA_TURBO_CIMA = EstadoEntrada.de_teclas(EstadoTeclas((pygame.K_SPACE, pygame.K_UP)))
+ENTRADA_TURBO_BAIXO = EstadoEntrada.de_teclas(EstadoTeclas((pygame.K_SPACE, pygame.K_DOWN)))
+
+
+def roteiro_partida_estresse(cena):
+    """Turbo sempre ativo, spawn no intervalo mínimo e jogador sempre invencível"""
+    def passo(quadro):
+        cena.gerenciador_obstaculos.intervalo_spawn = 60
+        # Renovada antes do último passo (a invencibilidade acaba dentro do passo)
+        jogador = cena.jogador
+        restante = jogador.duracao_invencibilidade - jogador.tempo_invencivel
+        if not jogador.invencivel or jogador.escala_tempo >= restante:
+            jogador.ativar_invencibilidade()
+        return ENTRADA_TURBO_CIMA if (quadro // 90) % 2 else ENTRADA_TURBO_BAIXO
+    return passo
+
+
+def roteiro_particulas_capacidade(cena):
+    """Partida em turbo com o sistema de partículas sempre na capacidade máxima"""
+    passo_partida = roteiro_partida_estresse(cena)
+
+    def passo(quadro):
+        particulas = cena.particulas
+        cena.emitir('batida', cena.jogador.cor, quantidade=particulas.capacidade - particulas.n)
+        return passo_partida(quadro)
+    return passo
+
+
+def roteiro_game_over(cena):
+    """Cursor passando sobre os botões depois do tempo de espera"""
+    caminho = varredura([cena.botao_reiniciar.rect.center, cena.botao_menu.rect.center,
+                         (20, 20)], 45)
+
+    def passo(quadro):
+        return EstadoEntrada(SEM_TECLAS, caminho(quadro), (), ())
+    return passo
+
+
+CENARIOS = [
+    Cenario('menu_ocioso', criar_menu),
+    Cenario('selecao_fase_varredura', criar_selecao_fase, roteiro_selecao_fase),
+    Cenario('partida_fase3_turbo', criar_partida_fase3, roteiro_partida_estresse),
+    Cenario('particulas_capacidade', criar_partida_fase3, roteiro_particulas_capacidade),
+    Cenario('game_over', criar_game_over, roteiro_game_over)
+]
+
+
+def resumir(tempos):
+    """Média, percentis e pior valor de uma série de tempos (ms)"""
+    ordenados = sorted(tempos)
+    return {
+        'media': sum(ordenados) / len(ordenados) if ordenados else 0.0,
+        'p50': percentil(ordenados, 50),
+        'p95': percentil(ordenados, 95),
+        'p99': percentil(ordenados, 99),
+        'pior': ordenados[-1] if ordenados else 0.0
+    }
+
+
+def executar(nomes=None, quadros=600, aquecimento=30):
+    """Roda os cenários (todos, ou os de nomes informados) e retorna o relatório"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.font.init()
+    tela = pygame.display.set_mode((LARGURA, ALTURA))
+
+    relatorio = {
+        'versao': VERSAO_FORMATO,
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'quadros': quadros,
+        'aquecimento': aquecimento,
+        'cenarios': {}
+    }
+    for cenario in CENARIOS:
+        if nomes and cenario.nome not in nomes:
+            continue
+        tempos_atualizar, tempos_desenhar = cenario.executar(tela, quadros, aquecimento)
+        relatorio['cenarios'][cenario.nome] = {
+            'atualizar': resumir(tempos_atualizar),
+            'desenhar': resumir(tempos_desenhar),
+            'quadro': resumir([a + d for a, d in zip(tempos_atualizar, tempos_desenhar)])
+        }
+    return relatorio
+
+
+def imprimir(relatorio):
+    """Tabela com as estatísticas de cada cenário (ms)"""
+    print(f"{'cenário':<24} {'etapa':<10} " +
+          " ".join(f"{metrica:>8}" for metrica in METRICAS))
+    print("-" * 80)
+    for nome, etapas in relatorio['cenarios'].items():
+        for etapa, estatisticas in etapas.items():
+            print(f"{nome:<24} {etapa:<10} " +
+                  " ".join(f"{estatisticas[metrica]:>8.3f}" for metrica in METRICAS))
+
+
+def comparar(relatorio, base, tolerancia):
+    """Compara o tempo total de quadro com a base; retorna a lista de regressões"""
+    regressoes = []
+    print(f"\n{'cenário':<24} {'métrica':<8} {'base':>9} {'atual':>9} {'variação':>9}")
+    print("-" * 63)
+    for nome, etapas in relatorio['cenarios'].items():
+        anterior = base.get('cenarios', {}).get(nome)
+        if anterior is None:
+            print(f"{nome:<24} (sem base)")
+            continue
+        for metrica in METRICAS:
+            valor_base = anterior['quadro'][metrica]
+            valor = etapas['quadro'][metrica]
+            variacao = 100.0 * (valor - valor_base) / valor_base if valor_base else 0.0
+            marca = ""
+            if variacao > tolerancia:
+                marca = " <"
+                regressoes.append((nome, metrica, variacao))
+            print(f"{nome:<24} {metrica:<8} {valor_base:>9.3f} {valor:>9.3f} "
+                  f"{variacao:>+8.1f}%{marca}")
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de tempo de quadro por cena")
+    parser.add_argument('cenarios', nargs='*',
+                        help="cenários a rodar (padrão: todos): " +
+                             ", ".join(cenario.nome for cenario in CENARIOS))
+    parser.add_argument('--quadros', type=int, default=600)
+    parser.add_argument('--aquecimento', type=int, default=30,
+                        help="quadros iniciais descartados (caches frios)")
+    parser.add_argument('--saida', help="salva o relatório em JSON")
+    parser.add_argument('--base', help="relatório JSON para comparação")
+    parser.add_argument('--tolerancia', type=float, default=10.0,
+                        help="aumento percentual aceito antes de acusar regressão")
+    args = parser.parse_args()
+
+    desconhecidos = set(args.cenarios) - {cenario.nome for cenario in CENARIOS}
+    if desconhecidos:
+        parser.error("cenário desconhecido: " + ", ".join(sorted(desconhecidos)))
+
+    relatorio = executar(args.cenarios, args.quadros, args.aquecimento)
+    imprimir(relatorio)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+        print(f"\nRelatório salvo em {args.saida}")
+
+    if args.base:
+        with open(args.base, encoding='utf-8') as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar(relatorio, base, args.tolerancia)
+        if regressoes:
+            print(f"\n{len(regressoes)} métrica(s) acima da tolerância de {args.tolerancia}%")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
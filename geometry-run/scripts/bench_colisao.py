@@ -0,0 +1,72 @@
+"""Microbenchmark da consulta de colisão: varredura linear x índice ordenado
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.bench_colisao [obstáculos_por_tela ...]
+"""
+import random
+import sys
+import time
+import pygame
+from scripts.obstaculo import GerenciadorObstaculos
+
+LARGURA_TELA = 800
+ALTURA_TELA = 600
+TELAS = 10
+CONSULTAS = 2000
+
+
+def varredura_linear(obstaculos, rect_jogador):
+    """Consulta original: colliderect contra todos os obstáculos"""
+    for obstaculo in obstaculos:
+        if rect_jogador.colliderect(obstaculo.get_rect()):
+            return obstaculo
+    return None
+
+
+def preparar(densidade, semente=0):
+    """Gerenciador com `densidade` obstáculos por largura de tela, ordenados por x"""
+    random.seed(semente)
+    largura_virtual = LARGURA_TELA * TELAS
+    gerenciador = GerenciadorObstaculos(pygame.Surface((1, 1)), largura_virtual, ALTURA_TELA)
+    pares = densidade * TELAS // 2
+    posicoes = sorted(random.uniform(0, largura_virtual) for _ in range(pares))
+    for x in posicoes:
+        gerenciador.criar_par_obstaculos()
+        for obstaculo in gerenciador.obstaculos[-2:]:
+            obstaculo.posicao[0] = x
+            obstaculo.rect.x = x
+    return gerenciador
+
+
+def medir(funcao, rects):
+    """Tempo médio (µs) por consulta"""
+    inicio = time.perf_counter()
+    for rect in rects:
+        funcao(rect)
+    return (time.perf_counter() - inicio) * 1e6 / len(rects)
+
+
+def main():
+    densidades = [int(arg) for arg in sys.argv[1:]] or [10, 50, 200, 1000, 5000]
+
+    print(f"{'obst./tela':>10} | {'linear (µs)':>11} | {'índice (µs)':>11} | {'ganho':>7}")
+    print("-" * 50)
+    for densidade in densidades:
+        gerenciador = preparar(densidade)
+        rects = [pygame.Rect(random.uniform(0, LARGURA_TELA * TELAS),
+                             random.uniform(0, ALTURA_TELA - 40), 40, 40)
+                 for _ in range(CONSULTAS)]
+
+        # As duas consultas precisam concordar antes de comparar o tempo
+        for rect in rects[:200]:
+            assert (varredura_linear(gerenciador.obstaculos, rect) is None) == \
+                   (gerenciador.consultar_colisao(rect) is None)
+
+        tempo_linear = medir(lambda rect: varredura_linear(gerenciador.obstaculos, rect), rects)
+        tempo_indice = medir(gerenciador.consultar_colisao, rects)
+        print(f"{densidade:>10} | {tempo_linear:>11.2f} | {tempo_indice:>11.2f} | "
+              f"{tempo_linear / tempo_indice:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Compara a latência entrada -> tela do loop clássico e do loop com amostragem tardia
+
+Roda o jogo fora da tela (driver de vídeo dummy) em uma partida, com uma
+thread postando teclas em instantes aleatórios, primeiro com um loop e depois
+com o outro, e mostra os percentis de cada um.
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.bench_latencia --segundos 10 --fase 3
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+import pygame
+from scripts.fases import NUMEROS_FASES
+from scripts.latencia import PERCENTIS
+
+MODOS = (('clássico', False), ('amostragem tardia', True))
+
+
+def postar_teclas(parar, semente, intervalo_medio):
+    """Posta KEYDOWN/KEYUP de uma tecla sem efeito no jogo em instantes aleatórios"""
+    aleatorio = random.Random(semente)
+    while not parar.wait(aleatorio.expovariate(1.0 / intervalo_medio)):
+        for tipo in (pygame.KEYDOWN, pygame.KEYUP):
+            pygame.event.post(pygame.event.Event(tipo, key=pygame.K_LSHIFT, mod=0,
+                                                 unicode='', scancode=0))
+
+
+def medir(entrada_tardia, segundos, fase, fps, semente, intervalo_medio):
+    """Roda uma partida pelo tempo pedido e retorna o resumo das latências"""
+    from main import GeometryRun
+
+    jogo = GeometryRun(fps=fps, pasta_dados=tempfile.mkdtemp(prefix='bench_latencia_'),
+                       latencia=True, entrada_tardia=entrada_tardia)
+    jogo.fase_selecionada = fase
+    jogo.mudar_estado('partida')
+    quadro = jogo.quadro_tardio if entrada_tardia else jogo.quadro_classico
+
+    parar = threading.Event()
+    postador = threading.Thread(target=postar_teclas, args=(parar, semente, intervalo_medio),
+                                daemon=True)
+    jogo.iniciar_loop()
+    postador.start()
+    fim = time.perf_counter() + segundos
+    while time.perf_counter() < fim and jogo.rodando:
+        # Jogador sempre invencível: a partida não acaba durante a medição
+        partida = jogo.cena_atual
+        if jogo.estado_atual == 'partida' and not partida.jogador.invencivel:
+            partida.jogador.ativar_invencibilidade()
+        quadro()
+    parar.set()
+    postador.join()
+    jogo.cenas.fechar()
+    jogo.pontuacoes.fechar()
+    # Sem pygame.quit(): os caches de fontes e superfícies servem ao próximo modo
+    return jogo.medidor_latencia.resumo()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latência entrada -> tela por modo de loop")
+    parser.add_argument('--segundos', type=float, default=10.0, help="duração de cada modo")
+    parser.add_argument('--fase', type=int, default=3, choices=NUMEROS_FASES)
+    parser.add_argument('--fps', type=int, default=60)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--intervalo', type=float, default=0.05,
+                        help="intervalo médio (s) entre teclas postadas")
+    args = parser.parse_args()
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    colunas = ('media',) + tuple(f'p{p}' for p in PERCENTIS) + ('pior',)
+    print(f"{'modo':<20} {'entradas':>8} " + " ".join(f"{coluna:>8}" for coluna in colunas))
+    print("-" * (30 + 9 * len(colunas)))
+    for nome, entrada_tardia in MODOS:
+        resumo = medir(entrada_tardia, args.segundos, args.fase, args.fps, args.semente,
+                       args.intervalo)
+        print(f"{nome:<20} {resumo['quantidade']:>8} " +
+              " ".join(f"{resumo[coluna]:>8.2f}" for coluna in colunas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark dos motores de obstáculos com milhares de obstáculos ativos
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.bench_obstaculos [quantidade ...]
+"""
+import random
+import sys
+import time
+import pygame
+from scripts.obstaculo import GerenciadorObstaculos
+from scripts.obstaculo_vetorizado import GerenciadorObstaculosVetorizado
+
+ALTURA_TELA = 600
+QUADROS = 200
+
+
+def preencher(gerenciador, quantidade, largura_virtual):
+    """Cria pares de obstáculos espalhados por uma tela virtual bem larga"""
+    for _ in range(quantidade // 2):
+        gerenciador.criar_par_obstaculos()
+
+    posicoes = [random.uniform(0, largura_virtual) for _ in range(quantidade // 2)]
+    posicoes.sort()
+    if isinstance(gerenciador, GerenciadorObstaculosVetorizado):
+        for i, x in enumerate(posicoes):
+            gerenciador.x[2 * i:2 * i + 2] = x
+    else:
+        for i, x in enumerate(posicoes):
+            for obstaculo in gerenciador.obstaculos[2 * i:2 * i + 2]:
+                obstaculo.posicao[0] = x
+                obstaculo.rect.x = x
+
+
+def medir(classe, quantidade, semente=0):
+    """Tempo médio (ms) de atualizar + verificar_colisao por quadro"""
+    random.seed(semente)
+    largura_virtual = quantidade * 20
+    tela = pygame.Surface((1, 1))
+    gerenciador = classe(tela, largura_virtual, ALTURA_TELA, 4.0)
+    preencher(gerenciador, quantidade, largura_virtual)
+    # Jogador fora da tela: força o pior caso (nenhuma colisão, varredura completa)
+    rect_jogador = pygame.Rect(-100, -100, 40, 40)
+
+    inicio = time.perf_counter()
+    for _ in range(QUADROS):
+        gerenciador.atualizar(0)
+        gerenciador.verificar_colisao(rect_jogador)
+    return (time.perf_counter() - inicio) * 1000 / QUADROS
+
+
+def main():
+    quantidades = [int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000, 20000]
+
+    print(f"{'obstáculos':>10} | {'lista (ms)':>10} | {'numpy (ms)':>10} | {'ganho':>7}")
+    print("-" * 48)
+    for quantidade in quantidades:
+        tempo_lista = medir(GerenciadorObstaculos, quantidade)
+        tempo_numpy = medir(GerenciadorObstaculosVetorizado, quantidade)
+        print(f"{quantidade:>10} | {tempo_lista:>10.3f} | {tempo_numpy:>10.3f} | "
+              f"{tempo_lista / tempo_numpy:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
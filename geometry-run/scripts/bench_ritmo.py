@@ -0,0 +1,71 @@
+"""Compara as estratégias de ritmo de quadros: regularidade do intervalo e uso de CPU
+
+Roda o jogo fora da tela (driver de vídeo dummy) em uma partida por alguns
+segundos com cada estratégia e mostra o intervalo médio, o desvio padrão, o
+pior intervalo, os prazos perdidos e a CPU usada pelo processo.
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.bench_ritmo --segundos 5 --fps 60 --limiar 2
+    python -m scripts.bench_ritmo hibrido --fps 144
+"""
+import argparse
+import os
+import tempfile
+import time
+from scripts.fases import NUMEROS_FASES
+from scripts.ritmo import ESTRATEGIAS, LIMIAR_PADRAO
+
+COLUNAS = (('intervalo_medio_ms', 'médio'), ('desvio_ms', 'desvio'), ('pior_ms', 'pior'),
+           ('percentual_perdidos', '% perd.'), ('cpu_percentual', '% CPU'))
+
+
+def medir(estrategia, segundos, fase, fps, limiar):
+    """Roda uma partida com a estratégia pelo tempo pedido e retorna as estatísticas"""
+    from main import GeometryRun
+
+    jogo = GeometryRun(fps=fps, ritmo=estrategia, limiar_ritmo=limiar,
+                       pasta_dados=tempfile.mkdtemp(prefix='bench_ritmo_'))
+    jogo.fase_selecionada = fase
+    jogo.mudar_estado('partida')
+
+    jogo.iniciar_loop()
+    fim = time.perf_counter() + segundos
+    while time.perf_counter() < fim and jogo.rodando:
+        # Jogador sempre invencível: a partida não acaba durante a medição
+        partida = jogo.cena_atual
+        if jogo.estado_atual == 'partida' and not partida.jogador.invencivel:
+            partida.jogador.ativar_invencibilidade()
+        jogo.quadro_classico()
+    jogo.pontuacoes.fechar()
+    # Sem pygame.quit(): os caches de fontes e superfícies servem à próxima estratégia
+    return jogo.ritmo.estatisticas()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regularidade e CPU por estratégia de ritmo")
+    parser.add_argument('estrategias', nargs='*',
+                        help="estratégias a comparar (padrão: todas): " + ", ".join(ESTRATEGIAS))
+    parser.add_argument('--segundos', type=float, default=5.0,
+                        help="duração de cada estratégia")
+    parser.add_argument('--fase', type=int, default=3, choices=NUMEROS_FASES)
+    parser.add_argument('--fps', type=int, default=60, help="taxa alvo (0 = sem limite)")
+    parser.add_argument('--limiar', type=float, default=1000 * LIMIAR_PADRAO, metavar='MS',
+                        help="ms antes do prazo em que o ritmo híbrido gira")
+    args = parser.parse_args()
+
+    desconhecidas = set(args.estrategias) - set(ESTRATEGIAS)
+    if desconhecidas:
+        parser.error("estratégia desconhecida: " + ", ".join(sorted(desconhecidas)))
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    print(f"{'estratégia':<10} {'quadros':>8} " +
+          " ".join(f"{titulo:>8}" for _, titulo in COLUNAS))
+    print("-" * (19 + 9 * len(COLUNAS)))
+    for estrategia in args.estrategias or ESTRATEGIAS:
+        dados = medir(estrategia, args.segundos, args.fase, args.fps, args.limiar / 1000)
+        print(f"{estrategia:<10} {dados['quadros']:>8} " +
+              " ".join(f"{dados[chave]:>8.2f}" for chave, _ in COLUNAS))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,18 @@
+import random
+import time
 import pygame
 from scripts.jogador import Jogador
 from scripts.obstaculo import GerenciadorObstaculos
 from scripts.interfaces import Texto, Botao
+from scripts.hud import HUD, WidgetTexto, WidgetBarra
+from scripts.fundo import cache_fundo
+from scripts.fases import FASES, obter_fase
+from scripts.perfilador import perfilador
+from scripts.entrada import IndiceAlvos
+from scripts.fluxo_obstaculos import FluxoObstaculos
+
+# Taxa (passos por segundo) para a qual as constantes do jogo foram calibradas
+TAXA_REFERENCIA = 60
 
 class Menu:
     def __init__(self, tela, largura, altura, cores):
@@ -39,21 +50,35 @@ class Menu:
             (100, 100, 120), cores['texto'],
             (120, 120, 140)
         )
+        self.alvos = IndiceAlvos([self.botao_jogar, self.botao_sair])
+    
+    def entrar(self, dados=None):
+        """Chamado pelo gerenciador de cenas ao voltar para o menu"""
+        self.alvos.resetar()
     
-    def atualizar(self):
-        """Atualiza o menu"""
-        if self.botao_jogar.atualizar():
+    def atualizar(self, entrada):
+        """Atualiza o menu com a entrada do passo"""
+        clicado = self.alvos.despachar(entrada)
+        if clicado is self.botao_jogar:
             return ('selecao_fase', None)
         
-        if self.botao_sair.atualizar():
+        if clicado is self.botao_sair:
             pygame.event.post(pygame.event.Event(pygame.QUIT))
         
         return None
     
-    def desenhar(self):
+    def construir_fundo(self, superficie):
+        """Desenha as partes estáticas do menu"""
+        superficie.fill(self.cores['fundo'])
+        self.titulo.desenhar(superficie)
+        self.subtitulo.desenhar(superficie)
+    
+    def desenhar_fundo(self):
+        """Desenha o fundo em cache do menu"""
+        cache_fundo.desenhar(self.tela, 'menu', self.cores, self.construir_fundo)
+    
+    def desenhar(self, alfa=1.0):
         """Desenha o menu"""
-        self.titulo.desenhar()
-        self.subtitulo.desenhar()
         self.botao_jogar.desenhar()
         self.botao_sair.desenhar()
 
@@ -71,47 +96,21 @@ class SelecaoFase:
             (240, 240, 240), 48, centralizado=True
         )
         
-        # Botões para cada fase
+        # Um botão para cada fase da tabela
         self.botoes_fase = []
-        
-        # FASE 1 - Velocidade Normal (1.0x)
-        botao_fase1 = Botao(
-            tela, "FASE 1 - NORMAL",
-            largura // 2 - 150, altura // 3,
-            300, 70,
-            cores_fases[0]['botao'], cores_fases[0]['texto'],
-            cores_fases[0]['botao_hover']
-        )
-        botao_fase1.fase = 1
-        botao_fase1.descricao = "Fase 1 - Velocidade Normal"
-        botao_fase1.detalhes = "Velocidade: 1.0x - Dificuldade para iniciantes"
-        self.botoes_fase.append(botao_fase1)
-        
-        # FASE 2 - Velocidade Rápida (1.5x)
-        botao_fase2 = Botao(
-            tela, "FASE 2 - RÁPIDA",
-            largura // 2 - 150, altura // 3 + 100,
-            300, 70,
-            cores_fases[1]['botao'], cores_fases[1]['texto'],
-            cores_fases[1]['botao_hover']
-        )
-        botao_fase2.fase = 2
-        botao_fase2.descricao = "Fase 2 - Velocidade Rápida"
-        botao_fase2.detalhes = "Velocidade: 1.5x - Para jogadores experientes"
-        self.botoes_fase.append(botao_fase2)
-        
-        # FASE 3 - Velocidade Extrema (2.0x)
-        botao_fase3 = Botao(
-            tela, "FASE 3 - EXTREMA",
-            largura // 2 - 150, altura // 3 + 200,
-            300, 70,
-            cores_fases[2]['botao'], cores_fases[2]['texto'],
-            cores_fases[2]['botao_hover']
-        )
-        botao_fase3.fase = 3
-        botao_fase3.descricao = "Fase 3 - Velocidade Extrema"
-        botao_fase3.detalhes = "Velocidade: 2.0x - Apenas para os mais corajosos!"
-        self.botoes_fase.append(botao_fase3)
+        for indice, fase in enumerate(FASES):
+            cores = cores_fases[indice]
+            botao = Botao(
+                tela, fase.titulo_botao,
+                largura // 2 - 150, altura // 3 + 100 * indice,
+                300, 70,
+                cores['botao'], cores['texto'],
+                cores['botao_hover']
+            )
+            botao.fase = fase.numero
+            botao.descricao = fase.descricao
+            botao.detalhes = fase.detalhes
+            self.botoes_fase.append(botao)
         
         # Botão voltar
         self.botao_voltar = Botao(
@@ -121,122 +120,138 @@ class SelecaoFase:
             (100, 100, 120), (240, 240, 240),
             (120, 120, 140)
         )
+        self.alvos = IndiceAlvos(self.botoes_fase + [self.botao_voltar])
+        
+        # Painel de detalhes pré-renderizado
+        self.painel, self.posicao_painel = self.construir_painel()
         
         # Detalhes da seleção
+        self.entrar()
+    
+    def entrar(self, dados=None):
+        """Chamado pelo gerenciador de cenas: volta à seleção inicial (fase 1)"""
         self.fase_selecionada = 1
-        self.descricao_selecionada = "Fase 1 - Velocidade Normal"
-        self.detalhes_selecionados = "Velocidade: 1.0x - Dificuldade para iniciantes"
+        self.descricao_selecionada = FASES[0].descricao
+        self.detalhes_selecionados = FASES[0].detalhes
+        self.atualizar_textos_selecao()
+        self.alvos.resetar()
     
-    def atualizar(self):
-        """Atualiza a tela de seleção de fase"""
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Verificar hover sobre os botões
-        for botao in self.botoes_fase:
-            if botao.rect.collidepoint(mouse_pos):
-                self.fase_selecionada = botao.fase
-                self.descricao_selecionada = botao.descricao
-                self.detalhes_selecionados = botao.detalhes
-        
-        # Verificar cliques nos botões
-        for botao in self.botoes_fase:
-            if botao.atualizar():
-                return ('partida', {'fase': botao.fase})
-        
-        # Verificar botão voltar
-        if self.botao_voltar.atualizar():
+    def atualizar(self, entrada):
+        """Atualiza a tela de seleção de fase com a entrada do passo"""
+        clicado = self.alvos.despachar(entrada)
+        
+        # A fase sob o cursor fica selecionada (mesmo depois que ele sai)
+        sobre = self.alvos.sobre
+        if sobre is not None and sobre is not self.botao_voltar:
+            self.fase_selecionada = sobre.fase
+            self.descricao_selecionada = sobre.descricao
+            self.detalhes_selecionados = sobre.detalhes
+        
+        if clicado is self.botao_voltar:
             return ('menu', None)
+        if clicado is not None:
+            return ('partida', {'fase': clicado.fase})
         
         return None
     
-    def desenhar(self):
-        """Desenha a tela de seleção de fase"""
+    def construir_fundo(self, superficie):
+        """Desenha as partes estáticas da tela de seleção"""
         # Fundo com gradiente
         for i in range(self.altura):
             cor_r = int(15 + (i / self.altura) * 20)
             cor_g = int(20 + (i / self.altura) * 15)
             cor_b = int(35 + (i / self.altura) * 10)
-            pygame.draw.line(self.tela, (cor_r, cor_g, cor_b), (0, i), (self.largura, i))
+            pygame.draw.line(superficie, (cor_r, cor_g, cor_b), (0, i), (self.largura, i))
         
-        self.titulo.desenhar()
+        self.titulo.desenhar(superficie)
         
         # Instruções
         instrucoes = Texto(
-            self.tela, "Escolha o nível de dificuldade do jogo:",
+            superficie, "Escolha o nível de dificuldade do jogo:",
             self.largura // 2, self.altura // 6 + 60,
             (200, 200, 200), 22, centralizado=True
         )
         instrucoes.desenhar()
         
-        # Desenhar botões de fase
+        # Indicador de velocidade ao lado de cada botão de fase
         for botao in self.botoes_fase:
-            botao.desenhar()
-            
-            # Adicionar indicador visual de velocidade
             indicador_x = botao.rect.x + botao.rect.width + 10
             indicador_y = botao.rect.y + botao.rect.height // 2
+            fase = obter_fase(botao.fase)
             
-            # Desenhar indicador de velocidade da fase
-            if botao.fase == 1:
-                num_circulos = 3
-                cor = (100, 200, 255)
-                velocidade_texto = "1.0x"
-            elif botao.fase == 2:
-                num_circulos = 4
-                cor = (255, 200, 100)
-                velocidade_texto = "1.5x"
-            else:
-                num_circulos = 5
-                cor = (255, 100, 100)
-                velocidade_texto = "2.0x"
-            
-            # Desenhar texto da velocidade
             texto_velocidade = Texto(
-                self.tela, velocidade_texto,
+                superficie, fase.velocidade_texto,
                 indicador_x + 40, indicador_y,
-                cor, 20, centralizado=False
+                fase.cor_indicador, 20, centralizado=False
             )
             texto_velocidade.desenhar()
         
-        # Mostrar detalhes da seleção atual
+        # Texto de ajuda
+        ajuda = Texto(
+            superficie, "Pressione ESC a qualquer momento para voltar ao menu",
+            self.largura // 2, self.altura - 30,
+            (150, 150, 150), 16, centralizado=True
+        )
+        ajuda.desenhar()
+    
+    def construir_painel(self):
+        """Pré-renderiza o painel de detalhes (desenhado por cima dos botões)"""
         detalhes_bg = pygame.Rect(50, self.altura - 180, self.largura - 100, 120)
-        pygame.draw.rect(self.tela, (40, 40, 60, 180), detalhes_bg, border_radius=10)
-        pygame.draw.rect(self.tela, (100, 100, 140), detalhes_bg, 2, border_radius=10)
+        painel = pygame.Surface(detalhes_bg.size, pygame.SRCALPHA)
+        rect_local = painel.get_rect()
+        pygame.draw.rect(painel, (40, 40, 60), rect_local, border_radius=10)
+        pygame.draw.rect(painel, (100, 100, 140), rect_local, 2, border_radius=10)
         
-        texto_desc = Texto(
+        texto_info = Texto(
+            painel, "Pressione ESPAÇO durante o jogo para turbo!",
+            self.largura // 2 - detalhes_bg.x, self.altura - 100 - detalhes_bg.y,
+            (150, 200, 255), 18, centralizado=True
+        )
+        texto_info.desenhar()
+        
+        if pygame.display.get_surface() is not None:
+            painel = painel.convert_alpha()
+        return painel, detalhes_bg.topleft
+    
+    def atualizar_textos_selecao(self):
+        """Recria os textos de detalhes apenas quando a seleção muda"""
+        self.texto_desc = Texto(
             self.tela, self.descricao_selecionada,
             self.largura // 2, self.altura - 160,
             (255, 255, 200), 28, centralizado=True
         )
-        texto_desc.desenhar()
-        
-        texto_detalhes = Texto(
+        self.texto_detalhes = Texto(
             self.tela, self.detalhes_selecionados,
             self.largura // 2, self.altura - 130,
             (200, 200, 200), 20, centralizado=True
         )
-        texto_detalhes.desenhar()
+        self.fase_textos = self.fase_selecionada
+    
+    def desenhar_fundo(self):
+        """Desenha o fundo em cache da tela de seleção"""
+        cache_fundo.desenhar(self.tela, 'selecao_fase', self.cores_fases, self.construir_fundo)
+    
+    def desenhar(self, alfa=1.0):
+        """Desenha a tela de seleção de fase"""
+        # Desenhar botões de fase
+        for botao in self.botoes_fase:
+            botao.desenhar()
         
-        texto_info = Texto(
-            self.tela, "Pressione ESPAÇO durante o jogo para turbo!",
-            self.largura // 2, self.altura - 100,
-            (150, 200, 255), 18, centralizado=True
-        )
-        texto_info.desenhar()
+        # Mostrar detalhes da seleção atual
+        self.tela.blit(self.painel, self.posicao_painel)
+        
+        if self.fase_textos != self.fase_selecionada:
+            self.atualizar_textos_selecao()
+        self.texto_desc.desenhar()
+        self.texto_detalhes.desenhar()
         
         # Desenhar botão voltar
         self.botao_voltar.desenhar()
-        
-        # Texto de ajuda
-        ajuda = Texto(
-            self.tela, "Pressione ESC a qualquer momento para voltar ao menu",
-            self.largura // 2, self.altura - 30,
-            (150, 150, 150), 16, centralizado=True
-        )
-        ajuda.desenhar()
 
 class Partida:
-    def __init__(self, tela, largura, altura, cores_fases, fase=1):
+    def __init__(self, tela, largura, altura, cores_fases, fase=1, motor_obstaculos='lista',
+                 taxa_simulacao=TAXA_REFERENCIA, semente=None, gravador=None, efeitos=True,
+                 fluxo_em_segundo_plano=True):
         self.tela = tela
         self.largura = largura
         self.altura = altura
@@ -244,27 +259,62 @@ class Partida:
         
         # Configurações da partida
         self.fase = fase  # 1, 2 ou 3
-        self.velocidade_base = 1.0  # Será ajustado baseado na fase
-        
-        # Ajustar velocidade base conforme a fase
-        if fase == 1:
-            self.velocidade_base = 1.0  # Normal
-            self.pontos_para_progresso = 30
-        elif fase == 2:
-            self.velocidade_base = 1.5  # Rápido
-            self.pontos_para_progresso = 40
-        else:  # fase == 3
-            self.velocidade_base = 2.0  # Extremo
-            self.pontos_para_progresso = 50
+        
+        # Velocidade base e pontos por nível da fase
+        tabela = obter_fase(fase)
+        self.velocidade_base = tabela.velocidade_base
+        self.pontos_para_progresso = tabela.pontos_para_progresso
+        
+        # Passos de simulação por segundo (as regras avançam em quadros de referência)
+        self.taxa_simulacao = taxa_simulacao
+        self.escala_tempo = TAXA_REFERENCIA / taxa_simulacao
+        
+        # Layouts de obstáculos pré-gerados pela semente (reiniciado a cada resetar);
+        # sem segundo plano, o próprio spawn sorteia cada trecho (headless, fazenda)
+        self.fluxo_obstaculos = FluxoObstaculos(altura, em_segundo_plano=fluxo_em_segundo_plano)
+        
+        # Elementos do jogo
+        self.jogador = Jogador(tela, largura, altura, self.escala_tempo)
+        self.velocidade_obstaculos = 4.0 * self.velocidade_base
+        self.gerenciador_obstaculos = self.criar_gerenciador_obstaculos(motor_obstaculos)
+        
+        # Atualizar cores do jogador para a fase atual
+        self.jogador.cor = cores_fases[fase - 1]['jogador']
+        
+        # Interface da partida
+        self.hud = self.criar_hud(cores_fases[fase - 1])
+        
+        # Partículas do turbo, da subida de nível e da batida (None sem efeitos)
+        self.particulas = self.criar_particulas() if efeitos else None
+        
+        # Sombra e textos do game over, criados no primeiro desenho (execuções sem
+        # janela não inicializam as fontes) e reaproveitados entre as partidas
+        self.tela_game_over = None
+        
+        self.resetar(semente, gravador)
+    
+    def resetar(self, semente=None, gravador=None):
+        """Prepara uma nova partida reaproveitando jogador, obstáculos e HUD"""
+        # Semente da partida: com a mesma semente e a mesma entrada, a partida se repete
+        if semente is None:
+            semente = random.randrange(2 ** 32)
+        self.semente = semente
+        
+        # Gravador opcional da entrada de cada passo (ver scripts.replay)
+        self.gravador = gravador
         
         # Elementos do jogo
-        self.jogador = Jogador(tela, largura, altura)
+        self.jogador.resetar()
         self.velocidade_obstaculos = 4.0 * self.velocidade_base
-        self.gerenciador_obstaculos = GerenciadorObstaculos(tela, largura, altura, self.velocidade_obstaculos)
+        self.gerenciador_obstaculos.resetar()
+        self.gerenciador_obstaculos.velocidade_base = self.velocidade_obstaculos
+        self.fluxo_obstaculos.reiniciar(
+            semente, obter_fase(self.gerenciador_obstaculos.fase_atual))
         
         # Pontuação
         self.pontuacao = 0
         self.multiplicador_turbo = 1.0
+        self.velocidade_turbo = False
         self.tempo_jogo = 0
         
         # Progresso
@@ -273,9 +323,118 @@ class Partida:
         
         # Estado
         self.game_over = False
+        self.obstaculo_colisao = None  # Obstáculo que encerrou a partida
+        self.tick_colisao = None  # Passo em que a partida acabou
+        self.causa_fim = None  # 'obstaculo_superior', 'obstaculo_inferior' ou 'limite_tela'
+        if self.particulas is not None:
+            self.particulas.limpar()
+        
+        # Áreas desenhadas no último quadro (para renderização por retângulos)
+        self.retangulos_anteriores = None
+    
+    def entrar(self, dados=None):
+        """Chamado pelo gerenciador de cenas ao começar uma nova partida"""
+        dados = dados or {}
+        self.resetar(dados.get('semente'), dados.get('gravador'))
+    
+    def fechar(self):
+        """Libera a partida (encerra a thread do fluxo de obstáculos)"""
+        self.fluxo_obstaculos.fechar()
+    
+    def criar_gerenciador_obstaculos(self, motor):
+        """Cria o gerenciador de obstáculos do motor escolhido ('lista' ou 'numpy')"""
+        if motor == 'numpy':
+            # Importado só quando usado, pois depende do NumPy
+            from scripts.obstaculo_vetorizado import GerenciadorObstaculosVetorizado
+            return GerenciadorObstaculosVetorizado(self.tela, self.largura, self.altura,
+                                                   self.velocidade_obstaculos, self.escala_tempo,
+                                                   self.fluxo_obstaculos)
+        return GerenciadorObstaculos(self.tela, self.largura, self.altura,
+                                     self.velocidade_obstaculos, self.escala_tempo,
+                                     self.fluxo_obstaculos)
+    
+    def criar_particulas(self):
+        """Cria o sistema de partículas (None se o NumPy não estiver instalado)"""
+        try:
+            from scripts.particulas import SistemaParticulas, EMISSORES
+        except ImportError:
+            return None
+        self.emissores = EMISSORES
+        return SistemaParticulas(self.tela, escala_tempo=self.escala_tempo)
+    
+    def emitir(self, nome, cor, traseira=False, quantidade=None, continuo=False):
+        """Lança as partículas do emissor do centro (ou da traseira) do jogador
+        
+        continuo: emissão a cada passo, na taxa do emissor por quadro de referência.
+        """
+        if self.particulas is None:
+            return
+        x, y = self.jogador.posicao
+        meio = self.jogador.tamanho / 2
+        x = x if traseira else x + meio
+        if continuo:
+            self.particulas.emitir_continuo(self.emissores[nome], x, y + meio, cor)
+        else:
+            self.particulas.emitir(self.emissores[nome], x, y + meio, cor, quantidade)
+    
+    def fim_de_partida(self, causa):
+        """Encerra a partida no passo atual com os estilhaços da batida"""
+        self.tick_colisao = self.tempo_jogo
+        self.causa_fim = causa
+        self.game_over = True
+        self.emitir('batida', obter_fase(self.fase).cor_obstaculo)
+        self.emitir('batida', self.jogador.cor)
+    
+    def criar_hud(self, cores_fase):
+        """Cria o HUD retido com os widgets vinculados ao estado da partida"""
+        hud = HUD(self.largura, self.altura)
+        cor_texto = cores_fase['texto']
+        
+        hud.adicionar(WidgetTexto(
+            lambda: self.pontuacao, "Score: {}",
+            20, 20, cor_texto, 36
+        ))
+        hud.adicionar(WidgetTexto(
+            lambda: (self.fase, self.nivel_atual), "Fase: {} - Nível: {}",
+            self.largura // 2, 60, cor_texto, 24, centralizado=True
+        ))
+        
+        # Velocidade da fase
+        hud.adicionar(WidgetTexto(
+            lambda: self.velocidade_base, "Velocidade: {:.1f}x",
+            self.largura - 200, 20, cor_texto, 20
+        ))
+        hud.adicionar(WidgetTexto(
+            lambda: self.multiplicador_turbo, "Turbo: {:.1f}x",
+            self.largura // 2, 20, cor_texto, 24, centralizado=True
+        ))
+        
+        # Indicador de invencibilidade (escondido quando o valor é None)
+        hud.adicionar(WidgetTexto(
+            lambda: True if self.jogador.invencivel else None, "INVENCIBILIDADE!",
+            self.largura // 2, 90, (255, 255, 100), 20, centralizado=True
+        ))
         
-        # Atualizar cores do jogador para a fase atual
-        self.jogador.cor = cores_fases[fase - 1]['jogador']
+        # Instruções
+        hud.adicionar(WidgetTexto(
+            lambda: True, "Espaço: Turbo | ESC: Selecionar Fase",
+            self.largura // 2, self.altura - 20, (150, 150, 150), 16, centralizado=True
+        ))
+        
+        # Barra de progresso para o próximo nível
+        barra_largura = 200
+        barra_y = 100
+        hud.adicionar(WidgetBarra(
+            lambda: min((self.pontuacao - self.progresso_atual) / self.pontos_para_progresso, 1.0),
+            self.largura // 2 - barra_largura // 2, barra_y, barra_largura, 10
+        ))
+        hud.adicionar(WidgetTexto(
+            lambda: max(0, self.pontos_para_progresso - (self.pontuacao - self.progresso_atual)),
+            "Próximo nível: {} pontos",
+            self.largura // 2, barra_y + 20, cor_texto, 16, centralizado=True
+        ))
+        
+        return hud
     
     def verificar_progresso(self):
         """Verifica se deve subir de nível dentro da mesma fase"""
@@ -290,172 +449,161 @@ class Partida:
             return True
         return False
     
-    def atualizar(self):
-        """Atualiza o estado da partida"""
+    def atualizar(self, entrada=None):
+        """Atualiza o estado da partida (entrada: EstadoEntrada do passo; None lê o teclado)"""
         if self.game_over:
-            return ('game_over', {'pontuacao': self.pontuacao, 'fase': self.fase})
+            # Os estilhaços da batida continuam na tela de game over
+            return ('game_over', {'pontuacao': self.pontuacao, 'fase': self.fase,
+                                  'particulas': self.particulas})
         
         # Atualizar tempo
         self.tempo_jogo += 1
         
         # Verificar turbo (tecla espaço)
-        teclas = pygame.key.get_pressed()
+        teclas = entrada.teclas if entrada is not None else pygame.key.get_pressed()
+        if self.gravador is not None:
+            self.gravador.registrar(teclas)
+        turbo_anterior = self.velocidade_turbo
         self.velocidade_turbo = teclas[pygame.K_SPACE]
         self.multiplicador_turbo = 1.5 if self.velocidade_turbo else 1.0
+        if self.velocidade_turbo and turbo_anterior:
+            self.emitir('turbo', self.jogador.cor, traseira=True, continuo=True)
+        elif self.velocidade_turbo:
+            self.emitir('turbo_inicio', self.jogador.cor, traseira=True)
         
         # Verificar progresso
         if self.verificar_progresso():
             print(f"Subiu para nível {self.nivel_atual} na fase {self.fase}")
+            self.emitir('nivel', obter_fase(self.fase).cor_indicador)
         
         # Atualizar elementos do jogo
-        self.jogador.atualizar()
+        self.jogador.atualizar(teclas)
         self.gerenciador_obstaculos.atualizar(self.pontuacao, self.multiplicador_turbo)
+        if self.particulas is not None:
+            self.particulas.atualizar()
         
         # Atualizar pontuação (1 ponto por segundo)
-        if self.tempo_jogo % 60 == 0:
+        if self.tempo_jogo % self.taxa_simulacao == 0:
             self.pontuacao += 1
         
         # Verificar colisões
-        if self.gerenciador_obstaculos.verificar_colisao(self.jogador.get_rect()):
+        colisao = self.gerenciador_obstaculos.consultar_colisao(self.jogador.get_rect())
+        if colisao is not None:
             if not self.jogador.invencivel:
-                self.game_over = True
+                self.obstaculo_colisao = colisao
+                self.fim_de_partida(
+                    'obstaculo_' + self.gerenciador_obstaculos.tipo_obstaculo(colisao))
                 return None
         
         # Manter jogador na tela
         if self.jogador.posicao[1] < 0 or self.jogador.posicao[1] > self.altura - self.jogador.tamanho:
             if not self.jogador.invencivel:
-                self.game_over = True
+                self.fim_de_partida('limite_tela')
                 return None
         
         return None
     
-    def desenhar(self):
-        """Desenha todos os elementos da partida"""
-        # O fundo já é desenhado no main.py
-        # Desenhar elementos do jogo
-        self.gerenciador_obstaculos.desenhar()
-        self.jogador.desenhar()
-        
-        # Obter cores da fase atual
+    def desenhar_fundo(self, retangulos=None):
+        """Desenha o fundo em cache da partida (inteiro ou sob os retângulos)"""
         cores_fase = self.cores_fases[self.fase - 1]
+        cache_fundo.desenhar(self.tela, 'partida', cores_fase,
+                             lambda superficie: superficie.fill(cores_fase['fundo']),
+                             retangulos)
+    
+    def retangulos_para_limpar(self):
+        """Regiões onde o fundo deve ser restaurado antes do próximo desenho"""
+        if self.retangulos_anteriores is None:
+            return None
+        return list(self.retangulos_anteriores.values()) + self.hud.regioes
+    
+    def retangulos_alterados(self):
+        """Retângulos alterados pelo último desenhar (None = tela inteira)"""
+        atuais = dict(self.gerenciador_obstaculos.retangulos_desenho())
+        atuais['jogador'] = self.jogador.rect_desenho
+        if self.particulas is not None and self.particulas.rect_desenho is not None:
+            atuais['particulas'] = self.particulas.rect_desenho
+        
+        anteriores = self.retangulos_anteriores
+        self.retangulos_anteriores = atuais
+        if anteriores is None or self.game_over:
+            return None
         
-        # Desenhar interface
-        texto_pontuacao = Texto(
-            self.tela, f"Score: {self.pontuacao}", 
-            20, 20, cores_fase['texto'], 36
-        )
-        texto_pontuacao.desenhar()
-        
-        texto_fase = Texto(
-            self.tela, f"Fase: {self.fase} - Nível: {self.nivel_atual}",
-            self.largura // 2, 60, cores_fase['texto'], 24, centralizado=True
-        )
-        texto_fase.desenhar()
-        
-        # Mostrar velocidade da fase
-        texto_velocidade = Texto(
-            self.tela, f"Velocidade: {self.velocidade_base:.1f}x",
-            self.largura - 200, 20, cores_fase['texto'], 20
-        )
-        texto_velocidade.desenhar()
-        
-        texto_multiplicador = Texto(
-            self.tela, f"Turbo: {self.multiplicador_turbo:.1f}x",
-            self.largura // 2, 20, cores_fase['texto'], 24, centralizado=True
-        )
-        texto_multiplicador.desenhar()
-        
-        # Indicador de invencibilidade
-        if self.jogador.invencivel:
-            texto_invencivel = Texto(
-                self.tela, "INVENCIBILIDADE!",
-                self.largura // 2, 90,
-                (255, 255, 100), 20, centralizado=True
-            )
-            texto_invencivel.desenhar()
-        
-        # Instruções
-        texto_instrucoes = Texto(
-            self.tela, "Espaço: Turbo | ESC: Selecionar Fase",
-            self.largura // 2, self.altura - 20,
-            (150, 150, 150), 16, centralizado=True
-        )
-        texto_instrucoes.desenhar()
-        
-        # Indicador de progresso para próximo nível
-        pontos_restantes = max(0, self.pontos_para_progresso - (self.pontuacao - self.progresso_atual))
-        progresso = min((self.pontuacao - self.progresso_atual) / self.pontos_para_progresso, 1.0)
-        
-        # Barra de progresso
-        barra_largura = 200
-        barra_altura = 10
-        barra_x = self.largura // 2 - barra_largura // 2
-        barra_y = 100
-        
-        # Fundo da barra
-        pygame.draw.rect(self.tela, (50, 50, 50), 
-                       (barra_x, barra_y, barra_largura, barra_altura))
+        # Juntar posição antiga e nova de cada objeto quando elas se sobrepõem
+        retangulos = []
+        for chave, rect in atuais.items():
+            anterior = anteriores.pop(chave, None)
+            if anterior is None:
+                retangulos.append(rect)
+            elif rect.colliderect(anterior):
+                retangulos.append(rect.union(anterior))
+            else:
+                retangulos.append(rect)
+                retangulos.append(anterior)
         
-        # Barra de progresso
-        cor_progresso = (
-            int(255 * (1 - progresso)),
-            int(255 * progresso),
-            100
-        )
-        pygame.draw.rect(self.tela, cor_progresso, 
-                       (barra_x, barra_y, int(barra_largura * progresso), barra_altura))
-        
-        # Texto do próximo nível
-        texto_proximo_nivel = Texto(
-            self.tela, f"Próximo nível: {pontos_restantes} pontos",
-            self.largura // 2, barra_y + 20,
-            cores_fase['texto'], 16, centralizado=True
-        )
-        texto_proximo_nivel.desenhar()
+        # Objetos que sumiram e widgets do HUD que mudaram
+        retangulos.extend(anteriores.values())
+        retangulos.extend(self.hud.retangulos_alterados)
+        return retangulos
+    
+    def desenhar(self, alfa=1.0):
+        """Desenha todos os elementos da partida (alfa interpola entre os passos)"""
+        # O fundo já é desenhado por desenhar_fundo
+        # Desenhar elementos do jogo
+        inicio = perfilador.inicio()
+        self.gerenciador_obstaculos.desenhar(alfa)
+        perfilador.acumular('obstaculos', inicio)
+        self.jogador.desenhar(alfa)
+        if not self.game_over:
+            self.desenhar_particulas(alfa)
+        
+        # Desenhar interface (HUD retido, só renderiza o que mudou)
+        inicio = perfilador.inicio()
+        self.hud.desenhar(self.tela)
+        perfilador.acumular('hud', inicio)
         
         # Se game over, mostrar mensagem
         if self.game_over:
-            overlay = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
+            if self.tela_game_over is None:
+                self.tela_game_over = self.criar_tela_game_over()
+            overlay, texto_game_over, texto_continuar = self.tela_game_over
             self.tela.blit(overlay, (0, 0))
-            
-            texto_game_over = Texto(
-                self.tela, "GAME OVER",
-                self.largura // 2, self.altura // 2 - 50,
-                (255, 80, 80), 64, centralizado=True
-            )
             texto_game_over.desenhar()
-            
-            texto_continuar = Texto(
-                self.tela, "Aguarde para continuar...",
-                self.largura // 2, self.altura // 2 + 20,
-                (200, 200, 200), 24, centralizado=True
-            )
             texto_continuar.desenhar()
+            
+            # Estilhaços da batida por cima da mensagem
+            self.desenhar_particulas(alfa)
+    
+    def criar_tela_game_over(self):
+        """Sombra e textos desenhados sobre o quadro da batida"""
+        overlay = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        texto_game_over = Texto(
+            self.tela, "GAME OVER",
+            self.largura // 2, self.altura // 2 - 50,
+            (255, 80, 80), 64, centralizado=True
+        )
+        texto_continuar = Texto(
+            self.tela, "Aguarde para continuar...",
+            self.largura // 2, self.altura // 2 + 20,
+            (200, 200, 200), 24, centralizado=True
+        )
+        return overlay, texto_game_over, texto_continuar
+    
+    def desenhar_particulas(self, alfa):
+        """Desenha as partículas (um único blits) medindo o tempo no perfilador"""
+        if self.particulas is None:
+            return
+        inicio = perfilador.inicio()
+        self.particulas.desenhar(alfa)
+        perfilador.acumular('particulas', inicio)
 
 class GameOver:
-    def __init__(self, tela, largura, altura, cores, dados):
+    def __init__(self, tela, largura, altura, cores, dados, taxa_simulacao=TAXA_REFERENCIA):
         self.tela = tela
         self.largura = largura
         self.altura = altura
         self.cores = cores
         
-        # Dados da partida
-        self.pontuacao = dados.get('pontuacao', 0)
-        self.high_score = dados.get('high_score', 0)
-        self.fase = dados.get('fase', 1)
-        
-        # Determinar nome da fase
-        if self.fase == 1:
-            self.nome_fase = "Fase 1 - Normal"
-            self.velocidade_texto = "1.0x"
-        elif self.fase == 2:
-            self.nome_fase = "Fase 2 - Rápida"
-            self.velocidade_texto = "1.5x"
-        else:
-            self.nome_fase = "Fase 3 - Extrema"
-            self.velocidade_texto = "2.0x"
-        
         # Criar botões (REMOVIDO botão de nova velocidade)
         self.botao_reiniciar = Botao(
             tela, "JOGAR NOVAMENTE",
@@ -473,85 +621,216 @@ class GameOver:
             (120, 120, 140)
         )
         
-        # Timer para evitar clique acidental
+        self.alvos = IndiceAlvos([self.botao_reiniciar, self.botao_menu])
+        
+        self.escala_tempo = TAXA_REFERENCIA / taxa_simulacao
+        self.entrar(dados)
+    
+    def entrar(self, dados=None):
+        """Chamado pelo gerenciador de cenas com o resultado da partida"""
+        dados = dados or {}
+        
+        # Dados da partida
+        self.pontuacao = dados.get('pontuacao', 0)
+        self.high_score = dados.get('high_score', 0)
+        self.fase = dados.get('fase', 1)
+        
+        # Nome e velocidade da fase
+        tabela = obter_fase(self.fase)
+        self.nome_fase = tabela.nome
+        self.velocidade_texto = tabela.velocidade_texto
+        
+        self.alvos.resetar()
+        
+        # Estilhaços da batida trazidos da partida (None sem efeitos)
+        self.particulas = dados.get('particulas')
+        
+        # Timer para evitar clique acidental (em quadros de referência)
         self.timer = 30  # 0.5 segundos
+        self.texto_aguarde = None  # Refeito só quando o décimo de segundo exibido muda
     
-    def atualizar(self):
-        """Atualiza a tela de game over"""
-        # Evitar clique acidental imediato
+    def atualizar(self, entrada):
+        """Atualiza a tela de game over com a entrada do passo"""
+        if self.particulas is not None:
+            self.particulas.atualizar()
+        
+        # Evitar clique acidental imediato (cliques durante a espera são descartados)
         if self.timer > 0:
-            self.timer -= 1
+            self.timer = max(0, self.timer - self.escala_tempo)
             return None
-            
-        if self.botao_reiniciar.atualizar():
+        
+        clicado = self.alvos.despachar(entrada)
+        if clicado is self.botao_reiniciar:
             return ('partida', {'fase': self.fase})
         
-        if self.botao_menu.atualizar():
+        if clicado is self.botao_menu:
             return ('selecao_fase', None)
         
         return None
     
-    def desenhar(self):
-        """Desenha a tela de game over"""
+    def construir_fundo(self, superficie):
+        """Desenha as partes estáticas da tela de game over"""
+        superficie.fill(self.cores['fundo'])
+        
         # Fundo escurecido
         overlay = pygame.Surface((self.largura, self.altura), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 150))
-        self.tela.blit(overlay, (0, 0))
+        superficie.blit(overlay, (0, 0))
         
         # Textos
         texto_game_over = Texto(
-            self.tela, "GAME OVER",
+            superficie, "GAME OVER",
             self.largura // 2, self.altura // 3,
             (255, 80, 80), 72, centralizado=True
         )
         texto_game_over.desenhar()
         
         texto_pontuacao = Texto(
-            self.tela, f"Score: {self.pontuacao}",
+            superficie, f"Score: {self.pontuacao}",
             self.largura // 2, self.altura // 2 - 60,
             self.cores['texto'], 36, centralizado=True
         )
         texto_pontuacao.desenhar()
         
         texto_fase = Texto(
-            self.tela, f"Fase: {self.nome_fase}",
+            superficie, f"Fase: {self.nome_fase}",
             self.largura // 2, self.altura // 2 - 30,
             (255, 220, 100), 28, centralizado=True
         )
         texto_fase.desenhar()
         
         texto_velocidade = Texto(
-            self.tela, f"Velocidade: {self.velocidade_texto}",
+            superficie, f"Velocidade: {self.velocidade_texto}",
             self.largura // 2, self.altura // 2,
             (255, 255, 100), 30, centralizado=True
         )
         texto_velocidade.desenhar()
         
         texto_high_score = Texto(
-            self.tela, f"High Score: {self.high_score}",
+            superficie, f"High Score: {self.high_score}",
             self.largura // 2, self.altura // 2 + 30,
             (255, 255, 100), 30, centralizado=True
         )
         texto_high_score.desenhar()
         
-        # Desenhar botões
-        self.botao_reiniciar.desenhar()
-        self.botao_menu.desenhar()
-        
-        # Indicador de timer
-        if self.timer > 0:
-            texto_aguarde = Texto(
-                self.tela, f"Aguarde... {self.timer/60:.1f}s",
-                self.largura // 2, self.altura // 2 + 180,
-                (200, 200, 200), 20, centralizado=True
-            )
-            texto_aguarde.desenhar()
-        
         # Novo recorde
         if self.pontuacao == self.high_score and self.pontuacao > 0:
             novo_record = Texto(
-                self.tela, "NOVO RECORD!",
+                superficie, "NOVO RECORD!",
                 self.largura // 2, self.altura // 2 + 210,
                 (255, 255, 100), 28, centralizado=True
             )
-            novo_record.desenhar()
\ No newline at end of file
+            novo_record.desenhar()
+    
+    def desenhar_fundo(self):
+        """Desenha o fundo em cache da tela de game over"""
+        # Pontuação faz parte da chave, pois os textos do resultado estão no fundo
+        paleta = (self.cores, self.pontuacao, self.high_score, self.fase)
+        cache_fundo.desenhar(self.tela, 'game_over', paleta, self.construir_fundo)
+    
+    def desenhar(self, alfa=1.0):
+        """Desenha a tela de game over"""
+        # Desenhar botões
+        self.botao_reiniciar.desenhar()
+        self.botao_menu.desenhar()
+        
+        # Indicador de timer
+        if self.timer > 0:
+            mensagem = f"Aguarde... {self.timer/60:.1f}s"
+            if self.texto_aguarde is None or self.texto_aguarde.texto != mensagem:
+                self.texto_aguarde = Texto(
+                    self.tela, mensagem,
+                    self.largura // 2, self.altura // 2 + 180,
+                    (200, 200, 200), 20, centralizado=True
+                )
+            self.texto_aguarde.desenhar()
+        
+        # Estilhaços da batida por cima dos botões
+        if self.particulas is not None:
+            self.particulas.desenhar(alfa)
+
+class GerenciadorCenas:
+    """Constrói cada cena uma única vez e a reaproveita nas transições
+    
+    As cenas são criadas pelas fábricas (nome -> função(chave) -> cena) e, ao
+    entrar de novo, só passam pelo seu método entrar(dados). A chave separa
+    variações da mesma cena (por exemplo, uma Partida por fase).
+    """
+    
+    def __init__(self, fabricas):
+        self.fabricas = fabricas
+        self.cenas = {}
+        
+        # Métricas das transições
+        self.construcoes = 0
+        # nome -> [transições, soma, máxima] em segundos, sem guardar cada medida
+        self.latencias = {}  # entrar
+        self.latencias_quadro = {}  # até o primeiro quadro
+        self.transicao_pendente = None
+    
+    def obter(self, nome, chave=None):
+        """Retorna a cena, construindo-a na primeira vez"""
+        cena = self.cenas.get((nome, chave))
+        if cena is None:
+            cena = self.fabricas[nome](chave)
+            self.cenas[(nome, chave)] = cena
+            self.construcoes += 1
+        return cena
+    
+    def pre_aquecer(self, cenas):
+        """Constrói antecipadamente as cenas [(nome, chave), ...]"""
+        for nome, chave in cenas:
+            self.obter(nome, chave)
+    
+    def entrar(self, nome, dados=None, chave=None):
+        """Prepara a cena para ser exibida e mede quanto isso levou"""
+        inicio = time.perf_counter()
+        cena = self.obter(nome, chave)
+        cena.entrar(dados)
+        self.acumular(self.latencias, nome, time.perf_counter() - inicio)
+        self.transicao_pendente = (nome, inicio)
+        return cena
+    
+    def concluir_transicao(self):
+        """Chamado após apresentar um quadro: fecha a medida da última transição"""
+        if self.transicao_pendente is None:
+            return
+        nome, inicio = self.transicao_pendente
+        self.acumular(self.latencias_quadro, nome, time.perf_counter() - inicio)
+        self.transicao_pendente = None
+    
+    @staticmethod
+    def acumular(tabela, nome, segundos):
+        """Soma uma medida aos totais da cena (contagem, soma e máxima)"""
+        totais = tabela.get(nome)
+        if totais is None:
+            tabela[nome] = [1, segundos, segundos]
+        else:
+            totais[0] += 1
+            totais[1] += segundos
+            totais[2] = max(totais[2], segundos)
+    
+    def fechar(self):
+        """Libera as cenas construídas (as que têm recursos a encerrar)"""
+        for cena in self.cenas.values():
+            if hasattr(cena, 'fechar'):
+                cena.fechar()
+        self.cenas.clear()
+    
+    def estatisticas(self):
+        """Latências (ms) de entrada e até o primeiro quadro, por cena"""
+        por_cena = {}
+        for nome, (transicoes, soma, maxima) in self.latencias.items():
+            quadros, soma_quadro, maxima_quadro = self.latencias_quadro.get(nome, (0, 0.0, 0.0))
+            por_cena[nome] = {
+                'transicoes': transicoes,
+                'entrar_media_ms': 1000 * soma / transicoes,
+                'entrar_maxima_ms': 1000 * maxima,
+                'quadro_media_ms': 1000 * soma_quadro / quadros if quadros else 0.0,
+                'quadro_maxima_ms': 1000 * maxima_quadro
+            }
+        return {
+            'cenas': len(self.cenas),
+            'construcoes': self.construcoes,
+            'por_cena': por_cena
+        }
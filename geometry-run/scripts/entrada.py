@@ -0,0 +1,138 @@
+"""Entrada do jogo: um retrato imutável por passo de simulação
+
+O loop principal entrega cada evento do pygame ao ColetorEntrada, que junta
+posição do mouse, cliques e teclas apertadas até o próximo passo. Cada passo
+recebe um EstadoEntrada com tudo isso, então nenhum clique entre dois quadros
+se perde e as cenas não consultam o pygame diretamente. Partidas headless e
+replays montam o EstadoEntrada elas mesmas.
+"""
+from collections import namedtuple
+import pygame
+
+# Posição usada quando o mouse está fora da janela (não acerta nenhum alvo)
+FORA_DA_TELA = (-1, -1)
+
+
+class EstadoTeclas:
+    """Estado do teclado compatível com pygame.key.get_pressed()"""
+
+    def __init__(self, pressionadas=()):
+        self.pressionadas = frozenset(pressionadas)
+
+    def __getitem__(self, tecla):
+        return tecla in self.pressionadas
+
+
+# Nenhuma tecla pressionada
+SEM_TECLAS = EstadoTeclas()
+
+
+class EstadoEntrada(namedtuple('EstadoEntrada', ('teclas', 'mouse', 'cliques',
+                                                 'teclas_apertadas'))):
+    """Entrada de um passo
+
+    teclas: teclas pressionadas (como pygame.key.get_pressed())
+    mouse: posição do cursor
+    cliques: posições dos cliques do botão esquerdo desde o passo anterior
+    teclas_apertadas: teclas apertadas (KEYDOWN) desde o passo anterior
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def de_teclas(cls, teclas):
+        """Entrada só de teclado (partidas headless e replays)"""
+        return cls(teclas, FORA_DA_TELA, (), ())
+
+
+# Nenhuma entrada
+ENTRADA_VAZIA = EstadoEntrada.de_teclas(SEM_TECLAS)
+
+
+class ColetorEntrada:
+    """Acumula os eventos do pygame e monta o EstadoEntrada de cada passo"""
+
+    def __init__(self):
+        # Antes do primeiro movimento não há evento com a posição do cursor
+        self.mouse = pygame.mouse.get_pos() if pygame.mouse.get_focused() else FORA_DA_TELA
+        self.cliques = []
+        self.teclas_apertadas = []
+
+    def processar(self, evento):
+        """Registra um evento vindo de pygame.event.get()"""
+        tipo = evento.type
+        if tipo == pygame.MOUSEMOTION:
+            self.mouse = evento.pos
+        elif tipo == pygame.MOUSEBUTTONDOWN:
+            self.mouse = evento.pos
+            if evento.button == 1:
+                self.cliques.append(evento.pos)
+        elif tipo == pygame.KEYDOWN:
+            self.teclas_apertadas.append(evento.key)
+        elif tipo == pygame.WINDOWLEAVE:
+            self.mouse = FORA_DA_TELA
+
+    def capturar(self, teclas=None):
+        """Entrada do próximo passo; cliques e teclas apertadas são consumidos"""
+        if teclas is None:
+            teclas = pygame.key.get_pressed()
+        estado = EstadoEntrada(teclas, self.mouse, tuple(self.cliques),
+                               tuple(self.teclas_apertadas))
+        self.cliques.clear()
+        self.teclas_apertadas.clear()
+        return estado
+
+
+class IndiceAlvos:
+    """Grade com os alvos (widgets com rect) de uma cena, para o teste de acerto
+
+    Cada ponto consulta só os alvos da sua célula. Os alvos recebem
+    definir_hover() apenas quando o cursor entra ou sai deles.
+    """
+
+    def __init__(self, alvos=(), tamanho_celula=64):
+        self.tamanho_celula = tamanho_celula
+        self.celulas = {}  # (coluna, linha) -> alvos, do mais antigo ao mais novo
+        self.alvos = []
+        self.sobre = None  # Alvo sob o cursor no último despacho
+        for alvo in alvos:
+            self.adicionar(alvo)
+
+    def adicionar(self, alvo):
+        """Registra o alvo em todas as células que o retângulo dele toca"""
+        rect = alvo.rect
+        tamanho = self.tamanho_celula
+        for coluna in range(rect.left // tamanho, (rect.right - 1) // tamanho + 1):
+            for linha in range(rect.top // tamanho, (rect.bottom - 1) // tamanho + 1):
+                self.celulas.setdefault((coluna, linha), []).append(alvo)
+        self.alvos.append(alvo)
+
+    def consultar(self, ponto):
+        """Alvo no ponto (o registrado por último, se houver sobreposição) ou None"""
+        tamanho = self.tamanho_celula
+        for alvo in reversed(self.celulas.get((ponto[0] // tamanho, ponto[1] // tamanho), ())):
+            if alvo.rect.collidepoint(ponto):
+                return alvo
+        return None
+
+    def despachar(self, entrada):
+        """Atualiza o hover e retorna o alvo do primeiro clique do passo (ou None)"""
+        sobre = self.consultar(entrada.mouse)
+        if sobre is not self.sobre:
+            if self.sobre is not None:
+                self.sobre.definir_hover(False)
+            if sobre is not None:
+                sobre.definir_hover(True)
+            self.sobre = sobre
+
+        for clique in entrada.cliques:
+            alvo = self.consultar(clique)
+            if alvo is not None:
+                return alvo
+        return None
+
+    def resetar(self):
+        """Volta todos os alvos ao estado inicial (sem hover)"""
+        for alvo in self.alvos:
+            alvo.resetar()
+        self.sobre = None
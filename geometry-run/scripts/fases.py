@@ -0,0 +1,165 @@
+"""Tabela das fases: tudo o que muda de uma fase para outra em um só lugar
+
+Cada fase é um registro imutável (namedtuple, sem __dict__ por instância) com
+as regras, os textos, as cores e a tabela de cor dos obstáculos por coluna x.
+Uma fase nova é só mais um registro em FASES.
+"""
+from collections import namedtuple
+from types import MappingProxyType
+
+# Largura de tela para a qual as tabelas de cor são montadas
+LARGURA_REFERENCIA = 800
+
+# Níveis do gradiente dos obstáculos ao atravessar a tela (poucos níveis = poucos
+# corpos diferentes no atlas de obstáculos); padrão de configurar_niveis_cor
+NIVEIS_COR = 16
+
+# Colunas fora da tela cobertas pela tabela de cor, de cada lado
+MARGEM_LUT = LARGURA_REFERENCIA
+
+Fase = namedtuple('Fase', (
+    'numero',
+    # Textos
+    'titulo_botao', 'nome', 'descricao', 'detalhes', 'velocidade_texto', 'cor_indicador',
+    # Regras
+    'velocidade_base', 'pontos_para_progresso', 'multiplicador_obstaculos',
+    'faixa_largura', 'faixa_altura', 'faixa_vao',
+    # Cores
+    'cores', 'cor_obstaculo', 'cor_borda_obstaculo', 'lut_cor'
+))
+
+
+def gradiente(inicio, amplitude, montar):
+    """Cor do obstáculo em função da fração da tela já percorrida (0 a 1)"""
+    def cor(fracao):
+        return montar(min(255, inicio + int(fracao * amplitude)))
+    return cor
+
+
+def construir_lut_cor(cor_fracao, largura=LARGURA_REFERENCIA, niveis=NIVEIS_COR,
+                      margem=MARGEM_LUT):
+    """Cor já quantizada de cada coluna x, de -margem a largura + margem - 1"""
+    return tuple(cor_fracao(round(x / largura * niveis) / niveis)
+                 for x in range(-margem, largura + margem))
+
+
+# Gradiente de cor de cada fase, para montar de novo as tabelas de cor
+_gradientes = {}
+
+
+def criar_fase(numero, cores, cor_gradiente, **campos):
+    """Monta o registro da fase, com a paleta somente leitura e a tabela de cor"""
+    _gradientes[numero] = cor_gradiente
+    return Fase(numero=numero, cores=MappingProxyType(dict(cores)),
+                lut_cor=construir_lut_cor(cor_gradiente), **campos)
+
+
+FASES = (
+    criar_fase(
+        1,
+        titulo_botao="FASE 1 - NORMAL",
+        nome="Fase 1 - Normal",
+        descricao="Fase 1 - Velocidade Normal",
+        detalhes="Velocidade: 1.0x - Dificuldade para iniciantes",
+        velocidade_texto="1.0x",
+        cor_indicador=(100, 200, 255),
+        velocidade_base=1.0,
+        pontos_para_progresso=30,
+        multiplicador_obstaculos=1.0,
+        faixa_largura=(30, 80),
+        faixa_altura=(60, 200),
+        faixa_vao=(140, 180),
+        cores={
+            'fundo': (15, 20, 35),      # Azul escuro
+            'jogador': (0, 200, 255),
+            'obstaculo': (255, 100, 100),
+            'texto': (240, 240, 240),
+            'ui_bg': (30, 40, 60),
+            'botao': (40, 120, 180),
+            'botao_hover': (60, 160, 220)
+        },
+        cor_obstaculo=(255, 100, 100),
+        cor_borda_obstaculo=(255, 150, 150),
+        cor_gradiente=gradiente(100, 155, lambda i: (i, 100, 100))
+    ),
+    criar_fase(
+        2,
+        titulo_botao="FASE 2 - RÁPIDA",
+        nome="Fase 2 - Rápida",
+        descricao="Fase 2 - Velocidade Rápida",
+        detalhes="Velocidade: 1.5x - Para jogadores experientes",
+        velocidade_texto="1.5x",
+        cor_indicador=(255, 200, 100),
+        velocidade_base=1.5,
+        pontos_para_progresso=40,
+        multiplicador_obstaculos=1.2,
+        faixa_largura=(35, 85),  # Um pouco mais largo
+        faixa_altura=(60, 200),
+        faixa_vao=(130, 170),
+        cores={
+            'fundo': (35, 15, 20),      # Vermelho escuro
+            'jogador': (100, 255, 200),
+            'obstaculo': (255, 200, 100),
+            'texto': (240, 240, 240),
+            'ui_bg': (50, 30, 40),
+            'botao': (180, 80, 100),
+            'botao_hover': (200, 100, 120)
+        },
+        cor_obstaculo=(255, 200, 100),
+        cor_borda_obstaculo=(255, 220, 150),
+        cor_gradiente=gradiente(150, 105, lambda i: (i, i // 2, 100))
+    ),
+    criar_fase(
+        3,
+        titulo_botao="FASE 3 - EXTREMA",
+        nome="Fase 3 - Extrema",
+        descricao="Fase 3 - Velocidade Extrema",
+        detalhes="Velocidade: 2.0x - Apenas para os mais corajosos!",
+        velocidade_texto="2.0x",
+        cor_indicador=(255, 100, 100),
+        velocidade_base=2.0,
+        pontos_para_progresso=50,
+        multiplicador_obstaculos=1.5,
+        faixa_largura=(35, 85),
+        faixa_altura=(70, 210),  # Um pouco mais alto
+        faixa_vao=(120, 160),
+        cores={
+            'fundo': (15, 35, 20),      # Verde escuro
+            'jogador': (255, 150, 50),
+            'obstaculo': (150, 100, 255),
+            'texto': (240, 240, 240),
+            'ui_bg': (30, 50, 40),
+            'botao': (80, 160, 100),
+            'botao_hover': (100, 180, 120)
+        },
+        cor_obstaculo=(150, 100, 255),
+        cor_borda_obstaculo=(180, 150, 255),
+        cor_gradiente=gradiente(100, 155, lambda i: (100, 100, i))
+    )
+)
+
+# Paletas e números de todas as fases, na ordem da tabela
+CORES_FASES = tuple(fase.cores for fase in FASES)
+NUMEROS_FASES = tuple(fase.numero for fase in FASES)
+
+
+# Níveis usados nas tabelas de cor atuais
+niveis_cor = NIVEIS_COR
+
+
+def obter_fase(numero):
+    """Registro da fase pelo número (1, 2, 3...)"""
+    return FASES[numero - 1]
+
+
+def configurar_niveis_cor(niveis):
+    """Monta de novo a tabela de cor de cada fase com outro número de níveis
+
+    Mais níveis deixam o gradiente mais suave e o atlas de obstáculos maior.
+    Os registros são trocados em FASES: leia-os de novo por obter_fase.
+    """
+    global FASES, niveis_cor
+    niveis_cor = max(1, niveis)
+    FASES = tuple(fase._replace(lut_cor=construir_lut_cor(_gradientes[fase.numero],
+                                                          niveis=niveis_cor))
+                  for fase in FASES)
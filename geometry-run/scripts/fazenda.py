@@ -0,0 +1,233 @@
+"""Fazenda de partidas headless em vários processos, jogadas por um bot simples
+
+Roda milhares de partidas com sementes fixas em todos os núcleos e resume as
+distribuições de pontuação, nível alcançado e causa do fim por fase. Serve para
+ajustar a dificuldade sem precisar jogar à mão.
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.fazenda --partidas 2000 --fases 1 2 3 --saida resultado.json
+    python -m scripts.fazenda --partidas 400 --escalonamento
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from collections import Counter
+import pygame
+from scripts.fases import NUMEROS_FASES
+from scripts.headless import EstadoTeclas, ExecutorHeadless, SEM_TECLAS
+from scripts.perfilador import percentil
+
+# Limite padrão de passos por partida (5 minutos a 60 passos por segundo)
+MAX_PASSOS = 5 * 60 * 60
+
+# Bot padrão: decide a cada 4 passos e erra a mira com desvio de 30 px, o que
+# espalha pontuação, nível e causa do fim (um bot perfeito quase nunca bate)
+REACAO_PADRAO = 4
+ERRO_PADRAO = 30.0
+
+TECLAS_CIMA = EstadoTeclas((pygame.K_UP,))
+TECLAS_BAIXO = EstadoTeclas((pygame.K_DOWN,))
+
+
+class BotVao:
+    """Política simples: mira o centro do vão do próximo par de obstáculos
+
+    reacao é o intervalo, em passos, entre duas decisões; no meio tempo o bot
+    mantém a última decisão (valores maiores deixam o bot mais lento). erro é
+    o desvio padrão (px) do ruído somado ao alvo em cada decisão, sorteado
+    com a semente informada (a mesma semente repete as mesmas decisões).
+    """
+
+    def __init__(self, partida, zona_morta=6, reacao=REACAO_PADRAO, erro=ERRO_PADRAO,
+                 semente=None):
+        self.partida = partida
+        self.zona_morta = zona_morta
+        self.reacao = reacao
+        self.erro = erro
+        self.aleatorio = random.Random(semente)
+        self.decisao = SEM_TECLAS
+
+    def alvo(self):
+        """Altura (y) do centro do vão à frente do jogador"""
+        jogador = self.partida.jogador.rect
+        altura = self.partida.altura
+        a_frente = [rect for rect in self.partida.gerenciador_obstaculos.retangulos_colisao()
+                    if rect.right >= jogador.left]
+        if not a_frente:
+            return altura // 2
+
+        # Os dois obstáculos de um par nascem juntos e têm sempre o mesmo x
+        x_proximo = min(rect.x for rect in a_frente)
+        par = [rect for rect in a_frente if rect.x <= x_proximo + 1]
+        topo = max((rect.bottom for rect in par if rect.top == 0), default=0)
+        base = min((rect.top for rect in par if rect.top > 0), default=altura)
+        return (topo + base) // 2
+
+    def teclas(self, passo):
+        """Estado do teclado no passo (mesma interface de EntradaRoteirizada)"""
+        if passo % self.reacao:
+            return self.decisao
+
+        alvo = self.alvo()
+        if self.erro:
+            alvo += self.aleatorio.gauss(0.0, self.erro)
+        diferenca = alvo - self.partida.jogador.rect.centery
+        if diferenca > self.zona_morta:
+            self.decisao = TECLAS_BAIXO
+        elif diferenca < -self.zona_morta:
+            self.decisao = TECLAS_CIMA
+        else:
+            self.decisao = SEM_TECLAS
+        return self.decisao
+
+
+def _silenciar():
+    """Inicializador dos processos: descarta as mensagens da Partida"""
+    sys.stdout = open(os.devnull, 'w')
+
+
+def jogar_partida(tarefa):
+    """Joga uma partida com o bot e retorna o resumo (executado nos processos)"""
+    fase, semente, max_passos, motor, reacao, erro = tarefa
+    executor = ExecutorHeadless(fase, motor_obstaculos=motor, semente=semente)
+    executor.entrada = BotVao(executor.partida, reacao=reacao, erro=erro, semente=semente)
+    resultado = executor.executar(max_passos)
+    partida = executor.partida
+    return {
+        'fase': fase,
+        'semente': semente,
+        'pontuacao': partida.pontuacao,
+        'nivel': partida.nivel_atual,
+        'causa': partida.causa_fim if resultado['game_over'] else 'tempo_esgotado',
+        'passos': resultado['passos']
+    }
+
+
+def resumir(resultados):
+    """Distribuições de pontuação, nível e causa do fim de uma fase"""
+    pontuacoes = sorted(resultado['pontuacao'] for resultado in resultados)
+    return {
+        'partidas': len(resultados),
+        'pontuacao': {
+            'media': sum(pontuacoes) / len(pontuacoes),
+            'p10': percentil(pontuacoes, 10),
+            'p50': percentil(pontuacoes, 50),
+            'p90': percentil(pontuacoes, 90),
+            'maximo': pontuacoes[-1],
+            'histograma': dict(sorted(Counter(pontuacoes).items()))
+        },
+        'nivel': dict(sorted(Counter(resultado['nivel'] for resultado in resultados).items())),
+        'causas': dict(Counter(resultado['causa'] for resultado in resultados).most_common()),
+        'passos_medios': sum(resultado['passos'] for resultado in resultados) / len(resultados)
+    }
+
+
+def executar_fazenda(fases=NUMEROS_FASES, partidas=1000, processos=None, semente_base=0,
+                     max_passos=MAX_PASSOS, motor='lista', reacao=REACAO_PADRAO,
+                     erro=ERRO_PADRAO):
+    """Joga as partidas de cada fase em paralelo; retorna o relatório agregado"""
+    processos = processos or os.cpu_count() or 1
+    # As mesmas sementes em todas as fases, para comparar as fases entre si
+    tarefas = [(fase, semente_base + i, max_passos, motor, reacao, erro)
+               for fase in fases for i in range(partidas)]
+    tamanho_lote = max(1, len(tarefas) // (processos * 8))
+
+    inicio = time.perf_counter()
+    with multiprocessing.Pool(processos, initializer=_silenciar) as pool:
+        resultados = list(pool.imap_unordered(jogar_partida, tarefas, tamanho_lote))
+    duracao = time.perf_counter() - inicio
+
+    por_fase = {fase: [] for fase in fases}
+    for resultado in resultados:
+        por_fase[resultado['fase']].append(resultado)
+
+    return {
+        'processos': processos,
+        'partidas': len(resultados),
+        'segundos': duracao,
+        'partidas_por_segundo': len(resultados) / duracao if duracao > 0 else float('inf'),
+        'fases': {fase: resumir(lista) for fase, lista in por_fase.items() if lista}
+    }
+
+
+def imprimir(relatorio):
+    """Resumo legível do relatório"""
+    print(f"{relatorio['partidas']} partidas em {relatorio['segundos']:.2f}s com "
+          f"{relatorio['processos']} processo(s): "
+          f"{relatorio['partidas_por_segundo']:.1f} partidas/s")
+    for fase, resumo in relatorio['fases'].items():
+        pontuacao = resumo['pontuacao']
+        print(f"\nFase {fase} ({resumo['partidas']} partidas, "
+              f"{resumo['passos_medios']:.0f} passos em média)")
+        print(f"  pontuação: média {pontuacao['media']:.1f}  p10 {pontuacao['p10']}  "
+              f"p50 {pontuacao['p50']}  p90 {pontuacao['p90']}  máx {pontuacao['maximo']}")
+        print("  nível:     " + "  ".join(f"{nivel}: {quantidade}"
+                                         for nivel, quantidade in resumo['nivel'].items()))
+        print("  causas:    " + "  ".join(f"{causa}: {quantidade}"
+                                         for causa, quantidade in resumo['causas'].items()))
+
+
+def medir_escalonamento(fases, partidas, semente_base, max_passos, motor, reacao, erro):
+    """Vazão com 1, 2, 4... processos até o número de núcleos"""
+    nucleos = os.cpu_count() or 1
+    quantidades = [1]
+    while quantidades[-1] * 2 <= nucleos:
+        quantidades.append(quantidades[-1] * 2)
+    if quantidades[-1] != nucleos:
+        quantidades.append(nucleos)
+
+    print(f"{'processos':>9} | {'partidas/s':>10} | {'ganho':>6} | {'eficiência':>10}")
+    print("-" * 46)
+    base = None
+    for processos in quantidades:
+        relatorio = executar_fazenda(fases, partidas, processos, semente_base, max_passos,
+                                     motor, reacao, erro)
+        vazao = relatorio['partidas_por_segundo']
+        base = base or vazao
+        print(f"{processos:>9} | {vazao:>10.1f} | {vazao / base:>5.2f}x | "
+              f"{100 * vazao / base / processos:>9.0f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fazenda de partidas headless com bot")
+    parser.add_argument('--fases', type=int, nargs='+', default=list(NUMEROS_FASES),
+                        choices=NUMEROS_FASES)
+    parser.add_argument('--partidas', type=int, default=1000, help="partidas por fase")
+    parser.add_argument('--processos', type=int, default=None,
+                        help="processos em paralelo (padrão: todos os núcleos)")
+    parser.add_argument('--semente', type=int, default=0, help="semente da primeira partida")
+    parser.add_argument('--max-passos', type=int, default=MAX_PASSOS)
+    parser.add_argument('--motor-numpy', action='store_true')
+    parser.add_argument('--reacao', type=int, default=REACAO_PADRAO,
+                        help="passos entre as decisões do bot (maior = bot mais lento; "
+                             f"padrão: {REACAO_PADRAO})")
+    parser.add_argument('--erro', type=float, default=ERRO_PADRAO,
+                        help="desvio padrão (px) do erro de mira do bot, sorteado pela "
+                             f"semente da partida (0 = mira exata; padrão: {ERRO_PADRAO:g})")
+    parser.add_argument('--saida', help="salva o relatório em JSON")
+    parser.add_argument('--escalonamento', action='store_true',
+                        help="mede a vazão com 1, 2, 4... processos")
+    args = parser.parse_args()
+    motor = 'numpy' if args.motor_numpy else 'lista'
+
+    if args.escalonamento:
+        medir_escalonamento(args.fases, args.partidas, args.semente, args.max_passos, motor,
+                            args.reacao, args.erro)
+        return
+
+    relatorio = executar_fazenda(args.fases, args.partidas, args.processos, args.semente,
+                                 args.max_passos, motor, args.reacao, args.erro)
+    imprimir(relatorio)
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+        print(f"\nRelatório salvo em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Fluxo de obstáculos pré-gerado: os próximos pares já sorteados antes do spawn
+
+O layout de cada par (posição e altura do vão e as duas larguras) vem do
+gerador semeado da partida, na mesma ordem de sorteios de sempre, mas em
+trechos de pares sorteados à frente por uma thread. O spawn só lê o próximo
+par de um array. A janela de trechos prontos é limitada, e qualquer trecho
+de uma partida pode ser gerado de novo a partir da semente (gerar_trecho).
+
+O instante de cada spawn não é pré-gerado: ele depende do intervalo de spawn,
+que diminui com a pontuação (e portanto com a entrada do jogador).
+"""
+import random
+import threading
+from array import array
+from collections import deque
+
+TAMANHO_TRECHO = 64  # Pares por trecho
+JANELA_TRECHOS = 4  # Trechos prontos à frente do trecho em uso
+
+# Valores por par no trecho: posição do vão, altura do vão, largura superior e inferior
+CAMPOS_PAR = 4
+
+
+def sortear_trecho(rng, fase, altura_tela, tamanho=TAMANHO_TRECHO):
+    """Sorteia os próximos pares com o gerador (na ordem de sorteios do jogo)"""
+    randint = rng.randint
+    menor_vao, maior_vao = fase.faixa_vao
+    menor_largura, maior_largura = fase.faixa_largura
+    valores = []
+    for _ in range(tamanho):
+        altura_vao = randint(menor_vao, maior_vao)
+        posicao_vao = randint(100, altura_tela - altura_vao - 100)
+        valores += (posicao_vao, altura_vao, randint(menor_largura, maior_largura),
+                    randint(menor_largura, maior_largura))
+    return array('i', valores)
+
+
+def gerar_trecho(semente, indice, fase, altura_tela, tamanho=TAMANHO_TRECHO):
+    """Gera de novo o trecho indice (0, 1, 2...) da partida com a semente informada"""
+    rng = random.Random(semente)
+    for _ in range(indice):
+        sortear_trecho(rng, fase, altura_tela, tamanho)
+    return sortear_trecho(rng, fase, altura_tela, tamanho)
+
+
+class FluxoObstaculos:
+    """Layouts dos próximos pares de obstáculos, sorteados em trechos à frente
+
+    A thread de preenchimento mantém até `janela` trechos prontos; se ela
+    atrasar, o próprio spawn sorteia o trecho que falta (o resultado é o mesmo,
+    pois os trechos saem do mesmo gerador, em ordem). Quem cria o fluxo em
+    segundo plano chama fechar ao descartá-lo.
+    """
+
+    def __init__(self, altura_tela, tamanho_trecho=TAMANHO_TRECHO, janela=JANELA_TRECHOS,
+                 em_segundo_plano=True):
+        self.altura_tela = altura_tela
+        self.tamanho_trecho = tamanho_trecho
+        self.janela = janela
+        self.em_segundo_plano = em_segundo_plano
+
+        # Gerador e trechos prontos, protegidos pela condição
+        self.condicao = threading.Condition()
+        self.rng = random.Random()
+        self.semente = None
+        self.fase = None  # Registro da fase cujas faixas são sorteadas
+        self.prontos = deque()
+        self.trechos_sorteados = 0
+        self.sorteios_no_spawn = 0  # Trechos que o spawn teve de sortear
+        self.preenchedor = None
+        self.encerrado = False
+
+        # Trecho em uso (lido sem trava pelo spawn)
+        self.trecho = array('i')
+        self.posicao = 0
+        self.pares_entregues = 0
+
+    def reiniciar(self, semente, fase):
+        """Começa o fluxo de uma nova partida (a thread já sorteia os primeiros trechos)"""
+        with self.condicao:
+            self.semente = semente
+            self.fase = fase
+            self.rng.seed(semente)
+            self.prontos.clear()
+            self.trechos_sorteados = 0
+            self.sorteios_no_spawn = 0
+            self.trecho = array('i')
+            self.condicao.notify()
+        self.posicao = 0
+        self.pares_entregues = 0
+
+        if self.em_segundo_plano and self.preenchedor is None:
+            self.preenchedor = threading.Thread(target=self._preencher_sempre,
+                                                name='fluxo_obstaculos', daemon=True)
+            self.preenchedor.start()
+
+    def _sortear(self):
+        """Sorteia o próximo trecho (com a condição adquirida)"""
+        self.prontos.append(sortear_trecho(self.rng, self.fase, self.altura_tela,
+                                           self.tamanho_trecho))
+        self.trechos_sorteados += 1
+
+    def _preencher_sempre(self):
+        """Loop da thread: completa a janela e dorme até um trecho ser consumido"""
+        while True:
+            with self.condicao:
+                while not self.encerrado and len(self.prontos) >= self.janela:
+                    self.condicao.wait()
+                if self.encerrado:
+                    return
+                self._sortear()  # Um trecho por vez, liberando a trava entre eles
+
+    def preencher(self):
+        """Completa a janela no próprio chamador (para usar em tempo ocioso)"""
+        with self.condicao:
+            while len(self.prontos) < self.janela:
+                self._sortear()
+
+    def proximo_par(self):
+        """Próximo par: (posição do vão, altura do vão, largura superior, largura inferior)"""
+        if self.posicao >= len(self.trecho):
+            self._avancar_trecho()
+        i = self.posicao
+        trecho = self.trecho
+        self.posicao = i + CAMPOS_PAR
+        self.pares_entregues += 1
+        return trecho[i], trecho[i + 1], trecho[i + 2], trecho[i + 3]
+
+    def _avancar_trecho(self):
+        """Passa para o próximo trecho pronto (sorteando-o se a thread atrasou)"""
+        with self.condicao:
+            if not self.prontos:
+                self._sortear()
+                self.sorteios_no_spawn += 1
+            self.trecho = self.prontos.popleft()
+            self.condicao.notify()
+        self.posicao = 0
+
+    def regenerar_par(self, indice):
+        """Layout do par indice (0, 1, 2...) desta partida, gerado de novo pela semente"""
+        trecho = gerar_trecho(self.semente, indice // self.tamanho_trecho, self.fase,
+                              self.altura_tela, self.tamanho_trecho)
+        i = (indice % self.tamanho_trecho) * CAMPOS_PAR
+        return tuple(trecho[i:i + CAMPOS_PAR])
+
+    def estatisticas(self):
+        """Pares entregues, trechos sorteados e prontos, e sorteios feitos no spawn"""
+        return {
+            'pares_entregues': self.pares_entregues,
+            'trechos_sorteados': self.trechos_sorteados,
+            'trechos_prontos': len(self.prontos),
+            'sorteios_no_spawn': self.sorteios_no_spawn
+        }
+
+    def fechar(self):
+        """Encerra a thread de preenchimento"""
+        with self.condicao:
+            self.encerrado = True
+            self.condicao.notify()
+        if self.preenchedor is not None:
+            self.preenchedor.join()
+            self.preenchedor = None
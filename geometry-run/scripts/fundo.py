@@ -0,0 +1,58 @@
+import pygame
+from collections.abc import Mapping
+
+
+def chave_paleta(cores):
+    """Converte uma paleta (dicionário ou lista de dicionários) em chave imutável"""
+    if isinstance(cores, Mapping):
+        return tuple(sorted((nome, tuple(cor)) for nome, cor in cores.items()))
+    if isinstance(cores, (list, tuple)):
+        return tuple(chave_paleta(item) for item in cores)
+    return cores
+
+
+class CacheFundo:
+    """Cache dos fundos estáticos das cenas (um por cena, resolução e paleta)"""
+
+    def __init__(self):
+        # nome da cena -> (chave, superfície)
+        self.fundos = {}
+        self.renderizacoes = 0
+
+    def obter(self, nome, tamanho, paleta, construir):
+        """Retorna o fundo da cena, construindo-o só quando a chave muda"""
+        chave = (tamanho, chave_paleta(paleta))
+        entrada = self.fundos.get(nome)
+        if entrada is not None and entrada[0] == chave:
+            return entrada[1]
+
+        superficie = pygame.Surface(tamanho)
+        construir(superficie)
+
+        # Converter para o formato da tela para blits mais rápidos
+        if pygame.display.get_surface() is not None:
+            superficie = superficie.convert()
+
+        self.fundos[nome] = (chave, superficie)
+        self.renderizacoes += 1
+        return superficie
+
+    def desenhar(self, tela, nome, paleta, construir, retangulos=None):
+        """Desenha o fundo da cena inteiro ou só sob os retângulos informados"""
+        fundo = self.obter(nome, tela.get_size(), paleta, construir)
+        if retangulos is None:
+            tela.blit(fundo, (0, 0))
+        else:
+            tela.blits([(fundo, rect, rect) for rect in retangulos], doreturn=False)
+        return fundo
+
+    def invalidar(self, nome=None):
+        """Descarta o fundo de uma cena (ou de todas)"""
+        if nome is None:
+            self.fundos.clear()
+        else:
+            self.fundos.pop(nome, None)
+
+
+# Cache compartilhado por todas as cenas
+cache_fundo = CacheFundo()
@@ -0,0 +1,152 @@
+"""Execução de partidas sem janela, com entrada roteirizada e sem limite de FPS
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.headless --fase 3 --ticks 100000 --roteiro "0-600:espaco,600-900:cima"
+"""
+import argparse
+import os
+import time
+import pygame
+from scripts.fases import CORES_FASES, NUMEROS_FASES
+from scripts.entrada import EstadoTeclas, EstadoEntrada, SEM_TECLAS
+
+# Nomes aceitos no roteiro e as teclas correspondentes
+TECLAS_ROTEIRO = {
+    'cima': pygame.K_UP,
+    'baixo': pygame.K_DOWN,
+    'esquerda': pygame.K_LEFT,
+    'direita': pygame.K_RIGHT,
+    'espaco': pygame.K_SPACE,
+    'turbo': pygame.K_SPACE
+}
+
+
+# Paleta usada quando nenhuma é informada (a mesma do jogo)
+CORES_PADRAO = CORES_FASES
+
+
+class EntradaRoteirizada:
+    """Entrada que substitui o teclado por um roteiro de teclas por passo
+
+    O roteiro pode ser uma função passo -> teclas pressionadas ou uma lista de
+    trechos (inicio, fim, teclas), com fim exclusivo.
+    """
+
+    def __init__(self, roteiro=None):
+        self.roteiro = roteiro or []
+        self._estados = {}
+
+    @classmethod
+    def de_texto(cls, texto):
+        """Cria o roteiro a partir de "inicio-fim:tecla+tecla,..." """
+        trechos = []
+        for trecho in filter(None, (parte.strip() for parte in texto.split(','))):
+            intervalo, nomes = trecho.split(':')
+            inicio, fim = (int(valor) for valor in intervalo.split('-'))
+            teclas = [TECLAS_ROTEIRO[nome.strip()] for nome in nomes.split('+')]
+            trechos.append((inicio, fim, teclas))
+        return cls(trechos)
+
+    def teclas(self, passo):
+        """Estado do teclado no passo informado"""
+        if callable(self.roteiro):
+            pressionadas = frozenset(self.roteiro(passo))
+        else:
+            pressionadas = frozenset(tecla
+                                     for inicio, fim, teclas in self.roteiro
+                                     if inicio <= passo < fim
+                                     for tecla in teclas)
+        if not pressionadas:
+            return SEM_TECLAS
+
+        # Reaproveitar o mesmo objeto para combinações repetidas
+        estado = self._estados.get(pressionadas)
+        if estado is None:
+            estado = self._estados[pressionadas] = EstadoTeclas(pressionadas)
+        return estado
+
+
+class ExecutorHeadless:
+    """Roda uma Partida o mais rápido possível, sem janela e sem ler o teclado"""
+
+    def __init__(self, fase=1, entrada=None, desenhar=False, largura=800, altura=600,
+                 motor_obstaculos='lista', taxa_simulacao=60, cores_fases=None,
+                 semente=None, gravador=None):
+        # Importado aqui para não carregar as cenas só por usar EntradaRoteirizada
+        from scripts.cenas import Partida
+
+        self.entrada = entrada or EntradaRoteirizada()
+        self.desenhar = desenhar
+
+        if desenhar:
+            # Driver de vídeo falso: as superfícies são convertidas como no jogo
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+            pygame.display.init()
+            pygame.font.init()
+            self.tela = pygame.display.set_mode((largura, altura))
+        else:
+            # Sem tela nenhuma: a superfície só existe para satisfazer a Partida
+            self.tela = pygame.Surface((largura, altura))
+
+        self.partida = Partida(self.tela, largura, altura, cores_fases or CORES_PADRAO,
+                               fase, motor_obstaculos, taxa_simulacao, semente, gravador,
+                               efeitos=desenhar, fluxo_em_segundo_plano=False)
+        self.passos = 0
+
+    def passo(self):
+        """Avança um passo de simulação; retorna True quando a partida acaba"""
+        resultado = self.partida.atualizar(
+            EstadoEntrada.de_teclas(self.entrada.teclas(self.passos)))
+        self.passos += 1
+        if self.desenhar:
+            self.partida.desenhar_fundo()
+            self.partida.desenhar()
+        return resultado is not None or self.partida.game_over
+
+    def executar(self, max_passos=None):
+        """Roda até o fim da partida (ou max_passos) e retorna as estatísticas"""
+        inicio = time.perf_counter()
+        terminou = False
+        while max_passos is None or self.passos < max_passos:
+            if self.passo():
+                terminou = True
+                break
+        duracao = time.perf_counter() - inicio
+
+        return {
+            'passos': self.passos,
+            'pontuacao': self.partida.pontuacao,
+            'nivel': self.partida.nivel_atual,
+            'game_over': terminou,
+            'segundos': duracao,
+            'passos_por_segundo': self.passos / duracao if duracao > 0 else float('inf')
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partida headless do Geometry Run")
+    parser.add_argument('--fase', type=int, default=1, choices=NUMEROS_FASES)
+    parser.add_argument('--ticks', type=int, default=None,
+                        help="limite de passos (padrão: até o game over)")
+    parser.add_argument('--roteiro', default='',
+                        help='teclas por passo, ex.: "0-600:espaco,600-900:cima+espaco"')
+    parser.add_argument('--desenhar', action='store_true',
+                        help="também desenha cada passo (driver de vídeo dummy)")
+    parser.add_argument('--motor-numpy', action='store_true')
+    parser.add_argument('--taxa-simulacao', type=int, default=60)
+    parser.add_argument('--semente', type=int, default=None,
+                        help="semente da partida (padrão: aleatória)")
+    args = parser.parse_args()
+
+    executor = ExecutorHeadless(args.fase, EntradaRoteirizada.de_texto(args.roteiro),
+                                args.desenhar,
+                                motor_obstaculos='numpy' if args.motor_numpy else 'lista',
+                                taxa_simulacao=args.taxa_simulacao,
+                                semente=args.semente)
+    resultado = executor.executar(args.ticks)
+    for chave, valor in resultado.items():
+        print(f"{chave}: {valor}")
+
+
+if __name__ == "__main__":
+    main()
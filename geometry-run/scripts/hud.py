@@ -0,0 +1,158 @@
+import time
+import pygame
+from scripts.interfaces import cache_texto
+
+# Marcador para widgets que ainda não foram renderizados
+_SEM_VALOR = object()
+
+
+class WidgetHUD:
+    """Elemento do HUD que só é renderizado novamente quando o valor vinculado muda
+
+    As subclasses definem renderizar(valor) -> (superfície, retângulo).
+    """
+
+    def __init__(self, vinculo):
+        self.vinculo = vinculo
+        self.valor = _SEM_VALOR
+        self.imagem = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def verificar(self):
+        """Lê o valor vinculado e renderiza o widget se ele mudou"""
+        valor = self.vinculo()
+        if valor == self.valor:
+            return False
+
+        self.valor = valor
+        self.imagem, self.rect = self.renderizar(valor)
+        return True
+
+
+class WidgetTexto(WidgetHUD):
+    """Texto do HUD formatado a partir de um valor vinculado"""
+
+    def __init__(self, vinculo, formato, x, y, cor, tamanho,
+                 fonte=None, centralizado=False):
+        super().__init__(vinculo)
+        self.formato = formato
+        self.x = x
+        self.y = y
+        self.cor = cor
+        self.tamanho = tamanho
+        self.fonte = fonte
+        self.centralizado = centralizado
+
+    def renderizar(self, valor):
+        # None esconde o widget
+        if valor is None:
+            return None, pygame.Rect(self.x, self.y, 0, 0)
+
+        if isinstance(valor, tuple):
+            texto = self.formato.format(*valor)
+        else:
+            texto = self.formato.format(valor)
+
+        imagem = cache_texto.renderizar(texto, self.fonte, self.tamanho, self.cor)
+        rect = imagem.get_rect()
+        if self.centralizado:
+            rect.center = (self.x, self.y)
+        else:
+            rect.topleft = (self.x, self.y)
+        return imagem, rect
+
+
+class WidgetBarra(WidgetHUD):
+    """Barra de progresso do HUD (valor entre 0.0 e 1.0)"""
+
+    def __init__(self, vinculo, x, y, largura, altura, cor_fundo=(50, 50, 50)):
+        super().__init__(vinculo)
+        self.x = x
+        self.y = y
+        self.largura = largura
+        self.altura = altura
+        self.cor_fundo = cor_fundo
+
+    def renderizar(self, progresso):
+        imagem = pygame.Surface((self.largura, self.altura))
+        imagem.fill(self.cor_fundo)
+
+        # Cor vai do vermelho ao verde conforme o progresso
+        cor_progresso = (
+            int(255 * (1 - progresso)),
+            int(255 * progresso),
+            100
+        )
+        pygame.draw.rect(imagem, cor_progresso,
+                         (0, 0, int(self.largura * progresso), self.altura))
+        return imagem, pygame.Rect(self.x, self.y, self.largura, self.altura)
+
+
+class HUD:
+    """HUD retido: os widgets só são renderizados de novo quando o valor muda
+
+    As superfícies em cache dos widgets vão direto para a tela, sem uma camada
+    SRCALPHA intermediária: bordas antialiasadas misturadas primeiro na camada
+    transparente saem diferentes (mais escuras) do texto desenhado direto.
+    """
+
+    def __init__(self, largura, altura):
+        self.largura = largura
+        self.altura = altura
+        self.widgets = []
+        self.blits = []  # (superfície, retângulo) de cada widget visível
+        self.regioes = []
+        self.suja = True
+
+        # Regiões que mudaram no último quadro (posição antiga e nova)
+        self.retangulos_alterados = []
+
+        # Estatísticas de renderização dos widgets
+        self.renderizacoes_total = 0
+        self.renderizacoes_quadro = 0
+        self.renderizacoes_por_segundo = 0
+        self._renderizacoes_janela = 0
+        self._inicio_janela = time.perf_counter()
+
+    def adicionar(self, widget):
+        """Adiciona um widget ao HUD"""
+        self.widgets.append(widget)
+        self.suja = True
+        return widget
+
+    def atualizar(self):
+        """Verifica os valores vinculados e recompõe a lista de blits se algo mudou"""
+        self.renderizacoes_quadro = 0
+        self.retangulos_alterados = []
+        for widget in self.widgets:
+            rect_anterior = widget.rect
+            if widget.verificar():
+                self.renderizacoes_quadro += 1
+                self.retangulos_alterados.append(rect_anterior.union(widget.rect))
+
+        if self.renderizacoes_quadro:
+            self.suja = True
+            self.renderizacoes_total += self.renderizacoes_quadro
+            self._renderizacoes_janela += self.renderizacoes_quadro
+
+        # Contador de renderizações por segundo
+        agora = time.perf_counter()
+        if agora - self._inicio_janela >= 1.0:
+            self.renderizacoes_por_segundo = self._renderizacoes_janela
+            self._renderizacoes_janela = 0
+            self._inicio_janela = agora
+
+        if self.suja:
+            self.compor()
+
+    def compor(self):
+        """Monta a lista de blits com as superfícies atuais dos widgets"""
+        self.blits = [(widget.imagem, widget.rect.copy()) for widget in self.widgets
+                      if widget.imagem is not None]
+        self.regioes = [rect for _, rect in self.blits]
+        self.suja = False
+
+    def desenhar(self, superficie):
+        """Desenha os widgets do HUD direto na superfície (um único blits)"""
+        self.atualizar()
+        superficie.blits(self.blits, doreturn=False)
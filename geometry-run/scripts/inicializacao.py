@@ -0,0 +1,106 @@
+"""Abertura rápida do jogo e medição do tempo até o primeiro quadro
+
+Só os subsistemas do pygame que o jogo usa são iniciados (vídeo e fontes; o
+mixer de áudio fica de fora). Fontes, textos fixos e quadros do jogador são
+preparados em uma thread enquanto o primeiro quadro do menu já está na tela.
+"""
+import os
+import threading
+import time
+import pygame
+from scripts.interfaces import cache_texto
+from scripts.jogador import cache_sprites_jogador
+
+# Tamanhos de fonte usados pelas cenas e pelo HUD
+TAMANHOS_FONTE = (16, 18, 20, 22, 24, 28, 30, 36, 48, 64, 72)
+
+# Textos que não mudam, com o tamanho e a cor usados pelas cenas
+TEXTOS_FIXOS = (
+    ("INVENCIBILIDADE!", 20, (255, 255, 100)),
+    ("Espaço: Turbo | ESC: Selecionar Fase", 16, (150, 150, 150)),
+    ("GAME OVER", 64, (255, 80, 80)),
+    ("GAME OVER", 72, (255, 80, 80)),
+    ("Aguarde para continuar...", 24, (200, 200, 200)),
+    ("NOVO RECORD!", 28, (255, 255, 100))
+)
+
+
+def segundos_desde_inicio_processo():
+    """Tempo desde a criação do processo (Linux); None se não der para saber"""
+    try:
+        with open('/proc/self/stat') as arquivo:
+            # Os campos depois do nome do programa começam no campo 3; o início é o 22
+            campos = arquivo.read().rsplit(')', 1)[1].split()
+        inicio = int(campos[19]) / os.sysconf('SC_CLK_TCK')
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - inicio
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class MarcasInicializacao:
+    """Instantes de cada etapa da abertura, do início do processo ao primeiro quadro"""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        # Tempo gasto antes deste módulo ser importado (interpretador e importações)
+        self.antes = segundos_desde_inicio_processo()
+        self.marcas = []
+        self.aquecimento = None  # Duração da thread de aquecimento (s), quando terminar
+
+    def marcar(self, etapa):
+        """Registra o fim de uma etapa"""
+        self.marcas.append((etapa, time.perf_counter()))
+
+    def total(self):
+        """Segundos do início do processo até a última marca"""
+        ultimo = self.marcas[-1][1] if self.marcas else self.inicio
+        return (self.antes or 0.0) + ultimo - self.inicio
+
+    def imprimir(self):
+        """Mostra a duração de cada etapa e o total"""
+        print("Abertura:")
+        if self.antes is not None:
+            print(f"  {'processo':<20} {1000 * self.antes:8.1f} ms")
+        anterior = self.inicio
+        for etapa, instante in self.marcas:
+            print(f"  {etapa:<20} {1000 * (instante - anterior):8.1f} ms")
+            anterior = instante
+        print(f"  {'total':<20} {1000 * self.total():8.1f} ms")
+        if self.aquecimento is not None:
+            print(f"  {'caches (thread)':<20} {1000 * self.aquecimento:8.1f} ms")
+
+
+def inicializar_pygame():
+    """Inicia só vídeo e fontes (no lugar de pygame.init())"""
+    pygame.display.init()
+    pygame.font.init()
+
+
+def aquecer_caches(cores_fases, tamanho_jogador=40, duracao_invencibilidade=90):
+    """Carrega as fontes e pré-renderiza textos fixos e quadros do jogador"""
+    for tamanho in TAMANHOS_FONTE:
+        cache_texto.obter_fonte(None, tamanho)
+    for texto, tamanho, cor in TEXTOS_FIXOS:
+        cache_texto.renderizar(texto, None, tamanho, cor)
+
+    for cores in cores_fases:
+        cache_sprites_jogador.obter_corpo(cores['jogador'], (255, 255, 255), tamanho_jogador)
+        cache_sprites_jogador.obter_quadros_invencivel(cores['jogador'], (255, 255, 255),
+                                                       tamanho_jogador, duracao_invencibilidade)
+
+
+def aquecer_em_segundo_plano(cores_fases, marcas=None):
+    """Roda aquecer_caches() em uma thread; retorna a thread"""
+    def aquecer():
+        inicio = time.perf_counter()
+        aquecer_caches(cores_fases)
+        if marcas is not None:
+            marcas.aquecimento = time.perf_counter() - inicio
+
+    thread = threading.Thread(target=aquecer, name='aquecimento', daemon=True)
+    thread.start()
+    return thread
+
+
+# Marcas da abertura do processo atual (criadas na primeira importação)
+inicializacao = MarcasInicializacao()
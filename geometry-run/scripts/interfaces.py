@@ -1,4 +1,93 @@
+import threading
 import pygame
+from collections import OrderedDict
+
+
+class CacheTexto:
+    """Pool de fontes e cache LRU de superfícies de texto já renderizadas"""
+
+    def __init__(self, limite=256):
+        self.limite = limite
+
+        # O cache também é aquecido por uma thread na abertura do jogo
+        self.trava = threading.RLock()
+
+        # Fontes compartilhadas por (arquivo, tamanho)
+        self.fontes = {}
+
+        # Superfícies por (texto, arquivo, tamanho, cor, antialias)
+        self.superficies = OrderedDict()
+
+        # Estatísticas
+        self.acertos = 0
+        self.falhas = 0
+        self.despejos = 0
+
+    def obter_fonte(self, fonte, tamanho):
+        """Retorna a fonte do pool, carregando apenas na primeira vez"""
+        chave = (fonte, tamanho)
+        objeto_fonte = self.fontes.get(chave)
+        if objeto_fonte is None:
+            with self.trava:
+                objeto_fonte = self.fontes.get(chave)
+                if objeto_fonte is None:
+                    objeto_fonte = pygame.font.Font(fonte, tamanho)
+                    self.fontes[chave] = objeto_fonte
+        return objeto_fonte
+
+    def renderizar(self, texto, fonte, tamanho, cor, antialias=True):
+        """Retorna a superfície do texto, renderizando só em caso de falha no cache"""
+        chave = (texto, fonte, tamanho, tuple(cor), antialias)
+        with self.trava:
+            superficie = self.superficies.get(chave)
+            if superficie is not None:
+                self.superficies.move_to_end(chave)
+                self.acertos += 1
+                return superficie
+
+            self.falhas += 1
+            superficie = self.obter_fonte(fonte, tamanho).render(texto, antialias, cor)
+            self.superficies[chave] = superficie
+
+            # Descartar as entradas menos usadas recentemente
+            while len(self.superficies) > self.limite:
+                self.superficies.popitem(last=False)
+                self.despejos += 1
+
+            return superficie
+
+    def definir_limite(self, limite):
+        """Altera o número máximo de superfícies mantidas no cache"""
+        self.limite = max(1, limite)
+        while len(self.superficies) > self.limite:
+            self.superficies.popitem(last=False)
+            self.despejos += 1
+
+    def estatisticas(self):
+        """Retorna os contadores do cache"""
+        total = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'despejos': self.despejos,
+            'taxa_acerto': self.acertos / total if total else 0.0,
+            'superficies': len(self.superficies),
+            'limite': self.limite,
+            'fontes': len(self.fontes)
+        }
+
+    def limpar(self):
+        """Esvazia o cache e zera os contadores"""
+        self.fontes.clear()
+        self.superficies.clear()
+        self.acertos = 0
+        self.falhas = 0
+        self.despejos = 0
+
+
+# Cache compartilhado por todo o processo
+cache_texto = CacheTexto()
+
 
 class Texto:
     def __init__(self, tela, texto, x, y, cor, tamanho, fonte=None, centralizado=False):
@@ -7,15 +96,13 @@ class Texto:
         self.cor = cor
         self.tamanho = tamanho
         self.centralizado = centralizado
+        self.arquivo_fonte = fonte
         
-        # Inicializar fonte
-        if fonte is None:
-            self.fonte = pygame.font.Font(None, self.tamanho)
-        else:
-            self.fonte = pygame.font.Font(fonte, self.tamanho)
+        # Fonte compartilhada pelo pool
+        self.fonte = cache_texto.obter_fonte(fonte, self.tamanho)
         
-        # Renderizar texto
-        self.imagem_texto = self.fonte.render(self.texto, True, self.cor)
+        # Renderizar texto (reaproveitado do cache quando possível)
+        self.imagem_texto = cache_texto.renderizar(self.texto, fonte, self.tamanho, self.cor)
         
         # Calcular posição
         if self.centralizado:
@@ -33,7 +120,8 @@ class Texto:
     def atualizar_texto(self, novo_texto):
         """Atualiza o texto mantendo as configurações"""
         self.texto = str(novo_texto)
-        self.imagem_texto = self.fonte.render(self.texto, True, self.cor)
+        self.imagem_texto = cache_texto.renderizar(self.texto, self.arquivo_fonte, 
+                                                   self.tamanho, self.cor)
         
         # Recalcular posição se centralizado
         if self.centralizado:
@@ -54,7 +142,6 @@ class Botao:
         self.cor_fundo = cor_fundo
         self.cor_hover = cor_hover if cor_hover else self.ajustar_brightness(cor_fundo, 1.3)
         self.cor_atual = cor_fundo
-        self.clicado = False
         
     def ajustar_brightness(self, cor, fator):
         """Ajusta o brilho de uma cor"""
@@ -69,24 +156,21 @@ class Botao:
         # Desenhar texto
         self.texto_obj.desenhar()
     
-    def atualizar(self):
-        """Atualiza o estado do botão"""
-        pos_mouse = pygame.mouse.get_pos()
-        hover = self.rect.collidepoint(pos_mouse)
-        
-        # Atualizar cor
+    def definir_hover(self, hover):
+        """Chamado pelo índice de alvos quando o cursor entra ou sai do botão"""
         self.cor_atual = self.cor_hover if hover else self.cor_fundo
+    
+    def atualizar(self, entrada):
+        """Atualiza o hover pela entrada do passo; retorna se o botão foi clicado
         
-        # Verificar clique
-        clique = False
-        if hover and pygame.mouse.get_pressed()[0]:
-            if not self.clicado:
-                clique = True
-                self.clicado = True
-        else:
-            self.clicado = False
-        
-        return clique
+        Para um botão avulso. As cenas usam um IndiceAlvos com todos os botões.
+        """
+        self.definir_hover(self.rect.collidepoint(entrada.mouse))
+        return any(self.rect.collidepoint(clique) for clique in entrada.cliques)
+    
+    def resetar(self):
+        """Volta ao estado de um botão recém-criado (sem hover)"""
+        self.cor_atual = self.cor_fundo
     
     def get_rect(self):
         """Retorna o retângulo do botão"""
@@ -1,14 +1,108 @@
+import threading
 import pygame
 
+
+class CacheSpritesJogador:
+    """Quadros pré-renderizados do jogador (normal, piscando e anel de proteção)"""
+
+    def __init__(self):
+        # (cor, cor_borda, tamanho) -> superfície do corpo
+        self.corpos = {}
+        # (cor, cor_borda, tamanho, duracao) -> [(normal, piscando)] por tempo_invencivel
+        self.quadros_invencivel = {}
+        self.renderizacoes = 0
+        # Os quadros também são preparados por uma thread na abertura do jogo
+        self.trava = threading.RLock()
+
+    def _converter(self, superficie):
+        """Converte para o formato da tela quando já existe uma janela"""
+        if pygame.display.get_surface() is not None:
+            return superficie.convert_alpha()
+        return superficie
+
+    def _desenhar_corpo(self, superficie, posicao, cor, cor_borda, tamanho):
+        """Desenha o quadrado principal do jogador"""
+        rect = pygame.Rect(posicao[0], posicao[1], tamanho, tamanho)
+        pygame.draw.rect(superficie, cor, rect, border_radius=6)
+        pygame.draw.rect(superficie, cor_borda, rect, 3, border_radius=6)
+
+    def obter_corpo(self, cor, cor_borda, tamanho):
+        """Retorna o quadro do jogador sem efeitos"""
+        chave = (cor, cor_borda, tamanho)
+        corpo = self.corpos.get(chave)
+        if corpo is None:
+            with self.trava:
+                corpo = self.corpos.get(chave)
+                if corpo is None:
+                    corpo = pygame.Surface((tamanho, tamanho), pygame.SRCALPHA)
+                    self._desenhar_corpo(corpo, (0, 0), cor, cor_borda, tamanho)
+                    corpo = self._converter(corpo)
+                    self.corpos[chave] = corpo
+                    self.renderizacoes += 1
+        return corpo
+
+    def obter_quadros_invencivel(self, cor, cor_borda, tamanho, duracao):
+        """Retorna os quadros de invencibilidade, um par (normal, piscando) por passo"""
+        chave = (cor, cor_borda, tamanho, duracao)
+        quadros = self.quadros_invencivel.get(chave)
+        if quadros is None:
+            with self.trava:
+                quadros = self.quadros_invencivel.get(chave)
+                if quadros is None:
+                    quadros = [self._criar_quadros_passo(cor, cor_borda, tamanho, duracao, tempo)
+                               for tempo in range(duracao)]
+                    self.quadros_invencivel[chave] = quadros
+        return quadros
+
+    def _criar_quadros_passo(self, cor, cor_borda, tamanho, duracao, tempo_invencivel):
+        """Compõe corpo e anel de proteção para um passo da invencibilidade"""
+        tempo_restante = duracao - tempo_invencivel
+        raio = tamanho // 2 + 8 + int((tempo_restante / 30) * 5)
+        alpha = 100 + int((tempo_restante / duracao) * 155)
+
+        # Superfície grande o bastante para o anel não ser cortado
+        lado = max(tamanho, 2 * (raio + 4) + 2)
+        centro = (lado // 2, lado // 2)
+        canto = (centro[0] - tamanho // 2, centro[1] - tamanho // 2)
+
+        pares = []
+        for cor_atual in (cor, (255, 255, 255)):
+            quadro = pygame.Surface((lado, lado), pygame.SRCALPHA)
+            self._desenhar_corpo(quadro, canto, cor_atual, cor_borda, tamanho)
+
+            # Anel de proteção
+            for i in range(3):
+                pygame.draw.circle(quadro,
+                                   (255, 255, 255, alpha // (i+1)),
+                                   centro, raio + i*2, 1)
+            pares.append(self._converter(quadro))
+            self.renderizacoes += 1
+
+        return (pares[0], pares[1], canto)
+
+    def limpar(self):
+        """Descarta todos os quadros"""
+        self.corpos.clear()
+        self.quadros_invencivel.clear()
+
+
+# Cache compartilhado pelos jogadores
+cache_sprites_jogador = CacheSpritesJogador()
+
+
 class Jogador:
-    def __init__(self, tela, largura_tela, altura_tela):
+    def __init__(self, tela, largura_tela, altura_tela, escala_tempo=1.0):
         self.tela = tela
         self.largura_tela = largura_tela
         self.altura_tela = altura_tela
         
+        # Quadros de referência (60 FPS) que cada passo da simulação avança
+        self.escala_tempo = escala_tempo
+        
         # Propriedades do jogador
         self.tamanho = 40
         self.posicao = [100, altura_tela // 2]
+        self.posicao_anterior = list(self.posicao)  # Para interpolar o desenho
         self.velocidade = 5
         self.rect = pygame.Rect(self.posicao[0], self.posicao[1], 
                                self.tamanho, self.tamanho)
@@ -22,32 +116,41 @@ class Jogador:
         self.tempo_invencivel = 0
         self.duracao_invencibilidade = 90  # 1.5 segundos a 60 FPS
         self.frame_count = 0
+        
+        # Área ocupada na tela pelo último desenho (inclui o anel)
+        self.rect_desenho = self.rect.copy()
     
-    def atualizar(self):
-        """Atualiza a posição do jogador"""
+    def atualizar(self, teclas=None):
+        """Atualiza a posição do jogador (teclas: estado do teclado; None lê o teclado)"""
+        # Guardar a posição do passo anterior para a interpolação
+        self.posicao_anterior[0] = self.posicao[0]
+        self.posicao_anterior[1] = self.posicao[1]
+        
         # Atualizar invencibilidade
         if self.invencivel:
-            self.tempo_invencivel += 1
+            self.tempo_invencivel += self.escala_tempo
             if self.tempo_invencivel >= self.duracao_invencibilidade:
                 self.invencivel = False
                 self.tempo_invencivel = 0
         
         # Incrementar contador de frames
-        self.frame_count += 1
+        self.frame_count += self.escala_tempo
         
         # Obter teclas pressionadas
-        teclas = pygame.key.get_pressed()
+        if teclas is None:
+            teclas = pygame.key.get_pressed()
         
         # Movimento
+        velocidade = self.velocidade * self.escala_tempo
         movimento = [0, 0]
         if teclas[pygame.K_UP] or teclas[pygame.K_w]:
-            movimento[1] -= self.velocidade
+            movimento[1] -= velocidade
         if teclas[pygame.K_DOWN] or teclas[pygame.K_s]:
-            movimento[1] += self.velocidade
+            movimento[1] += velocidade
         if teclas[pygame.K_LEFT] or teclas[pygame.K_a]:
-            movimento[0] -= self.velocidade
+            movimento[0] -= velocidade
         if teclas[pygame.K_RIGHT] or teclas[pygame.K_d]:
-            movimento[0] += self.velocidade
+            movimento[0] += velocidade
         
         # Normalizar movimento diagonal
         if movimento[0] != 0 and movimento[1] != 0:
@@ -66,46 +169,31 @@ class Jogador:
         self.rect.x = self.posicao[0]
         self.rect.y = self.posicao[1]
     
-    def desenhar(self):
+    def posicao_interpolada(self, alfa):
+        """Posição entre o passo anterior (alfa=0) e o atual (alfa=1)"""
+        x = self.posicao_anterior[0] + (self.posicao[0] - self.posicao_anterior[0]) * alfa
+        y = self.posicao_anterior[1] + (self.posicao[1] - self.posicao_anterior[1]) * alfa
+        return (x, y)
+    
+    def desenhar(self, alfa=1.0):
         """Desenha o jogador na tela"""
-        # Criar superfície para efeitos
-        surf_jogador = pygame.Surface((self.tamanho, self.tamanho), pygame.SRCALPHA)
-        
-        # Desenhar jogador com efeito de invencibilidade
-        if self.invencivel:
-            # Piscar quando invencível (mais rápido)
-            piscar = (self.frame_count // 5) % 2
-            if piscar == 0:
-                cor_atual = self.cor
-            else:
-                cor_atual = (255, 255, 255)
-        else:
-            cor_atual = self.cor
-        
-        # Desenhar quadrado principal
-        pygame.draw.rect(surf_jogador, cor_atual, 
-                        (0, 0, self.tamanho, self.tamanho), 
-                        border_radius=6)
-        pygame.draw.rect(surf_jogador, self.cor_borda, 
-                        (0, 0, self.tamanho, self.tamanho), 
-                        3, border_radius=6)
+        posicao = self.posicao_interpolada(alfa)
+        if not self.invencivel:
+            corpo = cache_sprites_jogador.obter_corpo(self.cor, self.cor_borda, self.tamanho)
+            self.rect_desenho = self.tela.blit(corpo, posicao)
+            return
         
-        # Efeito especial quando invencível
-        if self.invencivel:
-            # Anel de proteção
-            tempo_restante = self.duracao_invencibilidade - self.tempo_invencivel
-            raio = self.tamanho // 2 + 8 + int((tempo_restante / 30) * 5)
-            alpha = 100 + int((tempo_restante / self.duracao_invencibilidade) * 155)
-            
-            # Desenhar círculo de proteção
-            for i in range(3):
-                pygame.draw.circle(surf_jogador, 
-                                 (255, 255, 255, alpha // (i+1)), 
-                                 (self.tamanho//2, self.tamanho//2), 
-                                 raio + i*2, 1)
+        # Quadro pré-composto com o anel de proteção do passo atual
+        quadros = cache_sprites_jogador.obter_quadros_invencivel(
+            self.cor, self.cor_borda, self.tamanho, self.duracao_invencibilidade
+        )
+        normal, piscando, canto = quadros[min(int(self.tempo_invencivel), len(quadros) - 1)]
         
-        # Desenhar na tela
-        self.tela.blit(surf_jogador, self.posicao)
+        # Piscar quando invencível (mais rápido)
+        piscar = int(self.frame_count // 5) % 2
+        quadro = normal if piscar == 0 else piscando
+        self.rect_desenho = self.tela.blit(quadro, (posicao[0] - canto[0], 
+                                                    posicao[1] - canto[1]))
     
     def get_rect(self):
         """Retorna o retângulo de colisão"""
@@ -121,6 +209,10 @@ class Jogador:
     def resetar(self):
         """Reseta o jogador para a posição inicial"""
         self.posicao = [100, self.altura_tela // 2]
+        self.posicao_anterior = list(self.posicao)
+        self.rect.topleft = self.posicao
+        self.rect_desenho = self.rect.copy()
         self.invencivel = False
         self.tempo_invencivel = 0
+        self.duracao_invencibilidade = 90
         self.frame_count = 0
\ No newline at end of file
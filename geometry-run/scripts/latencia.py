@@ -0,0 +1,77 @@
+"""Latência da entrada: do evento até a apresentação do quadro que o mostra
+
+Cada evento de entrada (tecla ou clique) recebe o instante em que chegou à
+fila do jogo. Enquanto o loop espera o próximo quadro, a fila é consultada a
+cada milissegundo (coletar_eventos chamado pela espera do RitmoQuadros), então
+esse instante não depende de quando o loop vai processar os eventos. Quando
+um passo de simulação consome a entrada e o quadro seguinte é apresentado
+(flip), a diferença vira uma amostra.
+"""
+import time
+from collections import deque
+import pygame
+from scripts.perfilador import percentil
+
+# Eventos que contam como entrada do jogador
+TIPOS_ENTRADA = frozenset((pygame.KEYDOWN, pygame.KEYUP,
+                           pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP))
+
+# Percentis mostrados no relatório
+PERCENTIS = (50, 90, 95, 99)
+
+
+class MedidorLatencia:
+    """Latências (ms) de evento até apresentação, guardadas em um buffer circular"""
+
+    def __init__(self, capacidade=10000):
+        self.chegadas = []  # Instantes de eventos ainda não consumidos por um passo
+        self.consumidas = []  # Consumidos por um passo, esperando a apresentação
+        self.amostras = deque(maxlen=capacidade)
+
+    def registrar(self, evento, instante):
+        """Guarda o instante de chegada se o evento for de entrada"""
+        if evento.type in TIPOS_ENTRADA:
+            self.chegadas.append(instante)
+
+    def consumir(self):
+        """Chamado quando um passo de simulação lê a entrada acumulada"""
+        self.consumidas.extend(self.chegadas)
+        self.chegadas.clear()
+
+    def apresentar(self, instante=None):
+        """Chamado logo depois do flip: fecha as amostras consumidas"""
+        if not self.consumidas:
+            return
+        if instante is None:
+            instante = time.perf_counter()
+        self.amostras.extend((instante - chegada) * 1000 for chegada in self.consumidas)
+        self.consumidas.clear()
+
+    def resumo(self):
+        """Quantidade, média, percentis e pior latência (ms)"""
+        ordenados = sorted(self.amostras)
+        resumo = {
+            'quantidade': len(ordenados),
+            'media': sum(ordenados) / len(ordenados) if ordenados else 0.0
+        }
+        for p in PERCENTIS:
+            resumo[f'p{p}'] = percentil(ordenados, p)
+        resumo['pior'] = ordenados[-1] if ordenados else 0.0
+        return resumo
+
+    def imprimir(self, modo):
+        """Mostra o resumo das latências do modo de loop informado"""
+        resumo = self.resumo()
+        print(f"Latência entrada -> tela ({modo}, {resumo['quantidade']} entradas):")
+        print("  " + " ".join(f"{nome} {valor:.2f} ms" for nome, valor in resumo.items()
+                              if nome != 'quantidade'))
+
+
+def coletar_eventos(eventos, medidor=None):
+    """Tira os eventos da fila do pygame para a lista, marcando a chegada"""
+    novos = pygame.event.get()
+    if medidor is not None:
+        instante = time.perf_counter()
+        for evento in novos:
+            medidor.registrar(evento, instante)
+    eventos.extend(novos)
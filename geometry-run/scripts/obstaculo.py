@@ -1,84 +1,155 @@
 import pygame
 import random
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from scripts import fases
+from scripts.fases import obter_fase, LARGURA_REFERENCIA, MARGEM_LUT
+from scripts.fluxo_obstaculos import FluxoObstaculos
+
+
+class AtlasObstaculos:
+    """Cache LRU dos corpos de obstáculos pré-renderizados
+
+    A cor vem já quantizada da tabela de cor da fase (ver scripts.fases), então
+    cada tamanho de obstáculo tem poucos corpos diferentes.
+    """
+
+    def __init__(self, limite=256):
+        self.limite = limite
+
+        # (cor, cor da borda, largura, altura) -> superfície
+        self.corpos = OrderedDict()
+
+        # Estatísticas
+        self.acertos = 0
+        self.falhas = 0
+        self.despejos = 0
+
+    def obter(self, cor, cor_borda, largura, altura):
+        """Retorna o corpo do obstáculo, renderizando só quando não está no atlas"""
+        chave = (cor, cor_borda, largura, altura)
+        corpo = self.corpos.get(chave)
+        if corpo is not None:
+            self.corpos.move_to_end(chave)
+            self.acertos += 1
+            return corpo
+
+        self.falhas += 1
+        corpo = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        pygame.draw.rect(corpo, cor, corpo.get_rect(), border_radius=4)
+        pygame.draw.rect(corpo, cor_borda, corpo.get_rect(), 2, border_radius=4)
+        if pygame.display.get_surface() is not None:
+            corpo = corpo.convert_alpha()
+        self.corpos[chave] = corpo
+
+        # Descartar os corpos usados há mais tempo
+        while len(self.corpos) > self.limite:
+            self.corpos.popitem(last=False)
+            self.despejos += 1
+
+        return corpo
+
+    def configurar(self, niveis_cor=None, limite=None):
+        """Altera os níveis do gradiente das fases e o tamanho máximo do atlas"""
+        if niveis_cor is not None and niveis_cor != fases.niveis_cor:
+            # Cores novas: os corpos já renderizados não serão mais usados
+            fases.configurar_niveis_cor(niveis_cor)
+            self.corpos.clear()
+        if limite is not None:
+            self.limite = max(1, limite)
+            while len(self.corpos) > self.limite:
+                self.corpos.popitem(last=False)
+                self.despejos += 1
+
+    def estatisticas(self):
+        """Retorna os contadores do atlas"""
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'despejos': self.despejos,
+            'corpos': len(self.corpos),
+            'limite': self.limite,
+            'niveis_cor': fases.niveis_cor
+        }
+
+
+# Atlas compartilhado por todos os obstáculos
+atlas_obstaculos = AtlasObstaculos()
+
+
+def _chave_x(obstaculo):
+    """Chave de ordenação usada pela consulta de colisão"""
+    return obstaculo.rect.x
+
 
 class Obstaculo:
-    def __init__(self, tela, largura_tela, altura_tela, velocidade_base=4, fase=1):
+    def __init__(self, tela, largura_tela, altura_tela, velocidade_base=4, fase=1,
+                 tipo=None, largura=None, altura=None, rng=None):
         self.tela = tela
         self.largura_tela = largura_tela
         self.altura_tela = altura_tela
-        self.fase = fase  # 1, 2 ou 3
         
-        # Propriedades do obstáculo
-        self.largura = random.randint(30, 80)
-        self.altura = random.randint(60, 200)
-        self.posicao = [largura_tela, 0]
-        
-        # Ajustar velocidade baseada na fase
-        if fase == 1:
-            self.velocidade = velocidade_base  # Normal (1.0x)
-        elif fase == 2:
-            self.velocidade = velocidade_base * 1.2  # Rápido (1.5x)
-        else:  # fase == 3
-            self.velocidade = velocidade_base * 1.5  # Extremo (2.0x)
-        
-        # Ajustar tamanho baseado na fase
-        if fase >= 2:
-            self.largura = random.randint(35, 85)  # Um pouco mais largo
-        if fase >= 3:
-            self.altura = random.randint(70, 210)  # Um pouco mais alto
+        # Colunas da tela convertidas para as da tabela de cor das fases
+        self.escala_lut = LARGURA_REFERENCIA / largura_tela
+        
+        # Gerador de números aleatórios (o módulo random se não for informado)
+        if rng is None:
+            rng = random
+        
+        # Propriedades do obstáculo (sorteadas nas faixas da fase quando não informadas)
+        tabela = obter_fase(fase)
+        if largura is None:
+            largura = rng.randint(*tabela.faixa_largura)
+        if altura is None:
+            altura = rng.randint(*tabela.faixa_altura)
         
         # Gerar formato (superior ou inferior)
-        self.tipo = random.choice(['superior', 'inferior'])
+        if tipo is None:
+            tipo = rng.choice(['superior', 'inferior'])
+        
+        # Retângulo de colisão (preenchido por reiniciar)
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reiniciar(velocidade_base, fase, tipo, largura, altura)
+    
+    def reiniciar(self, velocidade_base, fase, tipo, largura, altura):
+        """Coloca o obstáculo na borda direita com a geometria informada"""
+        self.fase = fase  # 1, 2 ou 3
+        self.tipo = tipo
+        self.largura = largura
+        self.altura = altura
         
         # Definir posição Y baseada no tipo
-        if self.tipo == 'superior':
-            self.posicao[1] = 0
+        if tipo == 'superior':
+            self.posicao = [self.largura_tela, 0]
         else:  # inferior
-            self.posicao[1] = altura_tela - self.altura
-        
-        # Cores baseadas na fase
-        if fase == 1:
-            self.cor_base = (255, 100, 100)
-            self.cor_borda = (255, 150, 150)
-        elif fase == 2:
-            self.cor_base = (255, 200, 100)
-            self.cor_borda = (255, 220, 150)
-        else:  # fase 3
-            self.cor_base = (150, 100, 255)
-            self.cor_borda = (180, 150, 255)
+            self.posicao = [self.largura_tela, self.altura_tela - altura]
+        self.x_anterior = self.posicao[0]  # Para interpolar o desenho
+        
+        # Velocidade e cores da fase
+        tabela = obter_fase(fase)
+        self.velocidade = velocidade_base * tabela.multiplicador_obstaculos
+        self.cor_base = tabela.cor_obstaculo
+        self.cor_borda = tabela.cor_borda_obstaculo
+        self.lut_cor = tabela.lut_cor
         
         # Retângulo de colisão
-        self.rect = pygame.Rect(self.posicao[0], self.posicao[1], 
-                               self.largura, self.altura)
+        self.rect.update(self.posicao[0], self.posicao[1], largura, altura)
+        self.rect_desenho = self.rect.copy()
         
     def atualizar(self, multiplicador_velocidade=1.0):
         """Atualiza a posição do obstáculo"""
+        self.x_anterior = self.posicao[0]
         self.posicao[0] -= self.velocidade * multiplicador_velocidade
         self.rect.x = self.posicao[0]
     
-    def desenhar(self):
-        """Desenha o obstáculo na tela"""
-        # Desenhar obstáculo principal
-        rect_desenho = pygame.Rect(
-            self.posicao[0],
-            self.posicao[1],
-            self.largura,
-            self.altura
-        )
-        
-        # Gradiente de cor baseado na posição e fase
-        if self.fase == 1:
-            intensidade_cor = min(255, 100 + int((self.posicao[0] / self.largura_tela) * 155))
-            cor_atual = (intensidade_cor, 100, 100)
-        elif self.fase == 2:
-            intensidade_cor = min(255, 150 + int((self.posicao[0] / self.largura_tela) * 105))
-            cor_atual = (intensidade_cor, intensidade_cor // 2, 100)
-        else:  # fase 3
-            intensidade_cor = min(255, 100 + int((self.posicao[0] / self.largura_tela) * 155))
-            cor_atual = (100, 100, intensidade_cor)
-        
-        pygame.draw.rect(self.tela, cor_atual, rect_desenho, border_radius=4)
-        pygame.draw.rect(self.tela, self.cor_borda, rect_desenho, 2, border_radius=4)
+    def desenhar(self, alfa=1.0):
+        """Desenha o obstáculo na tela (interpolado entre os dois últimos passos)"""
+        x = self.x_anterior + (self.posicao[0] - self.x_anterior) * alfa
+        
+        # Gradiente de cor pela posição: uma consulta à tabela de cor da fase
+        cor = self.lut_cor[int(x * self.escala_lut) + MARGEM_LUT]
+        corpo = atlas_obstaculos.obter(cor, self.cor_borda, self.largura, self.altura)
+        self.rect_desenho = self.tela.blit(corpo, (x, self.posicao[1]))
     
     def get_rect(self):
         """Retorna o retângulo de colisão"""
@@ -89,29 +160,54 @@ class Obstaculo:
         return self.posicao[0] + self.largura < 0
 
 class GerenciadorObstaculos:
-    def __init__(self, tela, largura_tela, altura_tela, velocidade_base=4):
+    def __init__(self, tela, largura_tela, altura_tela, velocidade_base=4, escala_tempo=1.0,
+                 fluxo=None):
         self.tela = tela
         self.largura_tela = largura_tela
         self.altura_tela = altura_tela
         self.velocidade_base = velocidade_base
         
+        # Quadros de referência (60 FPS) que cada passo da simulação avança
+        self.escala_tempo = escala_tempo
+        
         self.obstaculos = []
         self.tempo_ultimo_spawn = 0
         self.intervalo_spawn = 90  # frames
         self.fase_atual = 1  # Será atualizado pela partida
         
+        # Layouts dos próximos pares, pré-gerados pela semente da partida
+        # (sementes iguais geram os mesmos obstáculos)
+        if fluxo is None:
+            # Sem thread: ninguém fecharia o fluxo de um gerenciador avulso
+            fluxo = FluxoObstaculos(altura_tela, em_segundo_plano=False)
+            fluxo.reiniciar(random.randrange(2 ** 32), obter_fase(self.fase_atual))
+        self.fluxo = fluxo
+        
+        # Pool de obstáculos reciclados
+        self.livres = []
+        self.alocacoes = 0
+        
+        # Maior largura já criada (limita a busca da consulta de colisão)
+        self.largura_maxima = 0
+        
     def atualizar(self, pontuacao, multiplicador_velocidade=1.0):
         """Atualiza todos os obstáculos"""
         # Atualizar obstáculos existentes
-        for obstaculo in self.obstaculos[:]:
-            obstaculo.atualizar(multiplicador_velocidade)
-            
-            # Remover obstáculos fora da tela
-            if obstaculo.esta_fora_tela():
-                self.obstaculos.remove(obstaculo)
+        multiplicador_passo = multiplicador_velocidade * self.escala_tempo
+        for obstaculo in self.obstaculos:
+            obstaculo.atualizar(multiplicador_passo)
+        
+        # Remover obstáculos fora da tela: eles saem na ordem em que entraram,
+        # então basta cortar o início da lista e devolver ao pool
+        fora = 0
+        while fora < len(self.obstaculos) and self.obstaculos[fora].esta_fora_tela():
+            fora += 1
+        if fora:
+            self.livres.extend(self.obstaculos[:fora])
+            del self.obstaculos[:fora]
         
         # Gerar novos obstáculos
-        self.tempo_ultimo_spawn += 1
+        self.tempo_ultimo_spawn += self.escala_tempo
         if self.tempo_ultimo_spawn >= self.intervalo_spawn:
             self.criar_par_obstaculos()
             self.tempo_ultimo_spawn = 0
@@ -119,57 +215,91 @@ class GerenciadorObstaculos:
         # Ajustar dificuldade baseado na pontuação
         self.ajustar_dificuldade(pontuacao)
     
+    def obter_obstaculo(self, tipo, largura, altura):
+        """Retorna um obstáculo do pool (ou cria um novo) com a geometria final"""
+        if self.livres:
+            obstaculo = self.livres.pop()
+            obstaculo.reiniciar(self.velocidade_base, self.fase_atual, tipo, largura, altura)
+        else:
+            obstaculo = Obstaculo(self.tela, self.largura_tela, self.altura_tela,
+                                  self.velocidade_base, self.fase_atual, tipo, largura, altura)
+            self.alocacoes += 1
+        self.largura_maxima = max(self.largura_maxima, largura)
+        return obstaculo
+    
     def criar_par_obstaculos(self):
-        """Cria um par de obstáculos (superior e inferior)"""
-        # Determinar altura do vão (menor nas fases avançadas)
-        if self.fase_atual == 1:
-            altura_vao = random.randint(140, 180)
-        elif self.fase_atual == 2:
-            altura_vao = random.randint(130, 170)
-        else:  # fase 3
-            altura_vao = random.randint(120, 160)
-            
-        posicao_vao = random.randint(100, self.altura_tela - altura_vao - 100)
-        
-        # Criar obstáculo superior
-        obstaculo_superior = Obstaculo(self.tela, self.largura_tela, self.altura_tela, self.velocidade_base, self.fase_atual)
-        obstaculo_superior.tipo = 'superior'
-        obstaculo_superior.altura = posicao_vao
-        obstaculo_superior.posicao[1] = 0
-        obstaculo_superior.rect = pygame.Rect(obstaculo_superior.posicao[0], obstaculo_superior.posicao[1],
-                                            obstaculo_superior.largura, obstaculo_superior.altura)
-        
-        # Criar obstáculo inferior
-        obstaculo_inferior = Obstaculo(self.tela, self.largura_tela, self.altura_tela, self.velocidade_base, self.fase_atual)
-        obstaculo_inferior.tipo = 'inferior'
-        obstaculo_inferior.altura = self.altura_tela - (posicao_vao + altura_vao)
-        obstaculo_inferior.posicao[1] = posicao_vao + altura_vao
-        obstaculo_inferior.rect = pygame.Rect(obstaculo_inferior.posicao[0], obstaculo_inferior.posicao[1],
-                                             obstaculo_inferior.largura, obstaculo_inferior.altura)
-        
-        self.obstaculos.append(obstaculo_superior)
-        self.obstaculos.append(obstaculo_inferior)
+        """Cria um par de obstáculos (superior e inferior) com o próximo layout do fluxo"""
+        posicao_vao, altura_vao, largura_superior, largura_inferior = self.fluxo.proximo_par()
+        
+        # Obstáculo superior (do topo até o vão) e inferior (do vão até o chão)
+        self.obstaculos.append(self.obter_obstaculo(
+            'superior', largura_superior, posicao_vao
+        ))
+        self.obstaculos.append(self.obter_obstaculo(
+            'inferior', largura_inferior, self.altura_tela - (posicao_vao + altura_vao)
+        ))
     
     def ajustar_dificuldade(self, pontuacao):
         """Ajusta a dificuldade baseado na pontuação (apenas para progressão dentro da fase)"""
         # Diminuir intervalo de spawn gradualmente (mais obstáculos)
         if pontuacao > 0 and pontuacao % 100 == 0:
-            self.intervalo_spawn = max(60, self.intervalo_spawn - 3)
+            self.intervalo_spawn = max(60, self.intervalo_spawn - 3 * self.escala_tempo)
     
-    def desenhar(self):
+    def desenhar(self, alfa=1.0):
         """Desenha todos os obstáculos"""
         for obstaculo in self.obstaculos:
-            obstaculo.desenhar()
+            obstaculo.desenhar(alfa)
+    
+    def retangulos_desenho(self):
+        """Áreas da tela ocupadas no último desenho, por obstáculo"""
+        return {id(obstaculo): obstaculo.rect_desenho for obstaculo in self.obstaculos}
+    
+    def candidatos_colisao(self, rect):
+        """Obstáculos cuja faixa horizontal pode se sobrepor ao retângulo
+        
+        Todos andam para a esquerda a partir da mesma borda, então a lista
+        já está ordenada por x e a busca é feita por bisseção.
+        """
+        fim = bisect_left(self.obstaculos, rect.right, key=_chave_x)
+        inicio = bisect_right(self.obstaculos, rect.left - self.largura_maxima,
+                              hi=fim, key=_chave_x)
+        return self.obstaculos[inicio:fim]
+    
+    def consultar_colisao(self, rect_jogador):
+        """Retorna o obstáculo atingido pelo retângulo (ou None)"""
+        candidatos = self.candidatos_colisao(rect_jogador)
+        indice = rect_jogador.collidelist([obstaculo.rect for obstaculo in candidatos])
+        return candidatos[indice] if indice >= 0 else None
+    
+    def consultar_colisoes(self, rect_jogador):
+        """Retorna todos os obstáculos atingidos pelo retângulo"""
+        candidatos = self.candidatos_colisao(rect_jogador)
+        indices = rect_jogador.collidelistall([obstaculo.rect for obstaculo in candidatos])
+        return [candidatos[indice] for indice in indices]
+    
+    def tipo_obstaculo(self, obstaculo):
+        """Tipo ('superior' ou 'inferior') de um obstáculo retornado por consultar_colisao"""
+        return obstaculo.tipo
+    
+    def retangulos_colisao(self):
+        """Retângulos de colisão dos obstáculos ativos, em ordem de x"""
+        return [obstaculo.rect for obstaculo in self.obstaculos]
     
     def verificar_colisao(self, rect_jogador):
         """Verifica colisão com qualquer obstáculo"""
-        for obstaculo in self.obstaculos:
-            if rect_jogador.colliderect(obstaculo.get_rect()):
-                return True
-        return False
+        return self.consultar_colisao(rect_jogador) is not None
+    
+    def estatisticas(self):
+        """Retorna os contadores do pool de obstáculos"""
+        return {
+            'ativos': len(self.obstaculos),
+            'pool': len(self.livres),
+            'alocacoes': self.alocacoes
+        }
     
     def resetar(self):
         """Reseta o gerenciador de obstáculos"""
+        self.livres.extend(self.obstaculos)
         self.obstaculos.clear()
         self.tempo_ultimo_spawn = 0
         self.intervalo_spawn = 90
\ No newline at end of file
@@ -0,0 +1,228 @@
+import random
+import numpy as np
+import pygame
+from scripts import fases
+from scripts.fases import FASES, LARGURA_REFERENCIA, MARGEM_LUT
+from scripts.obstaculo import atlas_obstaculos
+from scripts.fluxo_obstaculos import FluxoObstaculos
+
+# Dados da tabela de fases indexados pelo número da fase (a posição 0 não é usada)
+MULTIPLICADORES_FASE = np.array([1.0] + [fase.multiplicador_obstaculos for fase in FASES])
+CORES_BORDA = (None,) + tuple(fase.cor_borda_obstaculo for fase in FASES)
+
+
+def arredondar_rect(valores):
+    """Arredonda como a atribuição de coordenadas a pygame.Rect (metade para longe do zero)"""
+    return np.trunc(valores + np.copysign(0.5, valores)).astype(np.int32)
+
+
+class GerenciadorObstaculosVetorizado:
+    """Gerenciador de obstáculos com os dados em arrays NumPy contíguos
+
+    Mantém a mesma interface de GerenciadorObstaculos, mas move, descarta e
+    testa colisão de todos os obstáculos com uma operação vetorizada cada.
+    """
+
+    def __init__(self, tela, largura_tela, altura_tela, velocidade_base=4, escala_tempo=1.0,
+                 fluxo=None, capacidade=64):
+        self.tela = tela
+        self.largura_tela = largura_tela
+        self.altura_tela = altura_tela
+        self.velocidade_base = velocidade_base
+
+        # Colunas da tela convertidas para as da tabela de cor das fases
+        self.escala_lut = LARGURA_REFERENCIA / largura_tela
+
+        # Quadros de referência (60 FPS) que cada passo da simulação avança
+        self.escala_tempo = escala_tempo
+
+        self.tempo_ultimo_spawn = 0
+        self.intervalo_spawn = 90  # frames
+        self.fase_atual = 1  # Será atualizado pela partida
+
+        # Layouts dos próximos pares, pré-gerados pela semente da partida
+        # (sementes iguais geram os mesmos obstáculos)
+        if fluxo is None:
+            # Sem thread: ninguém fecharia o fluxo de um gerenciador avulso
+            fluxo = FluxoObstaculos(altura_tela, em_segundo_plano=False)
+            fluxo.reiniciar(random.randrange(2 ** 32), FASES[self.fase_atual - 1])
+        self.fluxo = fluxo
+
+        # Estrutura de arrays (apenas os n primeiros elementos são válidos)
+        self.n = 0
+        self._alocar(capacidade)
+        self.proximo_id = 0
+
+        # Áreas ocupadas no último desenho, por id do obstáculo
+        self.rects_desenho = {}
+
+    def _alocar(self, capacidade):
+        """Cria (ou aumenta) os arrays preservando os obstáculos atuais"""
+        antigos = None
+        if self.n:
+            antigos = (self.x[:self.n], self.x_anterior[:self.n], self.y[:self.n],
+                       self.largura[:self.n], self.altura[:self.n],
+                       self.velocidade[:self.n], self.fase[:self.n], self.ids[:self.n])
+
+        self.capacidade = capacidade
+        self.x = np.zeros(capacidade, dtype=np.float64)
+        self.x_anterior = np.zeros(capacidade, dtype=np.float64)  # Para interpolar o desenho
+        self.y = np.zeros(capacidade, dtype=np.int32)
+        self.largura = np.zeros(capacidade, dtype=np.int32)
+        self.altura = np.zeros(capacidade, dtype=np.int32)
+        self.velocidade = np.zeros(capacidade, dtype=np.float64)
+        self.fase = np.zeros(capacidade, dtype=np.int8)
+        self.ids = np.zeros(capacidade, dtype=np.int64)
+
+        if antigos is not None:
+            for destino, origem in zip(self._colunas(), antigos):
+                destino[:self.n] = origem
+
+    def _colunas(self):
+        """Todos os arrays por obstáculo, na mesma ordem"""
+        return (self.x, self.x_anterior, self.y, self.largura, self.altura,
+                self.velocidade, self.fase, self.ids)
+
+    @property
+    def quantidade(self):
+        """Número de obstáculos ativos"""
+        return self.n
+
+    def atualizar(self, pontuacao, multiplicador_velocidade=1.0):
+        """Atualiza todos os obstáculos"""
+        n = self.n
+        if n:
+            # Movimento
+            self.x_anterior[:n] = self.x[:n]
+            self.x[:n] -= self.velocidade[:n] * (multiplicador_velocidade * self.escala_tempo)
+
+            # Remover obstáculos fora da tela (compactação em uma passada)
+            visiveis = self.x[:n] + self.largura[:n] >= 0
+            if not visiveis.all():
+                self._compactar(visiveis)
+
+        # Gerar novos obstáculos
+        self.tempo_ultimo_spawn += self.escala_tempo
+        if self.tempo_ultimo_spawn >= self.intervalo_spawn:
+            self.criar_par_obstaculos()
+            self.tempo_ultimo_spawn = 0
+
+        # Ajustar dificuldade baseado na pontuação
+        self.ajustar_dificuldade(pontuacao)
+
+    def _compactar(self, mascara):
+        """Mantém apenas os obstáculos marcados na máscara"""
+        n = self.n
+        restantes = int(mascara.sum())
+        for array in self._colunas():
+            array[:restantes] = array[:n][mascara]
+        self.n = restantes
+
+    def _adicionar(self, y, largura, altura):
+        """Adiciona um obstáculo na borda direita da tela"""
+        if self.n == self.capacidade:
+            self._alocar(self.capacidade * 2)
+
+        i = self.n
+        self.x[i] = self.largura_tela
+        self.x_anterior[i] = self.largura_tela
+        self.y[i] = y
+        self.largura[i] = largura
+        self.altura[i] = altura
+        self.velocidade[i] = self.velocidade_base * MULTIPLICADORES_FASE[self.fase_atual]
+        self.fase[i] = self.fase_atual
+        self.ids[i] = self.proximo_id
+        self.proximo_id += 1
+        self.n += 1
+
+    def criar_par_obstaculos(self):
+        """Cria um par de obstáculos (superior e inferior) com o próximo layout do fluxo"""
+        posicao_vao, altura_vao, largura_superior, largura_inferior = self.fluxo.proximo_par()
+
+        # Obstáculo superior e inferior
+        self._adicionar(0, largura_superior, posicao_vao)
+        self._adicionar(posicao_vao + altura_vao, largura_inferior,
+                        self.altura_tela - (posicao_vao + altura_vao))
+
+    def ajustar_dificuldade(self, pontuacao):
+        """Ajusta a dificuldade baseado na pontuação (apenas para progressão dentro da fase)"""
+        # Diminuir intervalo de spawn gradualmente (mais obstáculos)
+        if pontuacao > 0 and pontuacao % 100 == 0:
+            self.intervalo_spawn = max(60, self.intervalo_spawn - 3 * self.escala_tempo)
+
+    def colisoes(self, rect_jogador):
+        """Máscara booleana dos obstáculos que se sobrepõem ao retângulo"""
+        n = self.n
+        # Mesmo arredondamento de Obstaculo.rect
+        x = arredondar_rect(self.x[:n])
+        y = self.y[:n]
+        return ((x < rect_jogador.right) & (x + self.largura[:n] > rect_jogador.left) &
+                (y < rect_jogador.bottom) & (y + self.altura[:n] > rect_jogador.top))
+
+    def consultar_colisao(self, rect_jogador):
+        """Retorna o índice do obstáculo atingido pelo retângulo (ou None)"""
+        if not self.n:
+            return None
+        indices = np.flatnonzero(self.colisoes(rect_jogador))
+        return int(indices[0]) if len(indices) else None
+
+    def consultar_colisoes(self, rect_jogador):
+        """Retorna os índices de todos os obstáculos atingidos pelo retângulo"""
+        if not self.n:
+            return []
+        return np.flatnonzero(self.colisoes(rect_jogador)).tolist()
+
+    def verificar_colisao(self, rect_jogador):
+        """Verifica colisão com qualquer obstáculo"""
+        if not self.n:
+            return False
+        return bool(self.colisoes(rect_jogador).any())
+
+    def tipo_obstaculo(self, indice):
+        """Tipo ('superior' ou 'inferior') de um obstáculo retornado por consultar_colisao"""
+        return 'superior' if self.y[indice] == 0 else 'inferior'
+
+    def retangulos_colisao(self):
+        """Retângulos de colisão dos obstáculos ativos, em ordem de x"""
+        n = self.n
+        return [pygame.Rect(x, y, largura, altura)
+                for x, y, largura, altura in zip(arredondar_rect(self.x[:n]).tolist(),
+                                                 self.y[:n].tolist(),
+                                                 self.largura[:n].tolist(),
+                                                 self.altura[:n].tolist())]
+
+    def desenhar(self, alfa=1.0):
+        """Desenha todos os obstáculos (interpolados entre os dois últimos passos)"""
+        n = self.n
+        if not n:
+            self.rects_desenho = {}
+            return
+
+        # Posição e coluna da tabela de cor calculadas para todos de uma vez
+        x = self.x_anterior[:n] + (self.x[:n] - self.x_anterior[:n]) * alfa
+        colunas_cor = (x * self.escala_lut).astype(np.int64) + MARGEM_LUT
+        colunas = zip(self.fase[:n].tolist(), self.largura[:n].tolist(),
+                      self.altura[:n].tolist(), colunas_cor.tolist(),
+                      x.astype(np.int32).tolist(), self.y[:n].tolist())
+
+        # Tabelas de cor lidas a cada desenho (os níveis podem ser reconfigurados)
+        luts_cor = (None,) + tuple(registro.lut_cor for registro in fases.FASES)
+        sequencia = []
+        for fase, largura, altura, coluna, x, y in colunas:
+            corpo = atlas_obstaculos.obter(luts_cor[fase][coluna], CORES_BORDA[fase],
+                                           largura, altura)
+            sequencia.append((corpo, (x, y)))
+
+        rects = self.tela.blits(sequencia)
+        self.rects_desenho = dict(zip(self.ids[:n].tolist(), rects))
+
+    def retangulos_desenho(self):
+        """Áreas da tela ocupadas no último desenho, por obstáculo"""
+        return self.rects_desenho
+
+    def resetar(self):
+        """Reseta o gerenciador de obstáculos"""
+        self.n = 0
+        self.rects_desenho = {}
+        self.tempo_ultimo_spawn = 0
+        self.intervalo_spawn = 90
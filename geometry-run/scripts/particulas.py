@@ -0,0 +1,222 @@
+"""Partículas em arrays NumPy: rastro do turbo, subida de nível e batida
+
+As partículas ficam em arrays pré-alocados com capacidade fixa, sem nenhum
+objeto Python por partícula: emitir escreve em fatias dos arrays, atualizar
+é uma operação vetorizada por atributo e desenhar é um único Surface.blits
+com sprites pré-renderizados (um por cor, raio e nível de transparência).
+Partículas emitidas com o sistema cheio são descartadas.
+"""
+from collections import namedtuple
+import math
+import time
+import numpy as np
+import pygame
+
+CAPACIDADE_PADRAO = 1024
+
+# Níveis de transparência dos sprites (a partícula some conforme a vida acaba)
+NIVEIS_ALFA = 8
+
+# Como cada emissor lança as partículas (ângulos em radianos, velocidades em
+# pixels e vidas em quadros de referência de 60 FPS)
+Emissor = namedtuple('Emissor', ('quantidade', 'angulo', 'abertura', 'velocidade',
+                                 'vida', 'raio', 'gravidade', 'arrasto'))
+
+# Faíscas para trás do jogador enquanto o turbo está ativo
+EMISSOR_TURBO = Emissor(quantidade=3, angulo=math.pi, abertura=0.5, velocidade=(3.0, 7.0),
+                        vida=(12, 24), raio=3, gravidade=0.0, arrasto=0.92)
+# Rajada ao ligar o turbo
+EMISSOR_TURBO_INICIO = EMISSOR_TURBO._replace(quantidade=40, abertura=1.2,
+                                              velocidade=(4.0, 10.0))
+# Anel ao subir de nível
+EMISSOR_NIVEL = Emissor(quantidade=120, angulo=0.0, abertura=math.pi, velocidade=(3.0, 6.0),
+                        vida=(30, 50), raio=4, gravidade=0.0, arrasto=0.95)
+# Estilhaços da batida (caem com gravidade)
+EMISSOR_BATIDA = Emissor(quantidade=200, angulo=0.0, abertura=math.pi, velocidade=(2.0, 12.0),
+                         vida=(30, 60), raio=3, gravidade=0.35, arrasto=0.97)
+
+# Emissores pelo nome usado nas cenas
+EMISSORES = {
+    'turbo': EMISSOR_TURBO,
+    'turbo_inicio': EMISSOR_TURBO_INICIO,
+    'nivel': EMISSOR_NIVEL,
+    'batida': EMISSOR_BATIDA
+}
+
+
+class SpritesParticulas:
+    """Sprites das partículas por (cor, raio), com um quadro por nível de transparência"""
+
+    def __init__(self):
+        self.tipos = []  # tipo -> lista de NIVEIS_ALFA superfícies
+        self.indices = {}  # (cor, raio) -> tipo
+
+    def obter_tipo(self, cor, raio):
+        """Índice do tipo de sprite (renderizado na primeira vez)"""
+        chave = (tuple(cor), raio)
+        tipo = self.indices.get(chave)
+        if tipo is None:
+            quadros = []
+            for nivel in range(NIVEIS_ALFA):
+                superficie = pygame.Surface((2 * raio, 2 * raio), pygame.SRCALPHA)
+                alfa = 255 * (nivel + 1) // NIVEIS_ALFA
+                pygame.draw.circle(superficie, (*chave[0], alfa), (raio, raio), raio)
+                if pygame.display.get_surface() is not None:
+                    superficie = superficie.convert_alpha()
+                quadros.append(superficie)
+            tipo = self.indices[chave] = len(self.tipos)
+            self.tipos.append(quadros)
+        return tipo
+
+
+class SistemaParticulas:
+    """Partículas de uma cena em estrutura de arrays (só as n primeiras estão vivas)"""
+
+    def __init__(self, tela, capacidade=CAPACIDADE_PADRAO, escala_tempo=1.0, semente=None):
+        self.tela = tela
+        self.capacidade = capacidade
+        self.escala_tempo = escala_tempo
+        self.aleatorio = np.random.default_rng(semente)
+        self.sprites = SpritesParticulas()
+
+        self.n = 0
+        self.x = np.zeros(capacidade)
+        self.y = np.zeros(capacidade)
+        self.x_anterior = np.zeros(capacidade)  # Para interpolar o desenho
+        self.y_anterior = np.zeros(capacidade)
+        self.vx = np.zeros(capacidade)
+        self.vy = np.zeros(capacidade)
+        self.vida = np.zeros(capacidade)
+        self.vida_total = np.ones(capacidade)
+        self.gravidade = np.zeros(capacidade)
+        self.arrasto = np.ones(capacidade)
+        self.tipo = np.zeros(capacidade, dtype=np.int32)
+        self.raio = np.zeros(capacidade, dtype=np.int32)
+
+        # Fração de partícula que sobrou de cada emissor contínuo
+        self.fracoes = {}
+
+        # Área ocupada no último desenho (None se nada foi desenhado)
+        self.rect_desenho = None
+
+        # Custo (ms) do último passo e do último desenho, e partículas descartadas
+        self.custo_atualizar = 0.0
+        self.custo_desenhar = 0.0
+        self.pior_atualizar = 0.0
+        self.pior_desenhar = 0.0
+        self.descartadas = 0
+
+    def _colunas(self):
+        """Todos os arrays por partícula, na mesma ordem"""
+        return (self.x, self.y, self.x_anterior, self.y_anterior, self.vx, self.vy,
+                self.vida, self.vida_total, self.gravidade, self.arrasto, self.tipo, self.raio)
+
+    def emitir(self, emissor, x, y, cor, quantidade=None):
+        """Lança as partículas do emissor a partir de (x, y) com a cor informada"""
+        if quantidade is None:
+            quantidade = emissor.quantidade
+        livres = self.capacidade - self.n
+        if quantidade > livres:
+            self.descartadas += quantidade - livres
+            quantidade = livres
+        if quantidade <= 0:
+            return
+
+        aleatorio = self.aleatorio
+        fatia = slice(self.n, self.n + quantidade)
+        angulos = emissor.angulo + aleatorio.uniform(-emissor.abertura, emissor.abertura,
+                                                     quantidade)
+        velocidades = aleatorio.uniform(*emissor.velocidade, quantidade)
+        self.x[fatia] = x
+        self.y[fatia] = y
+        self.x_anterior[fatia] = x
+        self.y_anterior[fatia] = y
+        self.vx[fatia] = np.cos(angulos) * velocidades
+        self.vy[fatia] = np.sin(angulos) * velocidades
+        self.vida[fatia] = self.vida_total[fatia] = aleatorio.uniform(*emissor.vida, quantidade)
+        self.gravidade[fatia] = emissor.gravidade
+        self.arrasto[fatia] = emissor.arrasto
+        self.tipo[fatia] = self.sprites.obter_tipo(cor, emissor.raio)
+        self.raio[fatia] = emissor.raio
+        self.n += quantidade
+
+    def emitir_continuo(self, emissor, x, y, cor):
+        """Emite a quantidade do emissor por quadro de referência, em um passo
+
+        As frações acumulam entre os passos, então o número de partículas por
+        segundo não depende da taxa de simulação.
+        """
+        total = self.fracoes.get(emissor, 0.0) + emissor.quantidade * self.escala_tempo
+        quantidade = int(total)
+        self.fracoes[emissor] = total - quantidade
+        if quantidade:
+            self.emitir(emissor, x, y, cor, quantidade)
+
+    def atualizar(self):
+        """Avança todas as partículas um passo de simulação"""
+        inicio = time.perf_counter()
+        n = self.n
+        if n:
+            escala = self.escala_tempo
+            self.x_anterior[:n] = self.x[:n]
+            self.y_anterior[:n] = self.y[:n]
+            self.x[:n] += self.vx[:n] * escala
+            self.y[:n] += self.vy[:n] * escala
+            self.vy[:n] += self.gravidade[:n] * escala
+            arrasto = self.arrasto[:n] ** escala
+            self.vx[:n] *= arrasto
+            self.vy[:n] *= arrasto
+            self.vida[:n] -= escala
+
+            # Remover as que morreram (compactação em uma passada)
+            vivas = self.vida[:n] > 0
+            if not vivas.all():
+                restantes = int(vivas.sum())
+                for array in self._colunas():
+                    array[:restantes] = array[:n][vivas]
+                self.n = restantes
+        self.custo_atualizar = (time.perf_counter() - inicio) * 1000
+        self.pior_atualizar = max(self.pior_atualizar, self.custo_atualizar)
+
+    def desenhar(self, alfa=1.0):
+        """Desenha todas as partículas com um único blits; retorna a área ocupada"""
+        inicio = time.perf_counter()
+        n = self.n
+        if not n:
+            self.rect_desenho = None
+            self.custo_desenhar = 0.0
+            return None
+
+        x = self.x_anterior[:n] + (self.x[:n] - self.x_anterior[:n]) * alfa - self.raio[:n]
+        y = self.y_anterior[:n] + (self.y[:n] - self.y_anterior[:n]) * alfa - self.raio[:n]
+        niveis = np.minimum(self.vida[:n] / self.vida_total[:n] * NIVEIS_ALFA,
+                            NIVEIS_ALFA - 1).astype(np.int32)
+        tipos = self.sprites.tipos
+        sequencia = [(tipos[tipo][nivel], (px, py))
+                     for tipo, nivel, px, py in zip(self.tipo[:n].tolist(), niveis.tolist(),
+                                                    x.astype(np.int32).tolist(),
+                                                    y.astype(np.int32).tolist())]
+        rects = self.tela.blits(sequencia)
+        self.rect_desenho = rects[0].unionall(rects)
+
+        self.custo_desenhar = (time.perf_counter() - inicio) * 1000
+        self.pior_desenhar = max(self.pior_desenhar, self.custo_desenhar)
+        return self.rect_desenho
+
+    def limpar(self):
+        """Remove todas as partículas (os sprites continuam em cache)"""
+        self.n = 0
+        self.fracoes.clear()
+        self.rect_desenho = None
+
+    def estatisticas(self):
+        """Partículas vivas, descartadas e custo (ms) do último quadro e o pior"""
+        return {
+            'ativas': self.n,
+            'capacidade': self.capacidade,
+            'descartadas': self.descartadas,
+            'atualizar_ms': self.custo_atualizar,
+            'desenhar_ms': self.custo_desenhar,
+            'pior_atualizar_ms': self.pior_atualizar,
+            'pior_desenhar_ms': self.pior_desenhar
+        }
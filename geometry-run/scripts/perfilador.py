@@ -0,0 +1,222 @@
+import csv
+import json
+import os
+import time
+from array import array
+import pygame
+from scripts.interfaces import cache_texto
+
+# Etapas do loop principal (somadas dão o tempo total do quadro)
+ETAPAS = ('eventos', 'atualizar', 'desenhar', 'apresentar', 'espera')
+
+# Subetapas medidas dentro de "desenhar"
+SUBETAPAS = ('obstaculos', 'particulas', 'hud')
+
+# Cores das etapas no gráfico do painel
+CORES_ETAPAS = {
+    'eventos': (230, 200, 60),
+    'atualizar': (80, 200, 120),
+    'desenhar': (70, 150, 255),
+    'apresentar': (230, 100, 230),
+    'espera': (90, 90, 110)
+}
+
+
+def percentil(ordenados, p):
+    """Percentil p (0-100) pelo método do posto mais próximo"""
+    if not ordenados:
+        return 0.0
+    posto = max(1, -(-len(ordenados) * p // 100))
+    return ordenados[int(posto) - 1]
+
+
+class Perfilador:
+    """Tempos de cada etapa do quadro guardados em um buffer circular de tamanho fixo
+
+    Desativado, cada marcação só testa um atributo e retorna.
+    """
+
+    def __init__(self, capacidade=600):
+        self.capacidade = capacidade
+        self.ativo = False
+
+        # Uma coluna por etapa; a posição indice é a próxima a ser escrita
+        self.amostras = {etapa: array('d', bytes(8 * capacidade))
+                         for etapa in ETAPAS + SUBETAPAS}
+        self.indice = 0
+        self.quantidade = 0
+
+        # Quadro em andamento
+        self.atual = dict.fromkeys(ETAPAS + SUBETAPAS, 0.0)
+        self.ultimo = 0.0
+
+    def ativar(self, ativo=True):
+        """Liga ou desliga a coleta (o quadro em andamento é descartado)"""
+        self.ativo = ativo
+        self.iniciar_quadro()
+
+    def iniciar_quadro(self):
+        """Marca o início de um quadro"""
+        if not self.ativo:
+            return
+        for etapa in self.atual:
+            self.atual[etapa] = 0.0
+        self.ultimo = time.perf_counter()
+
+    def marcar(self, etapa):
+        """Atribui à etapa o tempo decorrido desde a marcação anterior"""
+        if not self.ativo:
+            return
+        agora = time.perf_counter()
+        self.atual[etapa] += agora - self.ultimo
+        self.ultimo = agora
+
+    def inicio(self):
+        """Instante para medir uma subetapa com acumular() (0 se desativado)"""
+        return time.perf_counter() if self.ativo else 0.0
+
+    def acumular(self, subetapa, inicio):
+        """Soma à subetapa o tempo decorrido desde inicio"""
+        if not self.ativo:
+            return
+        self.atual[subetapa] += time.perf_counter() - inicio
+
+    def fechar_quadro(self):
+        """Grava o quadro em andamento no buffer circular"""
+        if not self.ativo:
+            return
+        i = self.indice
+        for etapa, valor in self.atual.items():
+            self.amostras[etapa][i] = valor * 1000
+        self.indice = (i + 1) % self.capacidade
+        self.quantidade = min(self.quantidade + 1, self.capacidade)
+
+    def serie(self, etapa, ultimos=None):
+        """Amostras (ms) da etapa em ordem cronológica"""
+        quantidade = self.quantidade if ultimos is None else min(ultimos, self.quantidade)
+        inicio = (self.indice - quantidade) % self.capacidade
+        coluna = self.amostras[etapa]
+        if inicio + quantidade <= self.capacidade:
+            return coluna[inicio:inicio + quantidade].tolist()
+        return (coluna[inicio:] + coluna[:inicio + quantidade - self.capacidade]).tolist()
+
+    def totais(self, ultimos=None):
+        """Tempo total (ms) de cada quadro em ordem cronológica"""
+        series = [self.serie(etapa, ultimos) for etapa in ETAPAS]
+        return [sum(valores) for valores in zip(*series)]
+
+    def medias(self, ultimos=None):
+        """Média (ms) de cada etapa e subetapa"""
+        medias = {}
+        for etapa in ETAPAS + SUBETAPAS:
+            valores = self.serie(etapa, ultimos)
+            medias[etapa] = sum(valores) / len(valores) if valores else 0.0
+        return medias
+
+    def exportar_csv(self, caminho):
+        """Grava o buffer em CSV (uma linha por quadro, tempos em ms)"""
+        colunas = ETAPAS + SUBETAPAS
+        series = [self.serie(etapa) for etapa in colunas]
+        with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(('quadro',) + colunas + ('total',))
+            for quadro, valores in enumerate(zip(*series)):
+                total = sum(valores[:len(ETAPAS)])
+                escritor.writerow([quadro] + [f"{valor:.4f}" for valor in valores] +
+                                  [f"{total:.4f}"])
+
+    def exportar_json(self, caminho):
+        """Grava o buffer em JSON (uma lista de tempos por etapa, em ms)"""
+        dados = {
+            'unidade': 'ms',
+            'quadros': self.quantidade,
+            'etapas': {etapa: self.serie(etapa) for etapa in ETAPAS + SUBETAPAS},
+            'medias': self.medias()
+        }
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo, indent=2)
+
+    def exportar(self, pasta='.'):
+        """Grava CSV e JSON com o horário no nome; retorna os caminhos"""
+        os.makedirs(pasta, exist_ok=True)
+        base = os.path.join(pasta, time.strftime("perfil_%Y%m%d_%H%M%S"))
+        self.exportar_csv(base + '.csv')
+        self.exportar_json(base + '.json')
+        return base + '.csv', base + '.json'
+
+
+class PainelPerfilador:
+    """Painel sobre a tela com o gráfico dos tempos de quadro por etapa"""
+
+    def __init__(self, perfilador, largura_tela, altura_tela, largura=300, altura=170,
+                 escala_ms=40.0, intervalo_texto=30):
+        self.perfilador = perfilador
+        self.rect = pygame.Rect(largura_tela - largura - 10, altura_tela - altura - 10,
+                                largura, altura)
+        self.superficie = pygame.Surface(self.rect.size)
+        self.altura_grafico = altura - 84
+        self.escala_ms = escala_ms  # Tempo que ocupa a altura toda do gráfico
+
+        # Os textos só são refeitos a cada intervalo_texto quadros
+        self.intervalo_texto = intervalo_texto
+        self.quadros_desde_texto = intervalo_texto
+        self.textos = []
+
+    def atualizar_textos(self):
+        """Renderiza as médias recentes de cada etapa"""
+        medias = self.perfilador.medias(self.intervalo_texto)
+        total = sum(medias[etapa] for etapa in ETAPAS)
+        self.textos = [cache_texto.renderizar(f"quadro {total:5.2f} ms", None, 18,
+                                              (240, 240, 240))]
+        for etapa in ETAPAS + SUBETAPAS:
+            cor = CORES_ETAPAS.get(etapa, (180, 180, 180))
+            self.textos.append(cache_texto.renderizar(f"{etapa} {medias[etapa]:.2f}",
+                                                      None, 16, cor))
+
+    def desenhar(self, tela):
+        """Desenha o painel e retorna a área ocupada"""
+        self.quadros_desde_texto += 1
+        if self.quadros_desde_texto >= self.intervalo_texto:
+            self.atualizar_textos()
+            self.quadros_desde_texto = 0
+
+        superficie = self.superficie
+        superficie.fill((10, 10, 20))
+        largura = self.rect.width
+        base = self.altura_grafico
+        escala = base / self.escala_ms
+
+        # Linhas de referência de 60 e 30 FPS
+        for ms in (1000 / 60, 1000 / 30):
+            y = base - int(ms * escala)
+            if y > 0:
+                pygame.draw.line(superficie, (70, 70, 70), (0, y), (largura, y))
+
+        # Barras empilhadas por etapa, uma coluna por quadro (mais recente à direita)
+        series = [(CORES_ETAPAS[etapa], self.perfilador.serie(etapa, largura))
+                  for etapa in ETAPAS]
+        quantidade = len(series[0][1])
+        for coluna in range(quantidade):
+            x = largura - quantidade + coluna
+            y = base
+            for cor, valores in series:
+                altura = int(valores[coluna] * escala)
+                if altura:
+                    pygame.draw.line(superficie, cor, (x, y), (x, max(0, y - altura)))
+                    y -= altura
+                    if y <= 0:
+                        break
+
+        # Médias por etapa em duas colunas abaixo do gráfico
+        for i, texto in enumerate(self.textos):
+            if i == 0:
+                superficie.blit(texto, (6, base + 4))
+            else:
+                linha, coluna = divmod(i - 1, 2)
+                superficie.blit(texto, (6 + coluna * (largura // 2), base + 22 + linha * 14))
+
+        return tela.blit(superficie, self.rect)
+
+
+# Perfilador compartilhado pelo loop principal e pelas cenas
+perfilador = Perfilador()
@@ -0,0 +1,218 @@
+"""Recordes por fase gravados em disco sem travar o loop do jogo
+
+As pontuações ficam em um log só de acréscimos, uma linha JSON por entrada.
+A gravação é feita por uma thread de escrita; o jogo só atualiza a lista em
+memória e enfileira a linha. Quando o log cresce além do limite, ele é
+reescrito só com as melhores entradas de cada fase em um arquivo temporário
+que substitui o original de uma vez (os.replace).
+"""
+import bisect
+import heapq
+import json
+import os
+import queue
+import threading
+import time
+
+# Pasta padrão dos dados do jogador (geometry-run/dados)
+PASTA_DADOS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'dados')
+
+MAX_ENTRADAS = 10  # Melhores pontuações guardadas por fase
+LIMITE_LOG = 200  # Linhas no log antes da compactação
+
+
+class RegistroPontuacoes:
+    """As melhores pontuações de cada fase, com o instante de cada uma
+
+    Uma linha incompleta (queda no meio da escrita) é ignorada na leitura e
+    cortada do fim do log antes do próximo acréscimo, e a compactação nunca
+    deixa o arquivo pela metade: ou o log antigo continua inteiro, ou o novo
+    já o substituiu.
+    """
+
+    def __init__(self, caminho, max_entradas=MAX_ENTRADAS, limite_log=LIMITE_LOG):
+        self.caminho = caminho
+        self.max_entradas = max_entradas
+        self.limite_log = limite_log
+
+        # fase -> [(-pontuação, instante), ...] em ordem crescente (melhor primeiro)
+        self.entradas = {}
+        self.linhas_log = 0
+        self.trava = threading.Lock()
+
+        # Linhas a gravar; None encerra a thread de escrita
+        self.fila = queue.Queue()
+        self.escritor = None
+
+        self.carregar()
+        if self.linhas_log > self.limite_log:
+            self._iniciar_escritor()  # Compacta o log grande em segundo plano
+
+    def carregar(self):
+        """Lê o log do disco (só as melhores entradas ficam em memória)"""
+        try:
+            with open(self.caminho, 'rb') as arquivo:
+                dados = arquivo.read()
+        except FileNotFoundError:
+            return
+        if dados and not dados.endswith(b'\n'):
+            dados = self._reparar_cauda(dados)
+        linhas = dados.splitlines()
+
+        # Caminho rápido: o log inteiro como um único array JSON
+        try:
+            entradas = json.loads(b'[' + b','.join(linhas) + b']')
+        except ValueError:
+            entradas = []
+            for linha in linhas:
+                try:
+                    entradas.append(json.loads(linha))
+                except ValueError:
+                    continue  # Linha incompleta (queda no meio da escrita)
+
+        chaves = {}
+        for entrada in entradas:
+            try:
+                chave = (-int(entrada['pontuacao']), float(entrada['instante']))
+                chaves.setdefault(int(entrada['fase']), set()).add(chave)
+            except (ValueError, KeyError, TypeError):
+                continue  # Linha corrompida
+        for fase, conjunto in chaves.items():
+            self.entradas[fase] = heapq.nsmallest(self.max_entradas, conjunto)
+        self.linhas_log = len(linhas)
+
+    def _reparar_cauda(self, dados):
+        """Termina o log em fim de linha para o próximo acréscimo não colar no resto
+
+        A última linha sem quebra é cortada se estiver incompleta, ou recebe a
+        quebra que faltava. Retorna o conteúdo do log depois do reparo.
+        """
+        inicio_cauda = dados.rfind(b'\n') + 1
+        try:
+            json.loads(dados[inicio_cauda:])
+            completa = True
+        except ValueError:
+            completa = False
+        try:
+            with open(self.caminho, 'r+b') as arquivo:
+                if completa:
+                    arquivo.seek(0, os.SEEK_END)
+                    arquivo.write(b'\n')
+                else:
+                    arquivo.truncate(inicio_cauda)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+        except OSError as e:
+            print(f"Erro ao reparar o log de pontuações: {e}")
+        return dados + b'\n' if completa else dados[:inicio_cauda]
+
+    def _inserir(self, fase, pontuacao, instante):
+        """Coloca a entrada no ranking da fase; retorna se ela entrou"""
+        entradas = self.entradas.setdefault(fase, [])
+        chave = (-pontuacao, instante)
+        posicao = bisect.bisect_left(entradas, chave)
+        if posicao >= self.max_entradas:
+            return False
+        if posicao < len(entradas) and entradas[posicao] == chave:
+            return False  # Entrada repetida
+
+        entradas.insert(posicao, chave)
+        del entradas[self.max_entradas:]
+        return True
+
+    def recorde(self, fase):
+        """Maior pontuação da fase (0 se ainda não há nenhuma)"""
+        entradas = self.entradas.get(fase)
+        return -entradas[0][0] if entradas else 0
+
+    def melhores(self, fase):
+        """Lista de (pontuação, instante) da fase, da melhor para a pior"""
+        with self.trava:
+            return [(-negativo, instante) for negativo, instante in self.entradas.get(fase, [])]
+
+    def registrar(self, fase, pontuacao, instante=None):
+        """Registra a pontuação de uma partida e retorna o recorde da fase
+
+        Só atualiza a memória e enfileira a gravação: não espera o disco.
+        """
+        if instante is None:
+            instante = time.time()
+        with self.trava:
+            entrou = self._inserir(fase, pontuacao, instante)
+        if entrou:
+            self._iniciar_escritor()
+            self.fila.put({'fase': fase, 'pontuacao': pontuacao, 'instante': instante})
+        return self.recorde(fase)
+
+    def _iniciar_escritor(self):
+        """Cria a thread de escrita se ela ainda não existe"""
+        if self.escritor is None:
+            self.escritor = threading.Thread(target=self._escrever, name='pontuacoes',
+                                             daemon=True)
+            self.escritor.start()
+
+    def _escrever(self):
+        """Loop da thread de escrita: grava as linhas da fila em lotes"""
+        rodando = True
+        while rodando:
+            try:
+                if self.linhas_log > self.limite_log:
+                    self.compactar()
+            except OSError as e:
+                print(f"Erro ao compactar pontuações: {e}")
+
+            lote = [self.fila.get()]
+            while True:
+                try:
+                    lote.append(self.fila.get_nowait())
+                except queue.Empty:
+                    break
+            if None in lote:
+                rodando = False
+                lote = [entrada for entrada in lote if entrada is not None]
+
+            try:
+                if lote:
+                    self._acrescentar(lote)
+                if not rodando and self.linhas_log > self.limite_log:
+                    self.compactar()
+            except OSError as e:
+                print(f"Erro ao gravar pontuações: {e}")
+
+    def _acrescentar(self, lote):
+        """Acrescenta as entradas ao fim do log e força a ida ao disco"""
+        pasta = os.path.dirname(self.caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+        texto = "".join(json.dumps(entrada) + "\n" for entrada in lote)
+        with open(self.caminho, 'a', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        self.linhas_log += len(lote)
+
+    def compactar(self):
+        """Reescreve o log só com as melhores entradas (troca atômica do arquivo)
+
+        Chamado pela thread de escrita, que é a única a mexer no arquivo.
+        """
+        with self.trava:
+            linhas = [json.dumps({'fase': fase, 'pontuacao': -negativo, 'instante': instante})
+                      for fase, entradas in sorted(self.entradas.items())
+                      for negativo, instante in entradas]
+
+        temporario = self.caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("".join(linha + "\n" for linha in linhas))
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, self.caminho)
+        self.linhas_log = len(linhas)
+
+    def fechar(self, tempo_limite=2.0):
+        """Espera a thread de escrita gravar o que falta (chamado ao sair)"""
+        if self.escritor is None:
+            return
+        self.fila.put(None)
+        self.escritor.join(tempo_limite)
+        self.escritor = None
@@ -0,0 +1,90 @@
+import pygame
+from scripts.perfilador import perfilador
+
+
+class RenderizadorRetangulos:
+    """Apresenta só os retângulos alterados, voltando ao flip quando compensa"""
+
+    def __init__(self, tela, ativo=False, limite_percentual=50.0):
+        self.tela = tela
+        self.ativo = ativo
+        self.limite_percentual = limite_percentual
+        self.area_tela = tela.get_width() * tela.get_height()
+
+        # Cena desenhada no quadro anterior em modo parcial
+        self.cena_anterior = None
+
+        # Função opcional desenhada sobre a cena: tela -> área ocupada
+        self.sobreposicao = None
+
+        # Estatísticas
+        self.percentual_atualizado = 100.0
+        self.quadros_parciais = 0
+        self.quadros_completos = 0
+
+    def desenhar(self, cena, alfa=1.0):
+        """Desenha a cena restaurando o fundo apenas onde for necessário"""
+        suporta = self.ativo and hasattr(cena, 'retangulos_alterados')
+        if not suporta:
+            self.cena_anterior = None
+            cena.desenhar_fundo()
+            cena.desenhar(alfa)
+            self.desenhar_sobreposicao()
+            perfilador.marcar('desenhar')
+            self.apresentar(None)
+            return
+
+        # Primeiro quadro da cena: desenho completo para conhecer as áreas ocupadas
+        limpar = cena.retangulos_para_limpar() if cena is self.cena_anterior else None
+        cena.desenhar_fundo(limpar)
+        cena.desenhar(alfa)
+        retangulos = cena.retangulos_alterados()
+        self.cena_anterior = cena
+
+        # Sem retângulos (primeiro quadro da partida, game over) a tela vai inteira
+        area_sobreposicao = self.desenhar_sobreposicao()
+        if retangulos is not None and area_sobreposicao is not None:
+            retangulos.append(area_sobreposicao)
+        perfilador.marcar('desenhar')
+
+        self.apresentar(None if limpar is None else retangulos)
+
+    def desenhar_sobreposicao(self):
+        """Desenha a sobreposição (se houver) e retorna a área ocupada"""
+        if self.sobreposicao is None:
+            return None
+        return self.sobreposicao(self.tela)
+
+    def definir_sobreposicao(self, sobreposicao):
+        """Troca a sobreposição; o próximo quadro é completo para limpar a anterior"""
+        self.sobreposicao = sobreposicao
+        self.invalidar()
+
+    def invalidar(self):
+        """Faz o próximo quadro ser desenhado e apresentado por inteiro"""
+        self.cena_anterior = None
+
+    def apresentar(self, retangulos):
+        """Envia os retângulos para a tela (None = tela inteira)"""
+        if retangulos is not None:
+            tela_rect = self.tela.get_rect()
+            recortados = [rect.clip(tela_rect) for rect in retangulos]
+            area = sum(rect.width * rect.height for rect in recortados)
+            self.percentual_atualizado = min(100.0, 100.0 * area / self.area_tela)
+
+            if self.percentual_atualizado <= self.limite_percentual:
+                pygame.display.update(recortados)
+                self.quadros_parciais += 1
+                return
+
+        self.percentual_atualizado = 100.0
+        pygame.display.flip()
+        self.quadros_completos += 1
+
+    def estatisticas(self):
+        """Retorna os contadores do renderizador"""
+        return {
+            'percentual_atualizado': self.percentual_atualizado,
+            'quadros_parciais': self.quadros_parciais,
+            'quadros_completos': self.quadros_completos
+        }
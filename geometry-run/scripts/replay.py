@@ -0,0 +1,269 @@
+"""Gravação compacta da entrada de uma partida e reprodução passo a passo
+
+Cada passo vira uma máscara de bits (cima, baixo, esquerda, direita, turbo) e
+passos seguidos com a mesma máscara são guardados como um único trecho
+(codificação por comprimento de sequência). Junto com a semente da partida,
+isso basta para repetir a partida exatamente.
+
+Uso (a partir da pasta geometry-run):
+    python -m scripts.replay gravar partida.grr --fase 3 --semente 42 --roteiro "0-600:espaco"
+    python -m scripts.replay verificar partida.grr
+"""
+import argparse
+import struct
+import pygame
+from scripts.fases import NUMEROS_FASES
+from scripts.headless import EstadoTeclas, EntradaRoteirizada, ExecutorHeadless, SEM_TECLAS
+
+# Bits da máscara e as teclas que os acionam (as mesmas lidas pelo jogo)
+CIMA = 1
+BAIXO = 2
+ESQUERDA = 4
+DIREITA = 8
+TURBO = 16
+
+TECLAS_BITS = (
+    (CIMA, (pygame.K_UP, pygame.K_w)),
+    (BAIXO, (pygame.K_DOWN, pygame.K_s)),
+    (ESQUERDA, (pygame.K_LEFT, pygame.K_a)),
+    (DIREITA, (pygame.K_RIGHT, pygame.K_d)),
+    (TURBO, (pygame.K_SPACE,))
+)
+
+# Formato do arquivo
+ASSINATURA = b'GRRP'
+VERSAO = 1
+CABECALHO = struct.Struct('<4sBBQH')  # assinatura, versão, fase, semente, taxa
+RESULTADO = struct.Struct('<iq')  # pontuação, passo da colisão (-1 = nenhum)
+
+
+class ErroReplay(Exception):
+    """Arquivo de replay inválido ou de uma versão desconhecida"""
+
+
+def mascara_teclas(teclas):
+    """Converte o estado do teclado na máscara de bits do replay"""
+    mascara = 0
+    for bit, codigos in TECLAS_BITS:
+        for codigo in codigos:
+            if teclas[codigo]:
+                mascara |= bit
+                break
+    return mascara
+
+
+def teclas_mascara(mascara):
+    """Estado do teclado correspondente à máscara (tecla principal de cada bit)"""
+    if not mascara:
+        return SEM_TECLAS
+    return EstadoTeclas(codigos[0] for bit, codigos in TECLAS_BITS if mascara & bit)
+
+
+def _escrever_varint(saida, valor):
+    """Inteiro sem sinal em base 128 (1 byte para valores até 127)"""
+    while valor >= 0x80:
+        saida.append((valor & 0x7F) | 0x80)
+        valor >>= 7
+    saida.append(valor)
+
+
+def _ler_varint(dados, posicao):
+    """Lê um varint e retorna (valor, nova posição)"""
+    valor = 0
+    deslocamento = 0
+    while True:
+        if posicao >= len(dados):
+            raise ErroReplay("replay truncado")
+        byte = dados[posicao]
+        posicao += 1
+        valor |= (byte & 0x7F) << deslocamento
+        if not byte & 0x80:
+            return valor, posicao
+        deslocamento += 7
+
+
+class Replay:
+    """Semente, fase e entrada de uma partida, com o resultado gravado"""
+
+    def __init__(self, fase, semente, taxa_simulacao, trechos=None,
+                 pontuacao=0, tick_colisao=None):
+        self.fase = fase
+        self.semente = semente
+        self.taxa_simulacao = taxa_simulacao
+        self.trechos = trechos or []  # [(máscara, quantidade de passos), ...]
+        self.pontuacao = pontuacao
+        self.tick_colisao = tick_colisao
+
+    @property
+    def passos(self):
+        """Total de passos gravados"""
+        return sum(quantidade for _, quantidade in self.trechos)
+
+    def serializar(self):
+        """Converte o replay para bytes"""
+        saida = bytearray(CABECALHO.pack(ASSINATURA, VERSAO, self.fase,
+                                         self.semente, self.taxa_simulacao))
+        _escrever_varint(saida, len(self.trechos))
+        for mascara, quantidade in self.trechos:
+            saida.append(mascara)
+            _escrever_varint(saida, quantidade)
+        tick = -1 if self.tick_colisao is None else self.tick_colisao
+        saida += RESULTADO.pack(self.pontuacao, tick)
+        return bytes(saida)
+
+    @classmethod
+    def desserializar(cls, dados):
+        """Cria o replay a partir dos bytes gerados por serializar()"""
+        if len(dados) < CABECALHO.size + RESULTADO.size:
+            raise ErroReplay("replay truncado")
+        assinatura, versao, fase, semente, taxa = CABECALHO.unpack_from(dados)
+        if assinatura != ASSINATURA:
+            raise ErroReplay("arquivo não é um replay do Geometry Run")
+        if versao != VERSAO:
+            raise ErroReplay(f"versão de replay não suportada: {versao}")
+
+        posicao = CABECALHO.size
+        total, posicao = _ler_varint(dados, posicao)
+        trechos = []
+        for _ in range(total):
+            if posicao >= len(dados):
+                raise ErroReplay("replay truncado")
+            mascara = dados[posicao]
+            quantidade, posicao = _ler_varint(dados, posicao + 1)
+            trechos.append((mascara, quantidade))
+
+        if len(dados) - posicao != RESULTADO.size:
+            raise ErroReplay("tamanho do replay inválido")
+        pontuacao, tick = RESULTADO.unpack_from(dados, posicao)
+        return cls(fase, semente, taxa, trechos, pontuacao, None if tick < 0 else tick)
+
+    def salvar(self, caminho):
+        """Grava o replay em arquivo"""
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(self.serializar())
+
+    @classmethod
+    def carregar(cls, caminho):
+        """Lê um replay de arquivo"""
+        with open(caminho, 'rb') as arquivo:
+            return cls.desserializar(arquivo.read())
+
+
+class GravadorEntrada:
+    """Registra a entrada de cada passo da Partida em trechos de máscara repetida"""
+
+    def __init__(self):
+        self.trechos = []
+        self.mascara_atual = None
+        self.quantidade_atual = 0
+
+    def registrar(self, teclas):
+        """Chamado pela Partida uma vez por passo com o estado do teclado"""
+        mascara = mascara_teclas(teclas)
+        if mascara == self.mascara_atual:
+            self.quantidade_atual += 1
+            return
+        self.fechar_trecho()
+        self.mascara_atual = mascara
+        self.quantidade_atual = 1
+
+    def fechar_trecho(self):
+        """Guarda o trecho em andamento"""
+        if self.quantidade_atual:
+            self.trechos.append((self.mascara_atual, self.quantidade_atual))
+        self.mascara_atual = None
+        self.quantidade_atual = 0
+
+    def replay(self, partida):
+        """Monta o replay da partida gravada (com o resultado atual dela)"""
+        self.fechar_trecho()
+        return Replay(partida.fase, partida.semente, partida.taxa_simulacao,
+                      list(self.trechos), partida.pontuacao, partida.tick_colisao)
+
+
+class EntradaReplay:
+    """Entrada para o ExecutorHeadless que devolve as teclas gravadas em cada passo"""
+
+    def __init__(self, replay):
+        self.trechos = replay.trechos
+        self.indice = 0
+        self.fim_trecho = self.trechos[0][1] if self.trechos else 0
+        self._estados = {}
+
+    def teclas(self, passo):
+        """Estado do teclado no passo informado (chamado com passos crescentes)"""
+        while self.indice < len(self.trechos) and passo >= self.fim_trecho:
+            self.indice += 1
+            if self.indice < len(self.trechos):
+                self.fim_trecho += self.trechos[self.indice][1]
+        if self.indice >= len(self.trechos):
+            return SEM_TECLAS
+
+        mascara = self.trechos[self.indice][0]
+        estado = self._estados.get(mascara)
+        if estado is None:
+            estado = self._estados[mascara] = teclas_mascara(mascara)
+        return estado
+
+
+def reproduzir(replay, motor_obstaculos='lista', desenhar=False):
+    """Reproduz o replay passo a passo; retorna o executor ao final"""
+    executor = ExecutorHeadless(replay.fase, EntradaReplay(replay), desenhar,
+                                motor_obstaculos=motor_obstaculos,
+                                taxa_simulacao=replay.taxa_simulacao,
+                                semente=replay.semente)
+    executor.executar(replay.passos)
+    return executor
+
+
+def verificar_replay(replay, motor_obstaculos='lista'):
+    """Reproduz o replay e confere pontuação e passo da colisão
+
+    Retorna (ok, pontuação obtida, passo da colisão obtido).
+    """
+    partida = reproduzir(replay, motor_obstaculos).partida
+    ok = (partida.pontuacao == replay.pontuacao and
+          partida.tick_colisao == replay.tick_colisao)
+    return ok, partida.pontuacao, partida.tick_colisao
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gravação e reprodução de partidas")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+
+    gravar = subcomandos.add_parser('gravar', help="grava uma partida headless roteirizada")
+    gravar.add_argument('arquivo')
+    gravar.add_argument('--fase', type=int, default=1, choices=NUMEROS_FASES)
+    gravar.add_argument('--semente', type=int, default=0)
+    gravar.add_argument('--ticks', type=int, default=None)
+    gravar.add_argument('--roteiro', default='')
+    gravar.add_argument('--taxa-simulacao', type=int, default=60)
+
+    verificar = subcomandos.add_parser('verificar', help="reproduz e confere um replay")
+    verificar.add_argument('arquivo')
+    verificar.add_argument('--motor-numpy', action='store_true')
+    args = parser.parse_args()
+
+    if args.comando == 'gravar':
+        gravador = GravadorEntrada()
+        executor = ExecutorHeadless(args.fase, EntradaRoteirizada.de_texto(args.roteiro),
+                                    taxa_simulacao=args.taxa_simulacao,
+                                    semente=args.semente, gravador=gravador)
+        executor.executar(args.ticks)
+        replay = gravador.replay(executor.partida)
+        replay.salvar(args.arquivo)
+        print(f"passos: {replay.passos} ({len(replay.trechos)} trechos, "
+              f"{len(replay.serializar())} bytes)")
+        print(f"pontuacao: {replay.pontuacao}, colisao no passo: {replay.tick_colisao}")
+    else:
+        replay = Replay.carregar(args.arquivo)
+        ok, pontuacao, tick = verificar_replay(
+            replay, 'numpy' if args.motor_numpy else 'lista')
+        print(f"gravado:    pontuacao {replay.pontuacao}, colisao no passo {replay.tick_colisao}")
+        print(f"reproduzido: pontuacao {pontuacao}, colisao no passo {tick}")
+        print("OK" if ok else "DIVERGENTE")
+        raise SystemExit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
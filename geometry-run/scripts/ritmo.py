@@ -0,0 +1,155 @@
+"""Ritmo dos quadros: a espera entre um quadro e o próximo e a regularidade dela
+
+Estratégias de espera:
+    tick     pygame.time.Clock.tick (dorme; barato, mas a granularidade do
+             sono do sistema deixa o intervalo irregular)
+    ocupado  pygame.time.Clock.tick_busy_loop (gira a CPU até o instante exato)
+    hibrido  dorme até faltar o limiar para o prazo e gira o resto
+
+Com fps 0 não há espera (quadros sem limite). Em todas as estratégias o
+intervalo entre quadros é registrado para calcular o desvio padrão, os prazos
+perdidos e o uso de CPU.
+"""
+import math
+import time
+from collections import deque
+import pygame
+
+ESTRATEGIAS = ('tick', 'ocupado', 'hibrido')
+
+# Tempo (s) antes do prazo em que a estratégia híbrida para de dormir e gira
+LIMIAR_PADRAO = 0.002
+
+# Atraso (s) além do período a partir do qual o quadro conta como prazo perdido
+TOLERANCIA_ATRASO = 0.001
+
+# Maior sono (s) entre duas consultas quando a espera precisa consultar algo
+INTERVALO_CONSULTA = 0.001
+
+
+class RitmoQuadros:
+    """Espera entre quadros com a estratégia escolhida e estatísticas dos intervalos"""
+
+    def __init__(self, fps=60, estrategia='tick', limiar=LIMIAR_PADRAO, capacidade=600):
+        if estrategia not in ESTRATEGIAS:
+            raise ValueError(f"estratégia de ritmo desconhecida: {estrategia}")
+        self.estrategia = estrategia
+        self.limiar = limiar
+        self.relogio = pygame.time.Clock()
+        self.definir_fps(fps)
+
+        # Intervalos (s) entre os últimos quadros e contadores desde o último reinício
+        self.intervalos = deque(maxlen=capacidade)
+        self.reiniciar_estatisticas()
+
+    def definir_fps(self, fps):
+        """Troca a taxa alvo (0 = sem limite)"""
+        self.fps = fps
+        self.periodo = 1.0 / fps if fps else 0.0
+
+    def reiniciar_estatisticas(self):
+        """Zera os intervalos, os contadores e a medição de CPU"""
+        self.intervalos.clear()
+        self.quadros = 0
+        self.atrasos = 0
+        self.ultimo = None  # Fim da espera anterior
+        self.prazo = None  # Fim da espera anterior na cadência fixa
+        self.inicio_parede = time.perf_counter()
+        self.inicio_cpu = time.process_time()
+
+    def esperar(self, consultar=None):
+        """Espera o fim do quadro atual e registra o intervalo
+
+        consultar: função chamada a cada milissegundo, no máximo, enquanto a
+        espera durar (as estratégias do Clock passam a ser emuladas).
+        """
+        if consultar is None and self.estrategia == 'tick':
+            self.relogio.tick(self.fps)
+        elif consultar is None and self.estrategia == 'ocupado':
+            self.relogio.tick_busy_loop(self.fps)
+        elif self.fps:
+            # Prazos em cadência fixa (sem acumular o atraso de cada espera);
+            # depois de um quadro atrasado a cadência recomeça a partir de agora
+            agora = time.perf_counter()
+            if self.prazo is None:
+                self.prazo = agora
+            else:
+                self.prazo = max(self.prazo + self.periodo, agora)
+            self.esperar_ate(self.prazo, consultar)
+        return self.registrar()
+
+    def esperar_ate(self, instante, consultar=None):
+        """Espera até o instante (perf_counter) com a estratégia escolhida"""
+        relogio = time.perf_counter
+        if self.estrategia == 'ocupado':
+            inicio_giro = instante
+        elif self.estrategia == 'hibrido':
+            inicio_giro = instante - self.limiar
+        else:
+            inicio_giro = None  # tick: só dorme
+
+        # Dormir (em fatias curtas quando é preciso consultar)
+        fim_sono = instante if inicio_giro is None else inicio_giro
+        restante = fim_sono - relogio()
+        while restante > 0:
+            if consultar is None:
+                time.sleep(restante)
+            else:
+                time.sleep(min(INTERVALO_CONSULTA, restante))
+                consultar()
+            restante = fim_sono - relogio()
+
+        # Girar até o instante exato
+        if inicio_giro is not None:
+            proxima_consulta = relogio() + INTERVALO_CONSULTA
+            agora = relogio()
+            while agora < instante:
+                if consultar is not None and agora >= proxima_consulta:
+                    consultar()
+                    proxima_consulta = agora + INTERVALO_CONSULTA
+                agora = relogio()
+
+    def registrar(self, instante=None):
+        """Registra o fim de um quadro; retorna o intervalo desde o anterior (s)"""
+        if instante is None:
+            instante = time.perf_counter()
+        intervalo = 0.0
+        if self.ultimo is not None:
+            intervalo = instante - self.ultimo
+            self.intervalos.append(intervalo)
+            if self.fps and intervalo > self.periodo + TOLERANCIA_ATRASO:
+                self.atrasos += 1
+        self.ultimo = instante
+        self.quadros += 1
+        return intervalo
+
+    def estatisticas(self):
+        """Intervalo médio, desvio padrão e pior (ms), prazos perdidos e uso de CPU"""
+        intervalos = self.intervalos
+        quantidade = len(intervalos)
+        media = sum(intervalos) / quantidade if quantidade else 0.0
+        variancia = (sum((intervalo - media) ** 2 for intervalo in intervalos) / quantidade
+                     if quantidade else 0.0)
+        parede = time.perf_counter() - self.inicio_parede
+        return {
+            'estrategia': self.estrategia,
+            'fps_alvo': self.fps,
+            'quadros': self.quadros,
+            'intervalo_medio_ms': 1000 * media,
+            'desvio_ms': 1000 * math.sqrt(variancia),
+            'pior_ms': 1000 * max(intervalos, default=0.0),
+            'prazos_perdidos': self.atrasos,
+            'percentual_perdidos': 100.0 * self.atrasos / max(1, self.quadros - 1),
+            'cpu_percentual': 100.0 * (time.process_time() - self.inicio_cpu) / parede
+                              if parede > 0 else 0.0
+        }
+
+    def imprimir(self):
+        """Mostra as estatísticas do ritmo"""
+        dados = self.estatisticas()
+        alvo = f"{dados['fps_alvo']} FPS" if dados['fps_alvo'] else "sem limite"
+        print(f"Ritmo ({dados['estrategia']}, {alvo}, {dados['quadros']} quadros): "
+              f"intervalo {dados['intervalo_medio_ms']:.2f} ms, "
+              f"desvio {dados['desvio_ms']:.2f} ms, pior {dados['pior_ms']:.2f} ms, "
+              f"{dados['prazos_perdidos']} prazos perdidos "
+              f"({dados['percentual_perdidos']:.1f}%), CPU {dados['cpu_percentual']:.0f}%")
@@ -0,0 +1,55 @@
+"""Configuração dos testes: vídeo fora da tela e a pasta do jogo no caminho"""
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import pytest
+from scripts.inicializacao import inicializar_pygame
+from scripts.perfilador import perfilador
+
+
+@pytest.fixture
+def tela():
+    """Tela do jogo (800x600) no driver de vídeo dummy"""
+    inicializar_pygame()
+    return pygame.display.set_mode((800, 600))
+
+
+@pytest.fixture
+def partida(tela):
+    """Fábrica de Partida na tela de teste, sem a thread do fluxo (fechadas no fim)"""
+    from scripts.cenas import Partida
+    from scripts.fases import CORES_FASES
+    criadas = []
+
+    def criar(fase=1, **opcoes):
+        opcoes.setdefault('semente', 0)
+        opcoes.setdefault('fluxo_em_segundo_plano', False)
+        partida = Partida(tela, 800, 600, CORES_FASES, fase, **opcoes)
+        criadas.append(partida)
+        return partida
+
+    yield criar
+    for partida in criadas:
+        partida.fechar()
+
+
+@pytest.fixture
+def jogo(tmp_path):
+    """Fábrica de GeometryRun com dados em pasta temporária (fechados no fim)"""
+    from main import GeometryRun
+    criados = []
+
+    def criar(**opcoes):
+        opcoes.setdefault('pasta_dados', str(tmp_path))
+        jogo = GeometryRun(**opcoes)
+        criados.append(jogo)
+        return jogo
+
+    yield criar
+    for jogo in criados:
+        jogo.pontuacoes.fechar()
+    perfilador.ativar(False)
@@ -0,0 +1,65 @@
+import pygame
+import pytest
+from scripts.cenas import Partida
+from scripts.entrada import EstadoEntrada
+from scripts.fases import CORES_FASES
+from scripts.replay import teclas_mascara
+
+np = pytest.importorskip('numpy')
+from scripts.ambiente_lote import AmbienteLote, acoes_vao
+
+MAX_PASSOS = 3000  # Em quadros de referência (60 FPS)
+
+# Ações sorteadas de vez em quando no lugar da política do vão
+ACOES_ALEATORIAS = (0, 1, 2, 16, 17, 18, 4, 8, 5)
+
+
+class SorteiosLote:
+    """Gerador no lugar do random.Random do fluxo: os sorteios da semente no lote"""
+
+    def __init__(self, semente):
+        self.ambiente = AmbienteLote(1, sementes=[semente])
+        self.linha = np.array([0])
+
+    def randint(self, minimo, maximo):
+        return int(self.ambiente.sortear(self.linha, minimo, maximo)[0])
+
+
+def partida_equivalente(fase, semente, taxa, motor):
+    """Partida cujos obstáculos saem dos mesmos sorteios da linha do lote"""
+    partida = Partida(pygame.Surface((800, 600)), 800, 600, CORES_FASES, fase, motor, taxa,
+                      semente=0, efeitos=False, fluxo_em_segundo_plano=False)
+    partida.fluxo_obstaculos.rng = SorteiosLote(semente)
+    return partida
+
+
+@pytest.mark.parametrize('fase, taxa', ((1, 60), (2, 60), (3, 60), (3, 120)))
+def test_lote_avanca_como_a_partida(fase, taxa):
+    sementes = [5, 6, 7, 8]
+    ambiente = AmbienteLote(len(sementes), fase, sementes, taxa_simulacao=taxa,
+                            reinicio_automatico=False)
+    partidas = [partida_equivalente(fase, semente, taxa, 'numpy' if i % 2 else 'lista')
+                for i, semente in enumerate(sementes)]
+    aleatorio = np.random.RandomState(fase)
+
+    obs = ambiente.observar()
+    for passo in range(MAX_PASSOS * taxa // 60):
+        acoes = acoes_vao(obs)
+        trocar = aleatorio.rand(len(sementes)) < 0.6
+        acoes[trocar] = aleatorio.choice(ACOES_ALEATORIAS, int(trocar.sum()))
+
+        for i, partida in enumerate(partidas):
+            if not partida.game_over:
+                partida.atualizar(EstadoEntrada.de_teclas(teclas_mascara(int(acoes[i]))))
+        obs, _, _ = ambiente.step(acoes)
+
+        for i, partida in enumerate(partidas):
+            contexto = (passo, i)
+            assert ambiente.feito[i] == partida.game_over, contexto
+            assert ambiente.pontuacao[i] == partida.pontuacao, contexto
+            if not partida.game_over:
+                assert ambiente.px[i] == pytest.approx(partida.jogador.posicao[0]), contexto
+                assert ambiente.py[i] == pytest.approx(partida.jogador.posicao[1]), contexto
+        if all(partida.game_over for partida in partidas):
+            break
+    assert any(partida.game_over for partida in partidas)
@@ -0,0 +1,54 @@
+import pytest
+from scripts import cenas
+from scripts.cenas import GameOver, GerenciadorCenas
+from scripts.entrada import ENTRADA_VAZIA
+from scripts.fases import CORES_FASES
+
+
+def test_game_over_so_refaz_o_texto_de_espera_quando_ele_muda(tela, monkeypatch):
+    game_over = GameOver(tela, 800, 600, CORES_FASES[0], {'pontuacao': 3, 'fase': 1})
+    criados = []
+    classe_texto = cenas.Texto
+
+    def texto_contado(*args, **kwargs):
+        texto = classe_texto(*args, **kwargs)
+        criados.append(texto.texto)
+        return texto
+
+    monkeypatch.setattr(cenas, 'Texto', texto_contado)
+    while game_over.timer > 0:
+        game_over.desenhar()
+        game_over.atualizar(ENTRADA_VAZIA)
+    game_over.desenhar()
+
+    assert criados == sorted(set(criados), reverse=True)
+    assert criados[0] == "Aguarde... 0.5s"
+    assert len(criados) <= 6
+
+
+class CenaVazia:
+    def entrar(self, dados=None):
+        pass
+
+
+def test_gerenciador_guarda_so_os_totais_das_latencias(monkeypatch):
+    # Relógio falso: cada transição leva 1, 2 ou 3 ms para entrar e o dobro até o quadro
+    instantes = []
+    for indice in range(300):
+        duracao = (indice % 3 + 1) / 1000
+        instantes += [0.0, duracao, 2 * duracao]
+    relogio = iter(instantes)
+    monkeypatch.setattr(cenas.time, 'perf_counter', lambda: next(relogio))
+
+    gerenciador = GerenciadorCenas({'menu': lambda chave: CenaVazia()})
+    for _ in range(300):
+        gerenciador.entrar('menu')
+        gerenciador.concluir_transicao()
+
+    assert gerenciador.latencias == {'menu': [300, pytest.approx(0.6), 0.003]}
+    menu = gerenciador.estatisticas()['por_cena']['menu']
+    assert menu['transicoes'] == 300
+    assert menu['entrar_media_ms'] == pytest.approx(2.0)
+    assert menu['entrar_maxima_ms'] == pytest.approx(3.0)
+    assert menu['quadro_media_ms'] == pytest.approx(4.0)
+    assert menu['quadro_maxima_ms'] == pytest.approx(6.0)
@@ -0,0 +1,12 @@
+from scripts.fazenda import ERRO_PADRAO, REACAO_PADRAO, jogar_partida
+
+
+def tarefa(semente):
+    return (1, semente, 3000, 'lista', REACAO_PADRAO, ERRO_PADRAO)
+
+
+def test_bot_padrao_repete_pela_semente_e_espalha_os_resultados():
+    resultados = [jogar_partida(tarefa(semente)) for semente in range(6)]
+    assert jogar_partida(tarefa(3)) == resultados[3]
+    assert len({resultado['pontuacao'] for resultado in resultados}) > 1
+    assert any(resultado['causa'] != 'tempo_esgotado' for resultado in resultados)
@@ -0,0 +1,43 @@
+import threading
+from scripts.cenas import GerenciadorCenas, Partida
+from scripts.fases import CORES_FASES, obter_fase
+from scripts.fluxo_obstaculos import FluxoObstaculos
+from scripts.headless import ExecutorHeadless
+
+
+def threads_fluxo():
+    return sum(thread.name == 'fluxo_obstaculos' for thread in threading.enumerate())
+
+
+def test_segundo_plano_e_spawn_entregam_os_mesmos_pares():
+    fase = obter_fase(3)
+    com_thread = FluxoObstaculos(600, tamanho_trecho=8)
+    sem_thread = FluxoObstaculos(600, tamanho_trecho=8, em_segundo_plano=False)
+    try:
+        for fluxo in (com_thread, sem_thread):
+            fluxo.reiniciar(1234, fase)
+        pares = [com_thread.proximo_par() for _ in range(50)]
+        assert pares == [sem_thread.proximo_par() for _ in range(50)]
+        assert pares[37] == com_thread.regenerar_par(37)
+    finally:
+        com_thread.fechar()
+
+
+def test_partidas_headless_nao_deixam_threads():
+    antes = threads_fluxo()
+    for semente in range(20):
+        ExecutorHeadless(fase=2, semente=semente).executar(200)
+    assert threads_fluxo() == antes
+
+
+def test_fechar_encerra_a_thread_da_partida(tela):
+    antes = threads_fluxo()
+    cenas = GerenciadorCenas({
+        'partida': lambda fase: Partida(tela, 800, 600, CORES_FASES, fase, semente=0)
+    })
+    for fase in (1, 2, 3):
+        cenas.entrar('partida', chave=fase)
+    assert threads_fluxo() == antes + 3
+
+    cenas.fechar()
+    assert threads_fluxo() == antes
@@ -0,0 +1,41 @@
+import pygame
+from scripts.hud import HUD, WidgetBarra, WidgetTexto
+from scripts.interfaces import Texto
+
+FUNDO = (40, 120, 200)
+
+
+def test_texto_do_hud_igual_ao_texto_desenhado_direto(tela):
+    # Dois textos sobrepostos: as bordas antialiasadas se misturam como na tela
+    esperado = tela.copy()
+    esperado.fill(FUNDO)
+    Texto(tela, "Pontos: 1234", 20, 20, (255, 255, 255), 36).desenhar(esperado)
+    Texto(tela, "TURBO", 60, 24, (255, 200, 0), 36).desenhar(esperado)
+
+    hud = HUD(800, 600)
+    hud.adicionar(WidgetTexto(lambda: 1234, "Pontos: {}", 20, 20, (255, 255, 255), 36))
+    hud.adicionar(WidgetTexto(lambda: "TURBO", "{}", 60, 24, (255, 200, 0), 36))
+    tela.fill(FUNDO)
+    hud.desenhar(tela)
+
+    assert pygame.image.tobytes(tela, 'RGB') == pygame.image.tobytes(esperado, 'RGB')
+
+
+def test_hud_so_renderiza_widgets_que_mudaram(tela):
+    pontos = [0]
+    hud = HUD(800, 600)
+    texto = hud.adicionar(WidgetTexto(lambda: pontos[0], "{}", 20, 20, (255, 255, 255), 24))
+    hud.adicionar(WidgetBarra(lambda: 0.5, 20, 60, 200, 10))
+    hud.desenhar(tela)
+    assert hud.renderizacoes_quadro == 2
+
+    hud.desenhar(tela)
+    assert hud.renderizacoes_quadro == 0
+    assert hud.retangulos_alterados == []
+
+    rect_anterior = texto.rect
+    pontos[0] = 100
+    hud.desenhar(tela)
+    assert hud.renderizacoes_quadro == 1
+    assert hud.retangulos_alterados == [rect_anterior.union(texto.rect)]
+    assert hud.regioes == [texto.rect, pygame.Rect(20, 60, 200, 10)]
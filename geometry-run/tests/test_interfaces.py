@@ -0,0 +1,39 @@
+import pygame
+from scripts.interfaces import CacheTexto, Texto, cache_texto
+
+
+def test_cache_de_texto_descarta_os_menos_usados(tela):
+    cache = CacheTexto(limite=2)
+    for texto in ("a", "b", "a", "c"):
+        cache.renderizar(texto, None, 24, (255, 255, 255))
+    assert [chave[0] for chave in cache.superficies] == ["a", "c"]
+    estatisticas = cache.estatisticas()
+    assert (estatisticas['acertos'], estatisticas['falhas'], estatisticas['despejos']) == (1, 3, 1)
+    assert estatisticas['fontes'] == 1
+
+    cache.definir_limite(1)
+    assert [chave[0] for chave in cache.superficies] == ["c"]
+    assert cache.estatisticas()['despejos'] == 2
+
+
+def test_textos_iguais_compartilham_fonte_e_superficie(tela):
+    primeiro = Texto(tela, "Recorde: 42", 100, 100, (255, 200, 0), 30)
+    acertos = cache_texto.acertos
+    segundo = Texto(tela, "Recorde: 42", 300, 200, (255, 200, 0), 30, centralizado=True)
+    assert segundo.fonte is primeiro.fonte
+    assert segundo.imagem_texto is primeiro.imagem_texto
+    assert cache_texto.acertos == acertos + 1
+
+    # A superfície do cache é a mesma que a fonte renderizaria direto
+    direta = pygame.font.Font(None, 30).render("Recorde: 42", True, (255, 200, 0))
+    assert (pygame.image.tobytes(primeiro.imagem_texto, 'RGBA') ==
+            pygame.image.tobytes(direta, 'RGBA'))
+
+
+def test_atualizar_texto_reaproveita_o_cache(tela):
+    texto = Texto(tela, "Pontos: 0", 20, 20, (255, 255, 255), 24)
+    texto.atualizar_texto("Pontos: 10")
+    falhas = cache_texto.falhas
+    texto.atualizar_texto("Pontos: 0")
+    texto.atualizar_texto("Pontos: 10")
+    assert cache_texto.falhas == falhas
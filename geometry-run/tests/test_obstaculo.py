@@ -0,0 +1,85 @@
+import random
+import pygame
+import pytest
+from scripts import fases
+from scripts.bench_colisao import preparar
+from scripts.obstaculo import AtlasObstaculos, GerenciadorObstaculos, atlas_obstaculos
+
+
+@pytest.fixture
+def niveis_padrao():
+    """Volta aos níveis de cor padrão no fim do teste"""
+    yield
+    atlas_obstaculos.configurar(niveis_cor=fases.NIVEIS_COR)
+
+
+def chaves_no_atlas(tela, motor):
+    """Corpos diferentes pedidos ao atlas ao desenhar os obstáculos de 20 s da fase 1"""
+    if motor == 'numpy':
+        pytest.importorskip('numpy')
+        from scripts.obstaculo_vetorizado import GerenciadorObstaculosVetorizado as classe
+    else:
+        classe = GerenciadorObstaculos
+    atlas_obstaculos.corpos.clear()
+    atlas_obstaculos.configurar(limite=100000)
+    gerenciador = classe(tela, 800, 600, velocidade_base=4)
+    for _ in range(1200):
+        gerenciador.atualizar(0)
+        gerenciador.desenhar()
+    return set(atlas_obstaculos.corpos)
+
+
+@pytest.mark.parametrize('motor', ('lista', 'numpy'))
+def test_niveis_de_cor_mudam_as_chaves_do_atlas(tela, motor, niveis_padrao):
+    atlas_obstaculos.configurar(niveis_cor=2)
+    poucos = chaves_no_atlas(tela, motor)
+    atlas_obstaculos.configurar(niveis_cor=32)
+    muitos = chaves_no_atlas(tela, motor)
+
+    assert len({cor for cor, _, _, _ in poucos}) <= 3
+    assert len({cor for cor, _, _, _ in muitos}) > 3 * len({cor for cor, _, _, _ in poucos})
+    assert len(muitos) > len(poucos)
+    assert atlas_obstaculos.estatisticas()['niveis_cor'] == 32
+
+
+def test_configurar_niveis_refaz_as_tabelas_de_cor(niveis_padrao):
+    atlas_obstaculos.configurar(niveis_cor=4)
+    assert fases.niveis_cor == 4
+    na_tela = slice(fases.MARGEM_LUT, fases.MARGEM_LUT + fases.LARGURA_REFERENCIA)
+    assert all(len(set(fase.lut_cor[na_tela])) == 4 + 1 for fase in fases.FASES)
+    assert fases.obter_fase(2).lut_cor is fases.FASES[1].lut_cor
+
+
+
+def test_atlas_descarta_os_menos_usados():
+    atlas = AtlasObstaculos(limite=2)
+    for largura in (10, 20, 10, 30):
+        atlas.obter((200, 0, 0), (255, 0, 0), largura, 50)
+    assert [chave[2] for chave in atlas.corpos] == [10, 30]
+    assert atlas.estatisticas()['despejos'] == 1
+    assert atlas.estatisticas()['acertos'] == 1
+
+    # Um acerto devolve a mesma superfície; reduzir o limite descarta o excesso
+    corpo = atlas.obter((200, 0, 0), (255, 0, 0), 30, 50)
+    assert atlas.obter((200, 0, 0), (255, 0, 0), 30, 50) is corpo
+    atlas.configurar(limite=1)
+    assert list(atlas.corpos) == [((200, 0, 0), (255, 0, 0), 30, 50)]
+    assert atlas.estatisticas()['despejos'] == 2
+
+
+def test_consulta_por_bissecao_igual_a_varredura_completa():
+    gerenciador = preparar(200)
+    obstaculos = gerenciador.obstaculos
+    aleatorio = random.Random(1)
+    rects = [pygame.Rect(aleatorio.uniform(-100, 8100), aleatorio.uniform(0, 560), 40, 40)
+             for _ in range(500)]
+    # Bordas encostadas (retângulos que só se tocam não colidem)
+    for obstaculo in obstaculos[::25]:
+        rects.append(pygame.Rect(obstaculo.rect.right, obstaculo.rect.y, 40, 40))
+        rects.append(pygame.Rect(obstaculo.rect.x - 40, obstaculo.rect.y, 40, 40))
+        rects.append(pygame.Rect(obstaculo.rect.right - 1, obstaculo.rect.y, 40, 40))
+
+    for rect in rects:
+        esperados = [obstaculo for obstaculo in obstaculos if rect.colliderect(obstaculo.rect)]
+        assert gerenciador.consultar_colisoes(rect) == esperados
+        assert gerenciador.consultar_colisao(rect) is (esperados[0] if esperados else None)
@@ -0,0 +1,65 @@
+import pygame
+import pytest
+from scripts.cenas import GameOver
+from scripts.entrada import ENTRADA_VAZIA, EstadoEntrada
+from scripts.fases import CORES_FASES
+from scripts.headless import EstadoTeclas
+
+pytest.importorskip('numpy')
+
+from scripts.particulas import EMISSOR_BATIDA, SistemaParticulas  # noqa: E402
+
+TURBO = EstadoEntrada.de_teclas(EstadoTeclas((pygame.K_SPACE,)))
+
+
+@pytest.mark.parametrize('taxa', (30, 60, 120, 90))
+def test_rastro_do_turbo_nao_depende_da_taxa_de_simulacao(partida, taxa):
+    partida = partida(taxa_simulacao=taxa)
+    partida.jogador.ativar_invencibilidade()
+    partida.atualizar(TURBO)  # Rajada de início
+    particulas = partida.particulas
+    emitidas = particulas.n
+    particulas.atualizar = lambda: None  # Contar as emitidas, sem matar nenhuma
+    for _ in range(taxa):  # Um segundo
+        partida.atualizar(TURBO)
+    quantidade = partida.emissores['turbo'].quantidade
+    assert particulas.n - emitidas == 60 * quantidade
+
+
+def test_emitir_com_o_sistema_cheio_descarta_o_excesso(tela):
+    particulas = SistemaParticulas(tela, capacidade=300, semente=0)
+    particulas.emitir(EMISSOR_BATIDA, 400, 300, (255, 0, 0))
+    particulas.emitir(EMISSOR_BATIDA, 400, 300, (255, 0, 0))
+    assert particulas.n == 300
+    assert particulas.descartadas == 100
+    particulas.emitir(EMISSOR_BATIDA, 400, 300, (255, 0, 0), quantidade=5)
+    assert particulas.n == 300
+    assert particulas.estatisticas()['descartadas'] == 105
+
+    particulas.limpar()
+    particulas.emitir(EMISSOR_BATIDA, 400, 300, (255, 0, 0), quantidade=5)
+    assert particulas.n == 5
+
+
+def test_estilhacos_da_batida_seguem_para_o_game_over(tela, partida):
+    partida = partida()
+    partida.fim_de_partida('obstaculo')
+    assert partida.particulas.n == 2 * EMISSOR_BATIDA.quantidade
+
+    # Sombra e textos do game over criados uma vez só
+    partida.desenhar()
+    tela_game_over = partida.tela_game_over
+    partida.desenhar()
+    assert partida.tela_game_over is tela_game_over
+
+    # A transição sai no passo seguinte, sem esperar os estilhaços
+    novo_estado, dados = partida.atualizar(ENTRADA_VAZIA)
+    assert novo_estado == 'game_over'
+    assert dados['particulas'] is partida.particulas
+
+    game_over = GameOver(tela, 800, 600, CORES_FASES[0], dados)
+    posicoes = partida.particulas.x[:partida.particulas.n].copy()
+    game_over.atualizar(ENTRADA_VAZIA)
+    assert (partida.particulas.x[:len(posicoes)] != posicoes).any()
+    game_over.desenhar()
+    assert partida.particulas.rect_desenho is not None
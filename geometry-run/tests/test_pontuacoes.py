@@ -0,0 +1,53 @@
+from scripts.pontuacoes import RegistroPontuacoes
+
+
+def reabrir(caminho, **opcoes):
+    registro = RegistroPontuacoes(str(caminho), **opcoes)
+    registro.fechar()
+    return registro
+
+
+def test_registrar_e_reabrir(tmp_path):
+    caminho = tmp_path / 'pontuacoes.log'
+    registro = RegistroPontuacoes(str(caminho), max_entradas=3)
+    for pontuacao, instante in ((10, 1.0), (30, 2.0), (20, 3.0), (5, 4.0)):
+        registro.registrar(1, pontuacao, instante)
+    assert registro.registrar(2, 7, 5.0) == 7
+    registro.fechar()
+
+    registro = reabrir(caminho)
+    assert registro.melhores(1) == [(30, 2.0), (20, 3.0), (10, 1.0)]
+    assert registro.recorde(2) == 7
+
+
+def test_linha_cortada_no_fim_nao_engole_o_proximo_registro(tmp_path):
+    caminho = tmp_path / 'pontuacoes.log'
+    caminho.write_text('{"fase": 1, "pontuacao": 5, "instante": 1.0}\n{"fase": 1, "pontu')
+
+    registro = RegistroPontuacoes(str(caminho))
+    assert registro.melhores(1) == [(5, 1.0)]
+    registro.registrar(1, 50, 2.0)
+    registro.fechar()
+
+    assert reabrir(caminho).melhores(1) == [(50, 2.0), (5, 1.0)]
+
+
+def test_ultima_linha_completa_sem_quebra(tmp_path):
+    caminho = tmp_path / 'pontuacoes.log'
+    caminho.write_text('{"fase": 1, "pontuacao": 5, "instante": 1.0}')
+
+    registro = RegistroPontuacoes(str(caminho))
+    registro.registrar(1, 50, 2.0)
+    registro.fechar()
+
+    assert reabrir(caminho).melhores(1) == [(50, 2.0), (5, 1.0)]
+
+
+def test_compactacao_mantem_as_melhores(tmp_path):
+    caminho = tmp_path / 'pontuacoes.log'
+    registro = RegistroPontuacoes(str(caminho), max_entradas=2, limite_log=5)
+    for i in range(12):
+        registro.registrar(1, i, float(i))
+        registro.fechar()  # Um lote por registro: força passar do limite
+    assert len(caminho.read_text().splitlines()) <= 5
+    assert reabrir(caminho, max_entradas=2).melhores(1) == [(11, 11.0), (10, 10.0)]
@@ -0,0 +1,43 @@
+import pygame
+from scripts.entrada import ENTRADA_VAZIA, EstadoEntrada, EstadoTeclas
+from scripts.renderizacao import RenderizadorRetangulos
+
+
+def test_retangulos_sujos_com_painel_perfilador(jogo):
+    """O painel (F3) sobre o primeiro quadro da partida e o game over não derruba o loop"""
+    jogo = jogo(retangulos_sujos=True)
+    jogo.alternar_painel_perfilador()
+    jogo.mudar_estado('partida')
+    jogo.iniciar_loop()
+
+    jogo.quadro_classico()  # Primeiro quadro: sem retângulos alterados
+    assert jogo.rodando
+    jogo.quadro_classico()  # Parcial: retângulos da partida mais o painel
+    assert jogo.rodando
+
+    jogo.cena_atual.fim_de_partida('obstaculo')  # Quadros de game over: tela inteira
+    for _ in range(2):
+        jogo.quadro_classico()
+        assert jogo.rodando
+
+
+def test_quadros_parciais_iguais_ao_desenho_completo(tela, partida):
+    """Restaurar o fundo só nos retângulos alterados dá a mesma imagem do quadro inteiro"""
+    partida = partida(semente=3)
+    renderizador = RenderizadorRetangulos(tela, ativo=True)
+    turbo = EstadoEntrada.de_teclas(EstadoTeclas((pygame.K_SPACE, pygame.K_DOWN)))
+    diferentes = 0
+    for quadro in range(300):
+        if quadro % 80 == 0:
+            partida.jogador.ativar_invencibilidade(90)
+        if quadro == 150:
+            partida.pontuacao = 29  # Sobe de nível: muda o HUD e emite partículas
+        partida.atualizar(turbo if quadro % 120 < 60 else ENTRADA_VAZIA)
+        renderizador.desenhar(partida, 0.5)
+        parcial = pygame.image.tobytes(tela, 'RGB')
+
+        partida.desenhar_fundo()
+        partida.desenhar(0.5)
+        diferentes += parcial != pygame.image.tobytes(tela, 'RGB')
+    assert diferentes == 0
+    assert renderizador.quadros_parciais > 250
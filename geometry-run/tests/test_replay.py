@@ -0,0 +1,40 @@
+import pytest
+from scripts.fazenda import BotVao, REACAO_PADRAO
+from scripts.headless import ExecutorHeadless
+from scripts.replay import ErroReplay, GravadorEntrada, Replay, verificar_replay
+
+
+def gravar(fase, semente, motor='lista', taxa_simulacao=60):
+    """Partida jogada pelo bot da fazenda, devolvida como replay serializado"""
+    gravador = GravadorEntrada()
+    executor = ExecutorHeadless(fase, motor_obstaculos=motor, taxa_simulacao=taxa_simulacao,
+                                semente=semente, gravador=gravador)
+    # Mesmo tempo de reação (em quadros de referência) em qualquer taxa
+    executor.entrada = BotVao(executor.partida, reacao=REACAO_PADRAO * taxa_simulacao // 60,
+                              semente=semente)
+    executor.executar(20000)
+    return gravador.replay(executor.partida).serializar()
+
+
+@pytest.mark.parametrize('motor', ('lista', 'numpy'))
+@pytest.mark.parametrize('fase, semente, taxa', ((1, 3, 60), (2, 11, 60), (3, 5, 120)))
+def test_replay_reproduz_a_partida(motor, fase, semente, taxa):
+    if motor == 'numpy':
+        pytest.importorskip('numpy')
+    replay = Replay.desserializar(gravar(fase, semente, motor, taxa))
+    assert replay.tick_colisao is not None
+
+    ok, pontuacao, tick_colisao = verificar_replay(replay, motor)
+    assert ok, (pontuacao, tick_colisao, replay.pontuacao, replay.tick_colisao)
+
+
+def test_replay_alterado_nao_confere():
+    replay = Replay.desserializar(gravar(1, 3))
+    replay.trechos = [(mascara ^ 1, quantidade) for mascara, quantidade in replay.trechos]
+    assert not verificar_replay(replay)[0]
+
+
+def test_replay_truncado():
+    dados = gravar(1, 3)
+    with pytest.raises(ErroReplay):
+        Replay.desserializar(dados[:-3])